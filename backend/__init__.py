@@ -7,15 +7,19 @@ import threading
 
 from flask import Flask
 
-from backend.config import get_config, PROJECT_ROOT
+from backend.config import PROJECT_ROOT
 from backend.extensions import logger
-from backend.database import get_workflow_cache_db, get_dev_stats_db, get_swimlanes_db
-from backend.routes import register_blueprints
+from backend.database import (
+    get_workflow_cache_db, get_dev_stats_db, get_swimlanes_db, get_refresh_lock_db, get_kv_cache_db,
+)
+from backend.routes import OrjsonProvider, register_blueprints
+from backend.routes.workflow_routes import WORKFLOW_CACHE_TTL_MINUTES
 
 
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     register_blueprints(app)
 
     # Seed default swimlane and reconcile any merge_queue rows that predate the feature.
@@ -26,28 +30,31 @@ def create_app():
     except Exception as e:
         logger.error(f"Failed to initialize swimlanes: {e}")
 
+    # Expired shared-cache rows are never read again; drop them at start-up
+    try:
+        get_kv_cache_db().purge_expired()
+    except Exception as e:
+        logger.error(f"Failed to purge expired cache entries: {e}")
+
     return app
 
 
 def startup_refresh_workflow_caches():
     """Background task: refresh any stale workflow caches on startup."""
-    from backend.extensions import workflow_refresh_in_progress, workflow_refresh_lock
+    from backend.extensions import workflow_refresh_in_progress
     from backend.services.workflow_service import fetch_workflow_data
 
-    config = get_config()
-    ttl_minutes = config.get("workflow_cache_ttl_minutes", 60)
     workflow_cache_db = get_workflow_cache_db()
 
     try:
         repos = workflow_cache_db.get_all_repos()
         for repo_key in repos:
-            if workflow_cache_db.is_stale(repo_key, ttl_minutes):
+            if workflow_cache_db.is_stale(repo_key, WORKFLOW_CACHE_TTL_MINUTES):
                 parts = repo_key.split("/", 1)
                 if len(parts) == 2:
                     owner, repo = parts
-                    with workflow_refresh_lock:
-                        if repo_key not in workflow_refresh_in_progress:
-                            workflow_refresh_in_progress.add(repo_key)
+                    if not workflow_refresh_in_progress.acquire(repo_key):
+                        continue
                     try:
                         logger.info(f"Startup: refreshing stale workflow cache for {repo_key}")
                         data = fetch_workflow_data(owner, repo)
@@ -56,18 +63,18 @@ def startup_refresh_workflow_caches():
                     except Exception as e:
                         logger.error(f"Startup: failed to refresh {repo_key}: {e}")
                     finally:
-                        with workflow_refresh_lock:
-                            workflow_refresh_in_progress.discard(repo_key)
+                        workflow_refresh_in_progress.release(repo_key)
     except Exception as e:
         logger.error(f"Startup workflow cache refresh failed: {e}")
 
 
 def startup_refresh_stats_caches():
     """Background task: refresh any stale developer stats caches on startup."""
-    from backend.extensions import stats_refresh_in_progress, stats_refresh_lock
-    from backend.services.stats_service import fetch_and_compute_stats, stats_to_cache_format
+    from backend.extensions import stats_refresh_in_progress, stats_response_cache
+    from backend.services.stats_service import fetch_and_compute_stats
 
     dev_stats_db = get_dev_stats_db()
+    lock_db = get_refresh_lock_db()
 
     try:
         repos = dev_stats_db.get_all_repos()
@@ -76,22 +83,24 @@ def startup_refresh_stats_caches():
                 parts = repo_key.split("/", 1)
                 if len(parts) == 2:
                     owner, repo = parts
-                    with stats_refresh_lock:
-                        if repo_key not in stats_refresh_in_progress:
-                            stats_refresh_in_progress.add(repo_key)
+                    if not stats_refresh_in_progress.acquire(repo_key):
+                        continue
+                    if not lock_db.acquire(f"stats:{repo_key}"):
+                        stats_refresh_in_progress.release(repo_key)
+                        continue
                     try:
                         logger.info(f"Startup: refreshing stale stats cache for {repo_key}")
                         stats_list = fetch_and_compute_stats(owner, repo)
                         if stats_list:
-                            cache_data = stats_to_cache_format(stats_list)
-                            dev_stats_db.save_stats(repo_key, cache_data)
+                            dev_stats_db.save_stats(repo_key, stats_list)
+                            stats_response_cache.pop(repo_key)
                             logger.info(f"Startup: refreshed stats for {repo_key} with {len(stats_list)} developers")
                         else:
                             logger.warning(f"Startup: empty stats for {repo_key}, keeping existing cache")
                     except Exception as e:
                         logger.error(f"Startup: failed to refresh stats for {repo_key}: {e}")
                     finally:
-                        with stats_refresh_lock:
-                            stats_refresh_in_progress.discard(repo_key)
+                        lock_db.release(f"stats:{repo_key}")
+                        stats_refresh_in_progress.release(repo_key)
     except Exception as e:
         logger.error(f"Startup stats cache refresh failed: {e}")
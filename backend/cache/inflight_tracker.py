@@ -0,0 +1,107 @@
+"""Lock-striped set of keys with background work in progress."""
+
+import threading
+from concurrent.futures import Future
+
+
+class InFlightTracker:
+    """Set-if-absent tracker for per-repo background jobs.
+
+    Keys are spread over power-of-two shards via hash(key) & mask, each
+    with its own lock, so refreshes for different repos don't contend on a
+    single mutex. acquire() is the atomic "check and add" the refresh
+    routes need; release() must be called when the job finishes.
+
+    submit() additionally records the job's Future, so a caller that needs
+    the result (e.g. a forced refresh) can attach to the running job via
+    get() instead of repeating the work. Those keys release themselves when
+    the Future completes. claim() is the same single-flight for work the
+    caller runs itself (the @cached miss path).
+    """
+
+    def __init__(self, shards=8):
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        self._mask = shards - 1
+        # key -> Future for submit()ed jobs, None for acquire()d ones
+        self._shards = [(threading.Lock(), {}) for _ in range(shards)]
+
+    def _shard(self, key):
+        return self._shards[hash(key) & self._mask]
+
+    def acquire(self, key):
+        """Mark key in progress. Returns False if it already was."""
+        lock, jobs = self._shard(key)
+        with lock:
+            if key in jobs:
+                return False
+            jobs[key] = None
+            return True
+
+    def claim(self, key):
+        """Register a new Future for key unless one is already in progress.
+
+        Returns (future, owner). The owner resolves the Future and must
+        release() the key; other callers wait on the returned Future, which
+        is None if the key was taken with acquire().
+        """
+        lock, jobs = self._shard(key)
+        with lock:
+            if key in jobs:
+                return jobs[key], False
+            future = jobs[key] = Future()
+            return future, True
+
+    def release(self, key):
+        lock, jobs = self._shard(key)
+        with lock:
+            jobs.pop(key, None)
+
+    def submit(self, key, executor, fn, *args):
+        """Run fn(*args) on executor unless key is already in progress.
+
+        Returns (future, started). When the key is already held, future is
+        the running job's Future, or None if it was taken with acquire().
+        """
+        lock, jobs = self._shard(key)
+        with lock:
+            if key in jobs:
+                return jobs[key], False
+            jobs[key] = None
+
+        try:
+            future = executor.submit(fn, *args)
+        except Exception:
+            self.release(key)
+            raise
+
+        with lock:
+            jobs[key] = future
+        # Registered after the Future is recorded, so the callback (which may
+        # run immediately if the job already finished) always finds it
+        future.add_done_callback(lambda f: self._finish(key, f))
+        return future, True
+
+    def _finish(self, key, future):
+        lock, jobs = self._shard(key)
+        with lock:
+            if jobs.get(key) is future:
+                del jobs[key]
+
+    def get(self, key):
+        """Future of the submit()ed job running for key, else None."""
+        lock, jobs = self._shard(key)
+        with lock:
+            return jobs.get(key)
+
+    def __contains__(self, key):
+        lock, jobs = self._shard(key)
+        with lock:
+            return key in jobs
+
+    def __len__(self):
+        total = 0
+        for lock, jobs in self._shards:
+            with lock:
+                total += len(jobs)
+        return total
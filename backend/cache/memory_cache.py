@@ -1,34 +1,92 @@
-"""In-memory TTL cache decorator backed by cachetools.TTLCache."""
+"""Two-tier TTL cache decorator: a sharded in-memory TTLCache in front of SQLite."""
 
 from functools import wraps
 
-from flask import request
+import orjson
+from flask import g, has_request_context, request
 
-from backend.extensions import cache
+from backend.database import get_kv_cache_db
+from backend.extensions import cache, inflight_requests, logger
+
+
+def _request_qs():
+    """Decoded query string of the current request, decoded once per request."""
+    if not has_request_context():
+        return ''
+    qs = g.get('_cached_qs')
+    if qs is None:
+        qs = g._cached_qs = request.query_string.decode()
+    return qs
 
 
 def cached(ttl_seconds=None):
     """Decorator for caching function results.
 
-    The TTLCache in extensions.py provides bounded eviction (maxsize=256).
-    Per-key TTL is handled by the cache itself; the ttl_seconds arg is
-    accepted for backward-compat but the global TTL governs expiry.
+    The ShardedTTLCache in extensions.py provides bounded O(1) eviction
+    (config "cache_max_entries", default 2048), per-shard locking, and
+    expires entries on access after "cache_ttl_seconds". The ttl_seconds
+    arg is accepted for backward-compat but the global TTL governs expiry.
+
+    Concurrent misses on the same key are coalesced: the first caller
+    computes the result and later callers block on its Future. The
+    in-flight table is lock-striped like the cache, so misses on different
+    keys don't serialize on one lock.
+
+    The owner of a miss checks the kv_cache table before calling func, and
+    stores the orjson-encoded result there too, so app workers running in
+    separate processes share results instead of each fetching them. Values
+    orjson can't encode stay in memory only.
     """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            qs = request.query_string.decode() if request else ''
-            cache_key = f"{func.__name__}:{args}:{sorted(kwargs.items())}:{qs}"
+            cache_key = (func.__name__, args, tuple(sorted(kwargs.items())), _request_qs())
 
             try:
                 return cache[cache_key]
             except KeyError:
                 pass
 
-            result = func(*args, **kwargs)
-            cache[cache_key] = result
-            return result
+            future, owner = inflight_requests.claim(cache_key)
+            if not owner:
+                return future.result()
+
+            try:
+                kv_key = repr(cache_key)
+                stored = _kv_get(kv_key)
+                if stored is not None:
+                    result = orjson.loads(stored)
+                else:
+                    result = func(*args, **kwargs)
+                    _kv_set(kv_key, result)
+                cache[cache_key] = result
+                future.set_result(result)
+                return result
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                inflight_requests.release(cache_key)
 
         return wrapper
 
     return decorator
+
+
+def _kv_get(key):
+    try:
+        return get_kv_cache_db().get(key)
+    except Exception as e:
+        logger.warning(f"Shared cache read failed: {e}")
+        return None
+
+
+def _kv_set(key, result):
+    try:
+        value = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return
+    try:
+        get_kv_cache_db().set(key, value, cache.ttl)
+    except Exception as e:
+        logger.warning(f"Shared cache write failed: {e}")
@@ -0,0 +1,67 @@
+"""Lock-striped TTL cache: N independent TTLCache shards, one lock each."""
+
+import threading
+
+from cachetools import TTLCache
+
+
+class ShardedTTLCache:
+    """Dict-like TTL cache split into power-of-two shards.
+
+    Each key maps to one shard via hash(key) & mask, so concurrent request
+    threads only contend when they touch the same shard. maxsize is divided
+    evenly across shards; TTL expiry is handled per shard by TTLCache.
+    """
+
+    def __init__(self, maxsize, ttl, shards=16):
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        self._mask = shards - 1
+        self.ttl = ttl
+        per_shard = max(1, maxsize // shards)
+        self._shards = [(threading.Lock(), TTLCache(maxsize=per_shard, ttl=ttl)) for _ in range(shards)]
+
+    def _shard(self, key):
+        return self._shards[hash(key) & self._mask]
+
+    def __getitem__(self, key):
+        lock, shard = self._shard(key)
+        with lock:
+            return shard[key]
+
+    def __setitem__(self, key, value):
+        lock, shard = self._shard(key)
+        with lock:
+            shard[key] = value
+
+    def __delitem__(self, key):
+        lock, shard = self._shard(key)
+        with lock:
+            del shard[key]
+
+    def __contains__(self, key):
+        lock, shard = self._shard(key)
+        with lock:
+            return key in shard
+
+    def __len__(self):
+        total = 0
+        for lock, shard in self._shards:
+            with lock:
+                total += len(shard)
+        return total
+
+    def get(self, key, default=None):
+        lock, shard = self._shard(key)
+        with lock:
+            return shard.get(key, default)
+
+    def pop(self, key, default=None):
+        lock, shard = self._shard(key)
+        with lock:
+            return shard.pop(key, default)
+
+    def clear(self):
+        for lock, shard in self._shards:
+            with lock:
+                shard.clear()
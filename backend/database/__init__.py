@@ -9,6 +9,9 @@ from backend.database.merge_queue import MergeQueueDB
 from backend.database.swimlanes import SwimlanesDB
 from backend.database.settings import SettingsDB
 from backend.database.dev_stats import DeveloperStatsDB
+from backend.database.refresh_locks import RefreshLockDB
+from backend.database.kv_cache import KVCacheDB
+from backend.database.active_reviews import ActiveReviewsDB
 from backend.database.cache_stores import (
     LifecycleCacheDB,
     WorkflowCacheDB,
@@ -35,6 +38,9 @@ _code_activity_cache_db: Optional[CodeActivityCacheDB] = None
 _repo_stats_cache_db: Optional[RepoStatsCacheDB] = None
 _repo_loc_cache_db: Optional[RepoLOCCacheDB] = None
 _timeline_cache_db: Optional[TimelineCacheDB] = None
+_refresh_lock_db: Optional[RefreshLockDB] = None
+_kv_cache_db: Optional[KVCacheDB] = None
+_active_reviews_db: Optional[ActiveReviewsDB] = None
 
 
 def get_database() -> Database:
@@ -166,14 +172,46 @@ def get_timeline_cache_db() -> TimelineCacheDB:
     return _timeline_cache_db
 
 
+def get_refresh_lock_db() -> RefreshLockDB:
+    global _refresh_lock_db
+    if _refresh_lock_db is None:
+        db = get_database()
+        with _db_lock:
+            if _refresh_lock_db is None:
+                _refresh_lock_db = RefreshLockDB(db)
+    return _refresh_lock_db
+
+
+def get_kv_cache_db() -> KVCacheDB:
+    global _kv_cache_db
+    if _kv_cache_db is None:
+        db = get_database()
+        with _db_lock:
+            if _kv_cache_db is None:
+                _kv_cache_db = KVCacheDB(db)
+    return _kv_cache_db
+
+
+def get_active_reviews_db() -> ActiveReviewsDB:
+    global _active_reviews_db
+    if _active_reviews_db is None:
+        db = get_database()
+        with _db_lock:
+            if _active_reviews_db is None:
+                _active_reviews_db = ActiveReviewsDB(db)
+    return _active_reviews_db
+
+
 __all__ = [
     "Database", "ReviewsDB", "MergeQueueDB", "SwimlanesDB", "SettingsDB",
     "DeveloperStatsDB", "LifecycleCacheDB", "WorkflowCacheDB",
     "ContributorTimeSeriesCacheDB", "CodeActivityCacheDB",
-    "RepoStatsCacheDB", "RepoLOCCacheDB", "TimelineCacheDB",
+    "RepoStatsCacheDB", "RepoLOCCacheDB", "TimelineCacheDB", "RefreshLockDB",
+    "KVCacheDB", "ActiveReviewsDB",
     "get_database", "get_reviews_db", "get_queue_db", "get_swimlanes_db",
     "get_settings_db", "get_dev_stats_db", "get_lifecycle_cache_db",
     "get_workflow_cache_db", "get_contributor_ts_cache_db",
     "get_code_activity_cache_db", "get_repo_stats_cache_db",
-    "get_repo_loc_cache_db", "get_timeline_cache_db",
+    "get_repo_loc_cache_db", "get_timeline_cache_db", "get_refresh_lock_db",
+    "get_kv_cache_db", "get_active_reviews_db",
 ]
@@ -0,0 +1,137 @@
+"""ActiveReviewsDB - review processes started by any worker process."""
+
+import logging
+import os
+from typing import Optional, List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (
+    "key, owner, repo, pr_number, pid, pid_start_time, worker_pid, status, started_at, completed_at, "
+    "pr_url, review_file, is_followup, exit_code, error_output"
+)
+
+
+def pid_alive(pid: Optional[int]) -> bool:
+    """True if a process with this pid exists (signal 0 only checks)."""
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def process_start_time(pid: Optional[int]) -> Optional[int]:
+    """Start time of pid in clock ticks since boot, or None if unavailable.
+
+    Read from field 22 of /proc/<pid>/stat (Linux only). A pid reused by a
+    later process has a different start time, so the pair identifies one
+    process.
+    """
+    if not pid:
+        return None
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+    except OSError:
+        return None
+    try:
+        # The command name (field 2) may contain spaces; fields after it
+        # start at 3, so starttime is the 20th
+        return int(stat[stat.rindex(b")") + 2:].split()[19])
+    except (ValueError, IndexError):
+        return None
+
+
+def is_same_process(pid: Optional[int], start_time: Optional[int]) -> bool:
+    """True only if pid is verifiably still the process that started at start_time."""
+    return start_time is not None and process_start_time(pid) == start_time
+
+
+class ActiveReviewsDB:
+    """Mirror of the in-memory active_reviews dict in the active_reviews table.
+
+    The Popen object (and the output buffers) stay with the worker that
+    started the review, which remains the only one that polls and saves it.
+    The row records the review process's pid (with its start time, so a
+    reused pid is never signalled) and the owning worker's pid, so other
+    workers can list it, refuse a duplicate start, and cancel it. Rows whose owning worker has exited are dropped
+    on read, the same way a restart loses the in-memory dict.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def save(self, key: str, review: Dict[str, Any], pid: Optional[int]):
+        """Record a review this worker has just started."""
+        with self.db.connection() as conn:
+            conn.execute(
+                f"""INSERT OR REPLACE INTO active_reviews ({_COLUMNS})
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?, NULL, NULL)""",
+                (
+                    key, review["owner"], review["repo"], review["pr_number"], pid,
+                    process_start_time(pid), os.getpid(),
+                    review["status"], review.get("started_at"), review.get("pr_url"),
+                    review.get("review_file"), bool(review.get("is_followup")),
+                ),
+            )
+
+    def finish(self, key: str, status: str, completed_at: str,
+               exit_code: Optional[int] = None, error_output: Optional[str] = None):
+        """Publish a finished review's outcome, unless it was cancelled meanwhile."""
+        with self.db.connection() as conn:
+            conn.execute(
+                """UPDATE active_reviews
+                   SET status = ?, completed_at = ?, exit_code = ?, error_output = ?
+                   WHERE key = ? AND status != 'cancelled'""",
+                (status, completed_at, exit_code, error_output, key),
+            )
+
+    def mark_cancelled(self, key: str):
+        with self.db.connection() as conn:
+            conn.execute("UPDATE active_reviews SET status = 'cancelled' WHERE key = ?", (key,))
+
+    def delete(self, key: str):
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM active_reviews WHERE key = ?", (key,))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The row for key, whoever owns it."""
+        with self.db.connection() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM active_reviews WHERE key = ?", (key,)
+            ).fetchone()
+            return dict(row) if row else None
+
+    def get_remote(self, key: str) -> Optional[Dict[str, Any]]:
+        """The row for key if another live worker owns it."""
+        rows = self._live_remote(f"SELECT {_COLUMNS} FROM active_reviews WHERE key = ?", (key,))
+        return rows[0] if rows else None
+
+    def list_remote(self) -> List[Dict[str, Any]]:
+        """Rows owned by other live workers, oldest first."""
+        return self._live_remote(f"SELECT {_COLUMNS} FROM active_reviews ORDER BY started_at", ())
+
+    def _live_remote(self, query: str, params: tuple) -> List[Dict[str, Any]]:
+        # This worker's own rows are skipped: its in-memory dict is the
+        # authority for them (a row it no longer holds is from a previous
+        # process that happened to get the same pid)
+        me = os.getpid()
+        with self.db.connection() as conn:
+            rows = [dict(r) for r in conn.execute(query, params).fetchall()]
+            live, stale = [], []
+            for row in rows:
+                if row["worker_pid"] == me:
+                    continue
+                (live if pid_alive(row["worker_pid"]) else stale).append(row)
+            if stale:
+                logger.info(f"Dropping {len(stale)} active review(s) left by exited workers")
+                conn.executemany(
+                    "DELETE FROM active_reviews WHERE key = ? AND worker_pid = ?",
+                    [(r["key"], r["worker_pid"]) for r in stale],
+                )
+            return live
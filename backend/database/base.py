@@ -2,6 +2,7 @@
 
 import sqlite3
 import logging
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
@@ -10,19 +11,45 @@ from backend.config import DB_PATH
 
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning. synchronous=NORMAL is durable under WAL (only the
+# last commit can be lost on power failure); temp tables/indexes stay in
+# memory; reads go through a 256 MB mmap and a 64 MB page cache.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+)
+
 
 class Database:
     """SQLite database manager for PR Explorer."""
 
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or DB_PATH
+        self._local = threading.local()
         self._init_db()
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection with row factory."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _get_thread_conn(self) -> sqlite3.Connection:
+        """Get this thread's persistent read connection.
+
+        Opened on first use and kept for the life of the thread, so hot
+        read-only queries skip the connect + pragma setup. Callers must not
+        close it or leave a write transaction open on it.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._get_connection()
+            self._local.conn = conn
         return conn
 
     @contextmanager
@@ -43,6 +70,11 @@ class Database:
         with self.connection() as conn:
             cursor = conn.cursor()
 
+            # WAL is persistent in the database file: readers no longer block
+            # the background refresh writers, and commits append to the log
+            # instead of rewriting pages
+            cursor.execute("PRAGMA journal_mode = WAL")
+
             # Create reviews table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS reviews (
@@ -67,15 +99,23 @@ class Database:
                 )
             """)
 
-            # Create indexes for reviews
+            # Create indexes for reviews. The per-PR index carries the
+            # latest-first ordering so chain/latest lookups skip the sort;
+            # it supersedes the older (repo, pr_number) index.
+            cursor.execute("DROP INDEX IF EXISTS idx_reviews_repo_pr")
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_reviews_repo_pr
-                ON reviews(repo, pr_number)
+                CREATE INDEX IF NOT EXISTS idx_reviews_repo_pr_ts
+                ON reviews(repo, pr_number, review_timestamp DESC, id DESC)
             """)
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_reviews_timestamp
                 ON reviews(review_timestamp DESC)
             """)
+            # Covers the per-author score averages on the /stats path
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_reviews_repo_author_score
+                ON reviews(repo, pr_author, score)
+            """)
 
             # Create merge_queue table
             cursor.execute("""
@@ -174,12 +214,54 @@ class Database:
                 )
             """)
 
+            # Cross-process background refresh leases (see RefreshLockDB)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS refresh_locks (
+                    key TEXT PRIMARY KEY,
+                    started_at REAL NOT NULL,
+                    holder_pid INTEGER,
+                    holder_start_time INTEGER
+                )
+            """)
+
+            # Second tier of the @cached response cache, shared by every
+            # worker process (see KVCacheDB)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS kv_cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+
+            # Review processes started by any worker process (see ActiveReviewsDB)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS active_reviews (
+                    key TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    repo TEXT NOT NULL,
+                    pr_number INTEGER NOT NULL,
+                    pid INTEGER,
+                    pid_start_time INTEGER,
+                    worker_pid INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    pr_url TEXT,
+                    review_file TEXT,
+                    is_followup BOOLEAN DEFAULT FALSE,
+                    exit_code INTEGER,
+                    error_output TEXT
+                )
+            """)
+
             # Create pr_lifecycle_cache table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS pr_lifecycle_cache (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     repo TEXT NOT NULL UNIQUE,
                     data TEXT NOT NULL,
+                    precomputed TEXT,
                     updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
@@ -190,10 +272,35 @@ class Database:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     repo TEXT NOT NULL UNIQUE,
                     data TEXT NOT NULL,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    version INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+
+            # Create workflow_runs table: one row per cached run so filters and
+            # aggregates run in SQLite instead of over the deserialized blob
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS workflow_runs (
+                    repo TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    workflow_id INTEGER,
+                    name TEXT,
+                    head_branch TEXT,
+                    event TEXT,
+                    status TEXT,
+                    conclusion TEXT,
+                    duration_seconds INTEGER,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (repo, seq)
                 )
             """)
 
+            for column in ("workflow_id", "head_branch", "event", "conclusion"):
+                cursor.execute(f"""
+                    CREATE INDEX IF NOT EXISTS idx_workflow_runs_{column}
+                    ON workflow_runs(repo, {column})
+                """)
+
             # Create contributor_timeseries_cache table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS contributor_timeseries_cache (
@@ -330,6 +437,47 @@ class Database:
                     except sqlite3.OperationalError:
                         pass
 
+            # Migration: Add version counter to workflow_cache for existing databases
+            cursor.execute("PRAGMA table_info(workflow_cache)")
+            if "version" not in {row[1] for row in cursor.fetchall()}:
+                try:
+                    cursor.execute("ALTER TABLE workflow_cache ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+                    logger.info("Added column version to workflow_cache table")
+                except sqlite3.OperationalError:
+                    pass
+
+            # Migration: Add precomputed metric bundles to pr_lifecycle_cache
+            cursor.execute("PRAGMA table_info(pr_lifecycle_cache)")
+            if "precomputed" not in {row[1] for row in cursor.fetchall()}:
+                try:
+                    cursor.execute("ALTER TABLE pr_lifecycle_cache ADD COLUMN precomputed TEXT")
+                    logger.info("Added column precomputed to pr_lifecycle_cache table")
+                except sqlite3.OperationalError:
+                    pass
+
+            # Migration: Record who holds each refresh lease
+            cursor.execute("PRAGMA table_info(refresh_locks)")
+            lock_columns = {row[1] for row in cursor.fetchall()}
+            for col_name in ("holder_pid", "holder_start_time"):
+                if col_name not in lock_columns:
+                    try:
+                        cursor.execute(f"ALTER TABLE refresh_locks ADD COLUMN {col_name} INTEGER")
+                        logger.info(f"Added column {col_name} to refresh_locks table")
+                    except sqlite3.OperationalError:
+                        pass
+
+            # Migration: Add the review process's start time to active_reviews
+            cursor.execute("PRAGMA table_info(active_reviews)")
+            if "pid_start_time" not in {row[1] for row in cursor.fetchall()}:
+                try:
+                    cursor.execute("ALTER TABLE active_reviews ADD COLUMN pid_start_time INTEGER")
+                    logger.info("Added column pid_start_time to active_reviews table")
+                except sqlite3.OperationalError:
+                    pass
+
+            # Refresh query planner statistics for the indexes above
+            cursor.execute("PRAGMA optimize")
+
             logger.info(f"Database initialized at {self.db_path}")
 
     def is_migration_done(self, name: str) -> bool:
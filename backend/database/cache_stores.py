@@ -3,14 +3,22 @@
 Contains: LifecycleCacheDB, WorkflowCacheDB, ContributorTimeSeriesCacheDB, CodeActivityCacheDB
 """
 
-import json
 import logging
+import threading
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+import orjson
+from cachetools import LRUCache
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Encode a cache payload with orjson, kept as TEXT so json_valid()/json_extract() still apply."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class LifecycleCacheDB:
     """Cache for PR lifecycle/review timing data in SQLite."""
 
@@ -21,26 +29,37 @@ class LifecycleCacheDB:
         with self.db.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT data, updated_at FROM pr_lifecycle_cache WHERE repo = ?",
+                "SELECT data, precomputed, updated_at FROM pr_lifecycle_cache WHERE repo = ?",
                 (repo,)
             )
             row = cursor.fetchone()
             if row:
                 return {
-                    "data": json.loads(row["data"]),
+                    "data": orjson.loads(row["data"]),
+                    "precomputed": orjson.loads(row["precomputed"]) if row["precomputed"] else None,
                     "updated_at": row["updated_at"]
                 }
             return None
 
-    def save_cache(self, repo: str, data: Any) -> None:
+    def save_cache(self, repo: str, data: Any, precomputed: Optional[Dict[str, Any]] = None) -> None:
         with self.db.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                """INSERT INTO pr_lifecycle_cache (repo, data, updated_at)
-                   VALUES (?, ?, CURRENT_TIMESTAMP)
+                """INSERT INTO pr_lifecycle_cache (repo, data, precomputed, updated_at)
+                   VALUES (?, ?, ?, CURRENT_TIMESTAMP)
                    ON CONFLICT(repo) DO UPDATE SET
-                   data = excluded.data, updated_at = CURRENT_TIMESTAMP""",
-                (repo, json.dumps(data))
+                   data = excluded.data, precomputed = excluded.precomputed,
+                   updated_at = CURRENT_TIMESTAMP""",
+                (repo, _dumps(data), _dumps(precomputed) if precomputed is not None else None)
+            )
+
+    def save_precomputed(self, repo: str, precomputed: Dict[str, Any]) -> None:
+        """Backfill the metric bundles for an existing row without touching updated_at."""
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE pr_lifecycle_cache SET precomputed = ? WHERE repo = ?",
+                (_dumps(precomputed), repo)
             )
 
     def is_stale(self, repo: str, ttl_hours: int = 2) -> bool:
@@ -58,11 +77,82 @@ class LifecycleCacheDB:
             return age_hours > ttl_hours
 
 
+# Equality filters on workflow_runs: request filter key -> column
+_WORKFLOW_RUN_FILTERS = (
+    ("branch", "head_branch"),
+    ("event", "event"),
+    ("conclusion", "conclusion"),
+)
+
+_INSERT_WORKFLOW_RUN = """INSERT INTO workflow_runs
+    (repo, seq, workflow_id, name, head_branch, event, status,
+     conclusion, duration_seconds, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
+def _workflow_run_rows(repo: str, runs: List[Dict[str, Any]]):
+    for seq, run in enumerate(runs):
+        yield (
+            repo, seq, run.get("workflow_id"), run.get("name", "Unknown"),
+            run.get("head_branch"), run.get("event"), run.get("status"),
+            run.get("conclusion"), run.get("duration_seconds"), _dumps(run),
+        )
+
+
+def _workflow_run_where(repo: str, filters: Dict[str, Any]):
+    """Build the WHERE clause for the /workflow-runs filters."""
+    clauses = ["repo = ?"]
+    params: List[Any] = [repo]
+
+    wf_id = filters.get("workflow_id")
+    if wf_id:
+        try:
+            params.append(int(wf_id))
+            clauses.append("workflow_id = ?")
+        except (ValueError, TypeError):
+            pass
+
+    for key, column in _WORKFLOW_RUN_FILTERS:
+        value = filters.get(key)
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+
+    status = filters.get("status")
+    if status and not filters.get("conclusion"):
+        clauses.append("(status = ? OR conclusion = ?)")
+        params.extend((status, status))
+
+    return " AND ".join(clauses), params
+
+
 class WorkflowCacheDB:
-    """Cache for workflow runs data in SQLite."""
+    """Cache for workflow runs data in SQLite.
+
+    The full payload is kept as a JSON blob in workflow_cache; each run is
+    also stored as a row in workflow_runs so query_runs() can filter and
+    aggregate with indexed SQL. query_runs() results are memoized per
+    (repo, cache version, filters), and the decoded runs per (repo, cache
+    version) so a new filter combination only selects matching seqs instead
+    of re-parsing each run's JSON. save_cache() bumps the version, so
+    writes from any process invalidate both.
+    """
 
     def __init__(self, db):
         self.db = db
+        self._query_memo = LRUCache(maxsize=256)
+        self._runs_memo = LRUCache(maxsize=32)
+        self._memo_lock = threading.Lock()
+
+    def _purge_memo(self, repo: Optional[str] = None) -> None:
+        with self._memo_lock:
+            if repo is None:
+                self._query_memo.clear()
+                self._runs_memo.clear()
+                return
+            for memo in (self._query_memo, self._runs_memo):
+                for key in [k for k in memo if k[0] == repo]:
+                    del memo[key]
 
     def get_cached(self, repo: str) -> Optional[Dict[str, Any]]:
         with self.db.connection() as conn:
@@ -75,10 +165,10 @@ class WorkflowCacheDB:
             if row:
                 try:
                     return {
-                        "data": json.loads(row["data"]),
+                        "data": orjson.loads(row["data"]),
                         "updated_at": row["updated_at"]
                     }
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Corrupt workflow cache for {repo}, treating as miss")
                     return None
             return None
@@ -90,9 +180,161 @@ class WorkflowCacheDB:
                 """INSERT INTO workflow_cache (repo, data, updated_at)
                    VALUES (?, ?, CURRENT_TIMESTAMP)
                    ON CONFLICT(repo) DO UPDATE SET
-                   data = excluded.data, updated_at = CURRENT_TIMESTAMP""",
-                (repo, json.dumps(data))
+                   data = excluded.data, updated_at = CURRENT_TIMESTAMP,
+                   version = workflow_cache.version + 1""",
+                (repo, _dumps(data))
+            )
+            cursor.execute("DELETE FROM workflow_runs WHERE repo = ?", (repo,))
+            cursor.executemany(_INSERT_WORKFLOW_RUN, _workflow_run_rows(repo, data.get("runs", [])))
+        self._purge_memo(repo)
+        # Pre-aggregate the unfiltered view (the dashboard's default query)
+        # now, so the first read after a refresh is a memo hit
+        self.query_runs(repo, {})
+
+    def query_runs(self, repo: str, filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Filter cached runs and aggregate their stats in SQLite.
+
+        Returns None when the repo has no cache. Otherwise a dict with keys:
+        runs, workflows, all_time_total, updated_at, success_count,
+        failure_count, total_duration, duration_count, runs_by_workflow.
+        Caches written before workflow_runs existed are backfilled from the
+        blob on first use. Repeated queries for the same cache version and
+        filters return the memoized dict (treat it as read-only).
+        """
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            # Every read below runs in one transaction, so all statements see
+            # the same snapshot even if save_cache() commits meanwhile
+            cursor.execute("BEGIN")
+            cursor.execute("SELECT version FROM workflow_cache WHERE repo = ?", (repo,))
+            row = cursor.fetchone()
+            if not row:
+                return None
+            version = row["version"]
+            memo_key = (repo, version, tuple(sorted((k, v) for k, v in filters.items() if v)))
+            with self._memo_lock:
+                hit = self._query_memo.get(memo_key)
+            if hit is not None:
+                return hit
+
+            meta = self._query_meta(cursor, repo)
+            if meta is not None and meta["valid"] and not meta["has_rows"]:
+                conn.commit()
+                self._backfill_runs(conn, repo)
+                cursor.execute("BEGIN")
+                meta = self._query_meta(cursor, repo)
+            if meta is None:
+                return None
+            if meta["version"] != version:
+                # Another save landed while backfilling; key on the new snapshot
+                version = meta["version"]
+                memo_key = (repo, version, memo_key[2])
+            if not meta["valid"]:
+                logger.warning(f"Corrupt workflow cache for {repo}, treating as miss")
+                return None
+
+            runs_key = (repo, version)
+            with self._memo_lock:
+                all_runs = self._runs_memo.get(runs_key)
+            decoded = all_runs is None
+            if decoded:
+                cursor.execute("SELECT data FROM workflow_runs WHERE repo = ? ORDER BY seq", (repo,))
+                all_runs = [orjson.loads(r["data"]) for r in cursor.fetchall()]
+
+            # seq is the run's index in the saved list, i.e. into all_runs
+            where, params = _workflow_run_where(repo, filters)
+            cursor.execute(
+                f"SELECT seq FROM workflow_runs WHERE {where} ORDER BY seq", params
+            )
+            runs = [all_runs[r["seq"]] for r in cursor.fetchall()]
+
+            cursor.execute(
+                f"""SELECT
+                        COALESCE(SUM(conclusion = 'success'), 0) AS success_count,
+                        COALESCE(SUM(conclusion = 'failure'), 0) AS failure_count,
+                        COALESCE(SUM(CASE WHEN conclusion IN ('success', 'failure')
+                                     THEN duration_seconds END), 0) AS total_duration,
+                        COUNT(CASE WHEN conclusion IN ('success', 'failure')
+                              THEN duration_seconds END) AS duration_count
+                    FROM workflow_runs WHERE {where}""",
+                params
+            )
+            totals = cursor.fetchone()
+
+            cursor.execute(
+                f"""SELECT name, COUNT(*) AS total,
+                           COALESCE(SUM(conclusion = 'failure'), 0) AS failures
+                    FROM workflow_runs WHERE {where}
+                    GROUP BY name ORDER BY MIN(seq)""",
+                params
+            )
+            runs_by_workflow = {
+                row["name"]: {"total": row["total"], "failures": row["failures"]}
+                for row in cursor.fetchall()
+            }
+            conn.commit()
+
+            result = {
+                "runs": runs,
+                "workflows": orjson.loads(meta["workflows"]) if meta["workflows"] else [],
+                "all_time_total": meta["all_time_total"] or 0,
+                "updated_at": meta["updated_at"],
+                "success_count": totals["success_count"],
+                "failure_count": totals["failure_count"],
+                "total_duration": totals["total_duration"],
+                "duration_count": totals["duration_count"],
+                "runs_by_workflow": runs_by_workflow,
+            }
+
+            # Memoize only if the snapshot is still current: a save that
+            # committed meanwhile has already purged this repo's entries,
+            # and storing now would pin the superseded version's results
+            cursor.execute("SELECT version FROM workflow_cache WHERE repo = ?", (repo,))
+            current = cursor.fetchone()
+            if current and current["version"] == version:
+                with self._memo_lock:
+                    if decoded:
+                        self._runs_memo[runs_key] = all_runs
+                    self._query_memo[memo_key] = result
+            return result
+
+    @staticmethod
+    def _query_meta(cursor, repo: str):
+        cursor.execute(
+            """SELECT version, json_valid(data) AS valid,
+                      CASE WHEN json_valid(data) THEN json_extract(data, '$.workflows') END AS workflows,
+                      CASE WHEN json_valid(data) THEN json_extract(data, '$.all_time_total') END AS all_time_total,
+                      EXISTS(SELECT 1 FROM workflow_runs WHERE repo = ?) AS has_rows,
+                      updated_at
+               FROM workflow_cache WHERE repo = ?""",
+            (repo, repo)
+        )
+        return cursor.fetchone()
+
+    @staticmethod
+    def _backfill_runs(conn, repo: str) -> None:
+        """Populate workflow_runs from the blob for caches written before it existed.
+
+        Runs in its own write transaction and re-checks under the write
+        lock, so concurrent first reads backfill once; INSERT OR IGNORE
+        keeps a racing backfill from failing on the (repo, seq) key.
+        """
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute(
+            """SELECT data, json_valid(data) AS valid,
+                      EXISTS(SELECT 1 FROM workflow_runs WHERE repo = ?) AS has_rows
+               FROM workflow_cache WHERE repo = ?""",
+            (repo, repo)
+        )
+        row = cursor.fetchone()
+        if row and row["valid"] and not row["has_rows"]:
+            runs = orjson.loads(row["data"]).get("runs", [])
+            cursor.executemany(
+                _INSERT_WORKFLOW_RUN.replace("INSERT INTO", "INSERT OR IGNORE INTO", 1),
+                _workflow_run_rows(repo, runs),
             )
+        conn.commit()
 
     def is_stale(self, repo: str, ttl_minutes: int = 60) -> bool:
         with self.db.connection() as conn:
@@ -118,6 +360,8 @@ class WorkflowCacheDB:
         with self.db.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM workflow_cache")
+            cursor.execute("DELETE FROM workflow_runs")
+        self._purge_memo()
 
 
 class ContributorTimeSeriesCacheDB:
@@ -137,14 +381,32 @@ class ContributorTimeSeriesCacheDB:
             if row:
                 try:
                     return {
-                        "data": json.loads(row["data"]),
+                        "data": orjson.loads(row["data"]),
                         "updated_at": row["updated_at"]
                     }
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Corrupt contributor TS cache for {repo}, treating as miss")
                     return None
             return None
 
+    def get_cached_json(self, repo: str) -> Optional[Dict[str, Any]]:
+        """Like get_cached(), but return the stored JSON text undecoded.
+
+        Lets the route splice the blob straight into its response instead of
+        decoding and re-encoding it. Corrupt rows are treated as a miss.
+        """
+        with self.db.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT data, updated_at FROM contributor_timeseries_cache
+                   WHERE repo = ? AND json_valid(data)""",
+                (repo,)
+            )
+            row = cursor.fetchone()
+            if row:
+                return {"data_json": row["data"], "updated_at": row["updated_at"]}
+            return None
+
     def save_cache(self, repo: str, data: Any) -> None:
         with self.db.connection() as conn:
             cursor = conn.cursor()
@@ -153,7 +415,7 @@ class ContributorTimeSeriesCacheDB:
                    VALUES (?, ?, CURRENT_TIMESTAMP)
                    ON CONFLICT(repo) DO UPDATE SET
                    data = excluded.data, updated_at = CURRENT_TIMESTAMP""",
-                (repo, json.dumps(data))
+                (repo, _dumps(data))
             )
 
     def is_stale(self, repo: str, ttl_hours: int = 24) -> bool:
@@ -193,10 +455,10 @@ class CodeActivityCacheDB:
             if row:
                 try:
                     return {
-                        "data": json.loads(row["data"]),
+                        "data": orjson.loads(row["data"]),
                         "updated_at": row["updated_at"]
                     }
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Corrupt code activity cache for {repo}, treating as miss")
                     return None
             return None
@@ -209,7 +471,7 @@ class CodeActivityCacheDB:
                    VALUES (?, ?, CURRENT_TIMESTAMP)
                    ON CONFLICT(repo) DO UPDATE SET
                    data = excluded.data, updated_at = CURRENT_TIMESTAMP""",
-                (repo, json.dumps(data))
+                (repo, _dumps(data))
             )
 
     def is_stale(self, repo: str, ttl_hours: int = 24) -> bool:
@@ -249,10 +511,10 @@ class RepoStatsCacheDB:
             if row:
                 try:
                     return {
-                        "data": json.loads(row["data"]),
+                        "data": orjson.loads(row["data"]),
                         "updated_at": row["updated_at"]
                     }
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Corrupt repo stats cache for {repo}, treating as miss")
                     return None
             return None
@@ -265,7 +527,7 @@ class RepoStatsCacheDB:
                    VALUES (?, ?, CURRENT_TIMESTAMP)
                    ON CONFLICT(repo) DO UPDATE SET
                    data = excluded.data, updated_at = CURRENT_TIMESTAMP""",
-                (repo, json.dumps(data))
+                (repo, _dumps(data))
             )
 
     def is_stale(self, repo: str, ttl_hours: int = 4) -> bool:
@@ -300,10 +562,10 @@ class RepoLOCCacheDB:
             if row:
                 try:
                     return {
-                        "data": json.loads(row["data"]),
+                        "data": orjson.loads(row["data"]),
                         "updated_at": row["updated_at"]
                     }
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(f"Corrupt LOC cache for {repo}, treating as miss")
                     return None
             return None
@@ -316,7 +578,7 @@ class RepoLOCCacheDB:
                    VALUES (?, ?, CURRENT_TIMESTAMP)
                    ON CONFLICT(repo) DO UPDATE SET
                    data = excluded.data, updated_at = CURRENT_TIMESTAMP""",
-                (repo, json.dumps(data))
+                (repo, _dumps(data))
             )
 
     def is_stale(self, repo: str, ttl_hours: int = 24) -> bool:
@@ -356,11 +618,11 @@ class TimelineCacheDB:
             if row:
                 try:
                     return {
-                        "data": json.loads(row["data"]),
+                        "data": orjson.loads(row["data"]),
                         "pr_state": row["pr_state"],
                         "updated_at": row["updated_at"],
                     }
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.warning(
                         f"Corrupt timeline cache for {repo}#{pr_number}, treating as miss"
                     )
@@ -377,7 +639,7 @@ class TimelineCacheDB:
                    pr_state = excluded.pr_state,
                    data = excluded.data,
                    updated_at = CURRENT_TIMESTAMP""",
-                (repo, pr_number, pr_state, json.dumps(data))
+                (repo, pr_number, pr_state, _dumps(data))
             )
 
     def is_stale(self, repo: str, pr_number: int, ttl_minutes: Optional[int]) -> bool:
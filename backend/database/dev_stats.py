@@ -37,14 +37,20 @@ class DeveloperStatsDB:
         return age.total_seconds() > (self.CACHE_TTL_HOURS * 3600)
 
     def get_stats(self, repo: str) -> List[Dict[str, Any]]:
-        """Get cached stats for a repository."""
+        """Get cached stats for a repository, in the API response shape.
+
+        The legacy column names are aliased to the keys the frontend uses,
+        so rows can be returned without a Python-side rename pass.
+        """
         with self.db.connection() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT username, total_prs, open_prs, merged_prs, closed_prs,
-                       total_additions, total_deletions, avg_pr_score,
-                       reviewed_pr_count, commits, avatar_url, reviews_given,
-                       approvals, changes_requested, updated_at
+                SELECT username AS login, avatar_url, commits,
+                       total_prs AS prs_authored, open_prs AS prs_open,
+                       merged_prs AS prs_merged, closed_prs AS prs_closed,
+                       total_additions AS lines_added, total_deletions AS lines_deleted,
+                       reviews_given, approvals, changes_requested,
+                       avg_pr_score, reviewed_pr_count
                 FROM developer_stats
                 WHERE repo = ?
                 ORDER BY total_prs DESC
@@ -59,7 +65,7 @@ class DeveloperStatsDB:
             return [row["repo"] for row in cursor.fetchall()]
 
     def save_stats(self, repo: str, stats: List[Dict[str, Any]]) -> None:
-        """Save developer stats for a repository. Skips save if stats list is empty."""
+        """Save developer stats (API-shaped records) for a repository. Skips save if stats list is empty."""
         if not stats:
             logger.warning(f"Skipping save_stats for {repo}: empty stats list")
             return
@@ -69,31 +75,30 @@ class DeveloperStatsDB:
 
             cursor.execute("DELETE FROM developer_stats WHERE repo = ?", (repo,))
 
-            for stat in stats:
-                cursor.execute("""
-                    INSERT INTO developer_stats
-                    (repo, username, total_prs, open_prs, merged_prs, closed_prs,
-                     total_additions, total_deletions, avg_pr_score, reviewed_pr_count,
-                     commits, avatar_url, reviews_given, approvals, changes_requested,
-                     updated_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (
-                    repo,
-                    stat.get("username", ""),
-                    stat.get("total_prs", 0),
-                    stat.get("open_prs", 0),
-                    stat.get("merged_prs", 0),
-                    stat.get("closed_prs", 0),
-                    stat.get("total_additions", 0),
-                    stat.get("total_deletions", 0),
-                    stat.get("avg_pr_score"),
-                    stat.get("reviewed_pr_count", 0),
-                    stat.get("commits", 0),
-                    stat.get("avatar_url"),
-                    stat.get("reviews_given", 0),
-                    stat.get("approvals", 0),
-                    stat.get("changes_requested", 0)
-                ))
+            cursor.executemany("""
+                INSERT INTO developer_stats
+                (repo, username, total_prs, open_prs, merged_prs, closed_prs,
+                 total_additions, total_deletions, avg_pr_score, reviewed_pr_count,
+                 commits, avatar_url, reviews_given, approvals, changes_requested,
+                 updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, [(
+                repo,
+                stat.get("login", ""),
+                stat.get("prs_authored", 0),
+                stat.get("prs_open", 0),
+                stat.get("prs_merged", 0),
+                stat.get("prs_closed", 0),
+                stat.get("lines_added", 0),
+                stat.get("lines_deleted", 0),
+                stat.get("avg_pr_score"),
+                stat.get("reviewed_pr_count", 0),
+                stat.get("commits", 0),
+                stat.get("avatar_url"),
+                stat.get("reviews_given", 0),
+                stat.get("approvals", 0),
+                stat.get("changes_requested", 0),
+            ) for stat in stats])
 
             cursor.execute("""
                 INSERT INTO stats_metadata (repo, last_updated)
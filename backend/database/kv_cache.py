@@ -0,0 +1,43 @@
+"""KVCacheDB - TTL'd key/value rows shared by every worker process."""
+
+import time
+from typing import Optional
+
+
+class KVCacheDB:
+    """Shared second tier for the @cached decorator.
+
+    Each worker process has its own in-memory ShardedTTLCache, so with
+    several app workers every one of them would fetch the same result from
+    GitHub. Values are stored as encoded bytes in the kv_cache table with an
+    absolute expires_at; expired rows are ignored on read and replaced on
+    the next write, and purge_expired() drops them in bulk.
+    """
+
+    def __init__(self, db):
+        self.db = db
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Stored value for key, or None if missing or expired."""
+        # Hit on every in-memory miss, so it reuses the thread's read connection
+        row = self.db._get_thread_conn().execute(
+            "SELECT value FROM kv_cache WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return row["value"] if row else None
+
+    def set(self, key: str, value: bytes, ttl_seconds: float):
+        with self.db.connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO kv_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl_seconds),
+            )
+
+    def purge_expired(self) -> int:
+        """Delete expired rows. Returns how many were removed."""
+        with self.db.connection() as conn:
+            return conn.execute("DELETE FROM kv_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def clear(self):
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM kv_cache")
@@ -206,3 +206,11 @@ class MergeQueueDB:
                 (queue_item_id,)
             )
             return cursor.fetchone()["count"]
+
+    def get_all_notes_counts(self) -> Dict[int, int]:
+        """Get note counts for every queue item that has notes, as {queue_item_id: count}."""
+        with self.db.connection() as conn:
+            cursor = conn.execute(
+                "SELECT queue_item_id, COUNT(*) FROM queue_notes GROUP BY queue_item_id"
+            )
+            return {row[0]: row[1] for row in cursor.fetchall()}
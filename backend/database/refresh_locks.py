@@ -0,0 +1,86 @@
+"""RefreshLockDB - cross-process leases for background cache refreshes."""
+
+import logging
+import os
+import time
+from typing import Optional
+
+from backend.database.active_reviews import is_same_process, pid_alive, process_start_time
+
+logger = logging.getLogger(__name__)
+
+
+def _holder_alive(pid: Optional[int], start_time: Optional[int]) -> bool:
+    """True if the process that took a lease may still be running."""
+    if pid is None:
+        # Leases taken before holders were recorded only expire
+        return True
+    if start_time is None:
+        return pid_alive(pid)
+    return is_same_process(pid, start_time)
+
+
+class RefreshLockDB:
+    """Leases in the refresh_locks table, shared by every worker process.
+
+    The in-memory InFlightTracker only deduplicates refreshes inside one
+    process; with several app workers each would refresh the same repo.
+    A lease is a row keyed by e.g. "stats:owner/repo": acquire() inserts it
+    with the holder's pid and process start time, and release() deletes it.
+    A lease whose holder has exited (a crash or Ctrl-C mid-refresh), or
+    that is older than LEASE_SECONDS, counts as free and can be taken over.
+    """
+
+    LEASE_SECONDS = 600
+
+    def __init__(self, db):
+        self.db = db
+
+    def acquire(self, key: str) -> bool:
+        """Take the lease for key. Returns False if a live holder has it."""
+        now = time.time()
+        pid = os.getpid()
+        holder = (now, pid, process_start_time(pid))
+        with self.db.connection() as conn:
+            cursor = conn.execute(
+                """INSERT OR IGNORE INTO refresh_locks (key, started_at, holder_pid, holder_start_time)
+                   VALUES (?, ?, ?, ?)""",
+                (key, *holder),
+            )
+            if cursor.rowcount:
+                return True
+            row = conn.execute(
+                "SELECT started_at, holder_pid, holder_start_time FROM refresh_locks WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or self._is_live(row, now):
+                return False
+            # Conditional on the row we inspected, so only one taker wins
+            cursor = conn.execute(
+                """UPDATE refresh_locks SET started_at = ?, holder_pid = ?, holder_start_time = ?
+                   WHERE key = ? AND started_at = ?""",
+                (*holder, key, row["started_at"]),
+            )
+            if cursor.rowcount:
+                logger.warning(f"Took over refresh lease {key} from worker {row['holder_pid']}")
+                return True
+            return False
+
+    def release(self, key: str):
+        with self.db.connection() as conn:
+            conn.execute("DELETE FROM refresh_locks WHERE key = ?", (key,))
+
+    def is_held(self, key: str) -> bool:
+        """True if an unexpired lease with a live holder exists for key."""
+        with self.db.connection() as conn:
+            row = conn.execute(
+                "SELECT started_at, holder_pid, holder_start_time FROM refresh_locks WHERE key = ?",
+                (key,),
+            ).fetchone()
+            return row is not None and self._is_live(row, time.time())
+
+    def _is_live(self, row, now: float) -> bool:
+        return (
+            row["started_at"] >= now - self.LEASE_SECONDS
+            and _holder_alive(row["holder_pid"], row["holder_start_time"])
+        )
@@ -3,7 +3,7 @@
 import json
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +15,18 @@ class ReviewsDB:
     Score is extracted from json["score"]["overall"] instead of regex.
     """
 
+    # (repo, pr_number) pairs per bulk query: 2 bound parameters each, well
+    # under SQLite's 999-parameter limit on older builds
+    _BULK_BATCH = 400
+
+    # Columns (in API field names) for review list views; content_json is
+    # left out so listing never reads the stored review bodies
+    _SUMMARY_COLUMNS = """
+        id, pr_number, repo, pr_title, pr_author, pr_url, review_timestamp,
+        status, score, is_followup, parent_review_id, head_commit_sha,
+        inline_comments_posted, pr_state_at_review AS pr_state
+    """
+
     def __init__(self, db):
         self.db = db
 
@@ -169,16 +181,38 @@ class ReviewsDB:
             row = cursor.fetchone()
             return dict(row) if row else None
 
-    def get_reviews_for_pr(self, repo: str, pr_number: int) -> List[Dict[str, Any]]:
-        """Get all reviews for a specific PR (review chain)."""
+    def get_reviews_for_pr(
+        self, repo: str, pr_number: int, summary: bool = False, include_content: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get all reviews for a specific PR (review chain).
+
+        With summary, rows carry only the list-view columns, plus
+        content_json unless include_content is False.
+        """
+        return list(self.iter_reviews_for_pr(repo, pr_number, summary=summary, include_content=include_content))
+
+    def iter_reviews_for_pr(
+        self, repo: str, pr_number: int, summary: bool = False, include_content: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield a PR's review chain one row at a time, newest first.
+
+        Same rows as get_reviews_for_pr; the connection stays open until the
+        generator is exhausted or closed.
+        """
+        if not summary:
+            columns = "*"
+        elif include_content:
+            columns = f"{self._SUMMARY_COLUMNS}, content_json"
+        else:
+            columns = self._SUMMARY_COLUMNS
         with self.db.connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM reviews
+            cursor = conn.execute(f"""
+                SELECT {columns} FROM reviews
                 WHERE repo = ? AND pr_number = ?
                 ORDER BY review_timestamp DESC
             """, (repo, pr_number))
-            return [dict(row) for row in cursor.fetchall()]
+            for row in cursor:
+                yield dict(row)
 
     def get_latest_review_for_pr(self, repo: str, pr_number: int) -> Optional[Dict[str, Any]]:
         """Get the most recent review for a PR."""
@@ -193,6 +227,35 @@ class ReviewsDB:
             row = cursor.fetchone()
             return dict(row) if row else None
 
+    def get_latest_reviews_bulk(self, prs: List[tuple]) -> Dict[tuple, Dict[str, Any]]:
+        """Get the most recent review for each (repo, pr_number) pair.
+
+        Same ordering as get_latest_review_for_pr, resolved for all pairs in
+        one window-function query per batch. Returns {(repo, pr_number): review};
+        PRs with no review are omitted.
+        """
+        pairs = list(dict.fromkeys((repo, int(number)) for repo, number in prs))
+        latest = {}
+        with self.db.connection() as conn:
+            for i in range(0, len(pairs), self._BULK_BATCH):
+                batch = pairs[i:i + self._BULK_BATCH]
+                placeholders = ",".join("(?, ?)" for _ in batch)
+                cursor = conn.execute(f"""
+                    SELECT * FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY repo, pr_number
+                            ORDER BY review_timestamp DESC, id DESC
+                        ) AS rn
+                        FROM reviews
+                        WHERE (repo, pr_number) IN (VALUES {placeholders})
+                    ) WHERE rn = 1
+                """, [value for pair in batch for value in pair])
+                for row in cursor.fetchall():
+                    review = dict(row)
+                    del review["rn"]
+                    latest[(review["repo"], review["pr_number"])] = review
+        return latest
+
     def list_reviews(
         self,
         repo: Optional[str] = None,
@@ -200,9 +263,10 @@ class ReviewsDB:
         pr_number: Optional[int] = None,
         status: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        summary: bool = False
     ) -> List[Dict[str, Any]]:
-        """List reviews with optional filtering."""
+        """List reviews with optional filtering (list-view columns only with summary)."""
         with self.db.connection() as conn:
             cursor = conn.cursor()
 
@@ -224,8 +288,9 @@ class ReviewsDB:
 
             where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
 
+            columns = self._SUMMARY_COLUMNS if summary else "*"
             query = f"""
-                SELECT * FROM reviews
+                SELECT {columns} FROM reviews
                 {where_clause}
                 ORDER BY review_timestamp DESC
                 LIMIT ? OFFSET ?
@@ -280,13 +345,14 @@ class ReviewsDB:
             cursor.execute("SELECT COUNT(*) as total FROM reviews")
             return cursor.fetchone()["total"]
 
-    def search_reviews(self, search_text: str, limit: int = 20) -> List[Dict[str, Any]]:
-        """Search reviews by title or content_json text."""
+    def search_reviews(self, search_text: str, limit: int = 20, summary: bool = False) -> List[Dict[str, Any]]:
+        """Search reviews by title or content_json text (list-view columns only with summary)."""
+        columns = self._SUMMARY_COLUMNS if summary else "*"
         with self.db.connection() as conn:
             cursor = conn.cursor()
             search_pattern = f"%{search_text}%"
-            cursor.execute("""
-                SELECT * FROM reviews
+            cursor.execute(f"""
+                SELECT {columns} FROM reviews
                 WHERE pr_title LIKE ? OR content_json LIKE ?
                 ORDER BY review_timestamp DESC
                 LIMIT ?
@@ -3,10 +3,14 @@
 All global state used across modules lives here to avoid circular imports.
 """
 
+import atexit
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from cachetools import TTLCache
+from backend.cache.inflight_tracker import InFlightTracker
+from backend.cache.sharded_cache import ShardedTTLCache
+from backend.config import get_config
 
 # Configure logging
 logging.basicConfig(
@@ -16,32 +20,73 @@ logging.basicConfig(
 )
 logger = logging.getLogger("gh_pr_explorer")
 
-# Bounded in-memory cache with TTL eviction (max 256 entries, 5-minute default TTL)
-cache = TTLCache(maxsize=256, ttl=300)
+# Bounded in-memory cache with TTL eviction, lock-striped across shards so
+# request threads only contend when their keys land in the same shard.
+_config = get_config()
+cache = ShardedTTLCache(
+    maxsize=_config.get("cache_max_entries", 2048),
+    ttl=_config.get("cache_ttl_seconds", 300),
+    shards=_config.get("cache_shards", 16),
+)
 
-# In-memory tracking of active review processes
-# key: "owner/repo/pr_number", value: {"process": Popen, "status": str, ...}
-active_reviews = {}
-reviews_lock = threading.Lock()
+# Recently read /stats rows (plus last_updated and stale), so burst polls skip
+# re-reading the SQLite stats cache. Review scores and the refreshing flag are
+# not kept here; they are filled in per request. Entries for a repo are
+# dropped whenever its stats are re-saved.
+stats_response_cache = ShardedTTLCache(
+    maxsize=256,
+    ttl=_config.get("stats_response_ttl_seconds", 30),
+    shards=4,
+)
 
-# Background refresh tracking sets + locks for stale-while-revalidate caches
-workflow_refresh_in_progress = set()
-workflow_refresh_lock = threading.Lock()
+# PR head SHAs looked up by the new-commits checks, keyed by
+# (owner, repo, pr_number). Short-lived so a push shows up within seconds;
+# anything that commits against a SHA fetches it fresh instead.
+head_sha_cache = ShardedTTLCache(
+    maxsize=2048,
+    ttl=_config.get("head_sha_ttl_seconds", 30),
+    shards=4,
+)
 
-contributor_ts_refresh_in_progress = set()
-contributor_ts_refresh_lock = threading.Lock()
+# Cache misses currently being computed by @cached, so identical concurrent
+# requests wait on one result instead of each shelling out to gh
+# key: cache key, value: concurrent.futures.Future (see InFlightTracker.claim)
+inflight_requests = InFlightTracker(shards=_config.get("cache_shards", 16))
 
-activity_refresh_in_progress = set()
-activity_refresh_lock = threading.Lock()
+# Process-wide worker pool for fan-out GitHub calls. Reusing it avoids
+# per-request thread start-up, and its long-lived threads keep the pooled
+# HTTP session's keep-alive connections warm.
+gh_executor = ThreadPoolExecutor(
+    max_workers=_config.get("gh_workers", 20),
+    thread_name_prefix="gh",
+)
+atexit.register(gh_executor.shutdown, wait=False, cancel_futures=True)
 
-stats_refresh_in_progress = set()
-stats_refresh_lock = threading.Lock()
+# Shared pool for stale-while-revalidate background refreshes. Bounds how
+# many refreshes fan out to GitHub at once; the *_refresh_in_progress
+# trackers below keep a repo from being queued twice.
+refresh_executor = ThreadPoolExecutor(
+    max_workers=_config.get("refresh_workers", 4),
+    thread_name_prefix="bgrefresh",
+)
+atexit.register(refresh_executor.shutdown, wait=False, cancel_futures=True)
 
-lifecycle_refresh_in_progress = set()
-lifecycle_refresh_lock = threading.Lock()
+# Dedicated pool for saving finished reviews, so a finished review never
+# queues behind long background refreshes on refresh_executor
+review_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reviewfinish")
+atexit.register(review_executor.shutdown, wait=False, cancel_futures=True)
 
-repo_stats_refresh_in_progress = set()
-repo_stats_refresh_lock = threading.Lock()
+# In-memory tracking of active review processes
+# key: "owner/repo/pr_number", value: {"process": Popen, "status": str, ...}
+active_reviews = {}
+reviews_lock = threading.Lock()
 
-loc_in_progress = set()
-loc_lock = threading.Lock()
+# Background refresh trackers for stale-while-revalidate caches
+# (lock-striped sets; acquire() is an atomic check-and-add)
+workflow_refresh_in_progress = InFlightTracker()
+contributor_ts_refresh_in_progress = InFlightTracker()
+activity_refresh_in_progress = InFlightTracker()
+stats_refresh_in_progress = InFlightTracker()
+lifecycle_refresh_in_progress = InFlightTracker()
+repo_stats_refresh_in_progress = InFlightTracker()
+loc_in_progress = InFlightTracker()
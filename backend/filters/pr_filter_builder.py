@@ -1,12 +1,17 @@
-"""PR filter parameter parsing and gh CLI arg construction."""
+"""PR filter parameter parsing and gh CLI arg / search query construction."""
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List
 
 
-@dataclass
+@dataclass(frozen=True)
 class PRFilterParams:
-    """Parsed PR filter parameters from request args."""
+    """Parsed PR filter parameters from request args.
+
+    Frozen (and so hashable) so assembled search queries can be memoized
+    per filter combination.
+    """
     state: str = "open"
     author: Optional[str] = None
     assignee: Optional[str] = None
@@ -49,46 +54,119 @@ class PRFilterParams:
     @classmethod
     def from_request_args(cls, args, default_per_page=30):
         """Parse from Flask request.args."""
-        return cls(
-            state=args.get("state", "open"),
-            author=args.get("author"),
-            assignee=args.get("assignee"),
-            labels=args.get("labels"),
-            base=args.get("base"),
-            head=args.get("head"),
-            draft=args.get("draft"),
-            review=args.get("review"),
-            reviewed_by=args.get("reviewedBy"),
-            review_requested=args.get("reviewRequested"),
-            status=args.get("status"),
-            involves=args.get("involves"),
-            mentions=args.get("mentions"),
-            commenter=args.get("commenter"),
-            linked=args.get("linked"),
-            comments=args.get("comments"),
-            created_after=args.get("createdAfter"),
-            created_before=args.get("createdBefore"),
-            updated_after=args.get("updatedAfter"),
-            updated_before=args.get("updatedBefore"),
-            merged_after=args.get("mergedAfter"),
-            merged_before=args.get("mergedBefore"),
-            closed_after=args.get("closedAfter"),
-            closed_before=args.get("closedBefore"),
-            milestone=args.get("milestone"),
-            no_assignee=args.get("noAssignee"),
-            no_label=args.get("noLabel"),
-            search_in=args.get("searchIn", ""),
-            search=args.get("search", ""),
-            reactions=args.get("reactions"),
-            interactions=args.get("interactions"),
-            team_review_requested=args.get("teamReviewRequested"),
-            exclude_labels=args.get("excludeLabels"),
-            exclude_author=args.get("excludeAuthor"),
-            exclude_milestone=args.get("excludeMilestone"),
-            sort_by=args.get("sortBy"),
-            sort_direction=args.get("sortDirection", "desc"),
-            limit=min(args.get("limit", default_per_page, type=int), 100),
+        get = args.get
+        values = {attr: get(arg) for attr, arg in _REQUEST_ARGS}
+        values.update(
+            state=get("state", "open"),
+            search_in=get("searchIn", ""),
+            search=get("search", ""),
+            sort_direction=get("sortDirection", "desc"),
+            limit=min(get("limit", default_per_page, type=int), 100),
         )
+        return cls(**values)
+
+
+# (PRFilterParams attribute, request arg) for optional string params without a default
+_REQUEST_ARGS = (
+    ("author", "author"),
+    ("assignee", "assignee"),
+    ("labels", "labels"),
+    ("base", "base"),
+    ("head", "head"),
+    ("draft", "draft"),
+    ("review", "review"),
+    ("reviewed_by", "reviewedBy"),
+    ("review_requested", "reviewRequested"),
+    ("status", "status"),
+    ("involves", "involves"),
+    ("mentions", "mentions"),
+    ("commenter", "commenter"),
+    ("linked", "linked"),
+    ("comments", "comments"),
+    ("created_after", "createdAfter"),
+    ("created_before", "createdBefore"),
+    ("updated_after", "updatedAfter"),
+    ("updated_before", "updatedBefore"),
+    ("merged_after", "mergedAfter"),
+    ("merged_before", "mergedBefore"),
+    ("closed_after", "closedAfter"),
+    ("closed_before", "closedBefore"),
+    ("milestone", "milestone"),
+    ("no_assignee", "noAssignee"),
+    ("no_label", "noLabel"),
+    ("reactions", "reactions"),
+    ("interactions", "interactions"),
+    ("team_review_requested", "teamReviewRequested"),
+    ("exclude_labels", "excludeLabels"),
+    ("exclude_author", "excludeAuthor"),
+    ("exclude_milestone", "excludeMilestone"),
+    ("sort_by", "sortBy"),
+)
+
+
+def _split_csv(value):
+    return [v for v in map(str.strip, value.split(",")) if v]
+
+
+def _review_qualifier(value, params):
+    values = _split_csv(value)
+    if len(values) > 1:
+        return f"({' OR '.join(f'review:{r}' for r in values)})"
+    return f"review:{values[0]}" if values else None
+
+
+def _search_text(value, params):
+    if not params.search_in:
+        return value
+    return [f"{value} in:{f}" for f in _split_csv(params.search_in) if f in ("title", "body", "comments")]
+
+
+_SORT_FIELDS = {"created", "updated", "comments", "reactions", "interactions"}
+
+# gh pr list flags: (PRFilterParams attribute, flag). labels repeats the flag per value.
+FLAG_FILTERS = (
+    ("author", "--author"),
+    ("assignee", "--assignee"),
+    ("labels", "--label"),
+    ("base", "--base"),
+    ("head", "--head"),
+)
+
+# Search qualifiers in emission order: (PRFilterParams attribute, builder).
+# A builder is a format template, or a callable (value, params) returning a
+# qualifier string, a list of them, or None to emit nothing. Falsy params are
+# skipped. CI status (params.status) is not here: gh search has no qualifier
+# for check results, so pr_routes.py post-filters it in Python.
+SEARCH_QUALIFIERS = (
+    ("draft", lambda v, p: f"draft:{v}" if v in ("true", "false") else None),
+    ("review", _review_qualifier),
+    ("reviewed_by", "reviewed-by:{}"),
+    ("review_requested", "review-requested:{}"),
+    ("involves", "involves:{}"),
+    ("mentions", "mentions:{}"),
+    ("commenter", "commenter:{}"),
+    ("linked", lambda v, p: {"true": "linked:issue", "false": "-linked:issue"}.get(v)),
+    ("created_after", "created:>={}"),
+    ("created_before", "created:<={}"),
+    ("updated_after", "updated:>={}"),
+    ("updated_before", "updated:<={}"),
+    ("merged_after", "merged:>={}"),
+    ("merged_before", "merged:<={}"),
+    ("closed_after", "closed:>={}"),
+    ("closed_before", "closed:<={}"),
+    ("comments", "comments:{}"),
+    ("milestone", lambda v, p: "no:milestone" if v == "none" else f'milestone:"{v}"'),
+    ("no_assignee", lambda v, p: "no:assignee" if v == "true" else None),
+    ("no_label", lambda v, p: "no:label" if v == "true" else None),
+    ("search", _search_text),
+    ("reactions", "reactions:{}"),
+    ("interactions", "interactions:{}"),
+    ("team_review_requested", "team-review-requested:{}"),
+    ("exclude_labels", lambda v, p: [f'-label:"{lbl}"' for lbl in _split_csv(v)]),
+    ("exclude_author", "-author:{}"),
+    ("exclude_milestone", '-milestone:"{}"'),
+    ("sort_by", lambda v, p: f"sort:{v}-{p.sort_direction}" if v in _SORT_FIELDS else None),
+)
 
 
 class PRFilterBuilder:
@@ -101,24 +179,25 @@ class PRFilterBuilder:
 
     def build(self) -> List[str]:
         """Build the full gh pr list command args."""
+        p = self.params
         args = ["pr", "list", "-R", f"{self.owner}/{self.repo}"]
-        search_parts = []
-
-        self._add_state(args)
-        self._add_basic_filters(args)
-        self._add_draft_qualifier(search_parts)
-        self._add_review_qualifiers(search_parts)
-        self._add_people_qualifiers(search_parts)
-        self._add_date_qualifiers(search_parts)
-        self._add_misc_qualifiers(search_parts)
-        self._add_search_text(search_parts)
-        self._add_advanced_qualifiers(search_parts)
-        self._add_sort(search_parts)
+        args.extend(["--state", p.state if p.state in ("all", "merged", "closed") else "open"])
+
+        for attr, flag in FLAG_FILTERS:
+            value = getattr(p, attr)
+            if not value:
+                continue
+            if attr == "labels":
+                for lbl in _split_csv(value):
+                    args.extend([flag, lbl])
+            else:
+                args.extend([flag, value])
 
+        search_parts = _search_parts(p)
         if search_parts:
             args.extend(["--search", " ".join(search_parts)])
 
-        args.extend(["--limit", str(self.params.limit)])
+        args.extend(["--limit", str(p.limit)])
 
         args.extend([
             "--json",
@@ -131,138 +210,52 @@ class PRFilterBuilder:
 
         return args
 
-    def _add_state(self, args):
-        p = self.params
-        if p.state == "all":
-            args.extend(["--state", "all"])
-        elif p.state == "merged":
-            args.extend(["--state", "merged"])
-        elif p.state == "closed":
-            args.extend(["--state", "closed"])
-        else:
-            args.extend(["--state", "open"])
+    def build_search_query(self) -> str:
+        """Build the equivalent GitHub search query string for the GraphQL search API.
 
-    def _add_basic_filters(self, args):
-        p = self.params
-        if p.author:
-            args.extend(["--author", p.author])
-        if p.assignee:
-            args.extend(["--assignee", p.assignee])
-        if p.labels:
-            for lbl in p.labels.split(","):
-                lbl = lbl.strip()
-                if lbl:
-                    args.extend(["--label", lbl])
-        if p.base:
-            args.extend(["--base", p.base])
-        if p.head:
-            args.extend(["--head", p.head])
-
-    def _add_draft_qualifier(self, search_parts):
-        p = self.params
-        if p.draft == "true":
-            search_parts.append("draft:true")
-        elif p.draft == "false":
-            search_parts.append("draft:false")
+        State and the basic filters that gh pr list takes as flags become
+        qualifiers; ordering defaults to newest-created first like gh pr list.
+        Memoized per (owner, repo, params), as the UI repeats the same few
+        filter combinations.
+        """
+        return _build_search_query(self.owner, self.repo, self.params)
 
-    def _add_review_qualifiers(self, search_parts):
-        p = self.params
-        if p.review:
-            values = [r.strip() for r in p.review.split(",") if r.strip()]
-            if len(values) == 1:
-                search_parts.append(f"review:{values[0]}")
-            elif len(values) > 1:
-                parts = [f"review:{r}" for r in values]
-                search_parts.append(f"({' OR '.join(parts)})")
-        if p.reviewed_by:
-            search_parts.append(f"reviewed-by:{p.reviewed_by}")
-        if p.review_requested:
-            search_parts.append(f"review-requested:{p.review_requested}")
-        # Note: CI status filtering (params.status) is handled via Python post-filter
-        # in pr_routes.py because gh search doesn't support the status: qualifier
-        # for CI check results.
-
-    def _add_people_qualifiers(self, search_parts):
-        p = self.params
-        if p.involves:
-            search_parts.append(f"involves:{p.involves}")
-        if p.mentions:
-            search_parts.append(f"mentions:{p.mentions}")
-        if p.commenter:
-            search_parts.append(f"commenter:{p.commenter}")
-        if p.linked == "true":
-            search_parts.append("linked:issue")
-        elif p.linked == "false":
-            search_parts.append("-linked:issue")
-
-    def _add_date_qualifiers(self, search_parts):
-        p = self.params
-        date_filters = [
-            (p.created_after, "created:>="),
-            (p.created_before, "created:<="),
-            (p.updated_after, "updated:>="),
-            (p.updated_before, "updated:<="),
-            (p.merged_after, "merged:>="),
-            (p.merged_before, "merged:<="),
-            (p.closed_after, "closed:>="),
-            (p.closed_before, "closed:<="),
-        ]
-        for value, prefix in date_filters:
-            if value:
-                search_parts.append(f"{prefix}{value}")
-
-    def _add_misc_qualifiers(self, search_parts):
-        p = self.params
-        if p.comments:
-            search_parts.append(f"comments:{p.comments}")
-        if p.milestone:
-            if p.milestone == "none":
-                search_parts.append("no:milestone")
-            else:
-                search_parts.append(f'milestone:"{p.milestone}"')
-        if p.no_assignee == "true":
-            search_parts.append("no:assignee")
-        if p.no_label == "true":
-            search_parts.append("no:label")
 
-    def _add_search_text(self, search_parts):
-        p = self.params
-        if p.search:
-            if p.search_in:
-                for f in p.search_in.split(","):
-                    f = f.strip()
-                    if f in ["title", "body", "comments"]:
-                        search_parts.append(f"{p.search} in:{f}")
-            else:
-                search_parts.append(p.search)
+@lru_cache(maxsize=256)
+def _build_search_query(owner: str, repo: str, p: PRFilterParams) -> str:
+    parts = [f"repo:{owner}/{repo}", "is:pr"]
+    if p.state in ("merged", "closed"):
+        parts.append(f"is:{p.state}")
+    elif p.state != "all":
+        parts.append("is:open")
 
-    def _add_advanced_qualifiers(self, search_parts):
-        p = self.params
-        if p.reactions:
-            search_parts.append(f"reactions:{p.reactions}")
-        if p.interactions:
-            search_parts.append(f"interactions:{p.interactions}")
-        if p.team_review_requested:
-            search_parts.append(f"team-review-requested:{p.team_review_requested}")
-        if p.exclude_labels:
-            for lbl in p.exclude_labels.split(","):
-                lbl = lbl.strip()
-                if lbl:
-                    search_parts.append(f'-label:"{lbl}"')
-        if p.exclude_author:
-            search_parts.append(f"-author:{p.exclude_author}")
-        if p.exclude_milestone:
-            search_parts.append(f'-milestone:"{p.exclude_milestone}"')
-
-    def _add_sort(self, search_parts):
-        p = self.params
-        if p.sort_by:
-            sort_map = {
-                "created": "created",
-                "updated": "updated",
-                "comments": "comments",
-                "reactions": "reactions",
-                "interactions": "interactions"
-            }
-            if p.sort_by in sort_map:
-                search_parts.append(f"sort:{sort_map[p.sort_by]}-{p.sort_direction}")
+    for attr, flag in FLAG_FILTERS:
+        value = getattr(p, attr)
+        if not value:
+            continue
+        qualifier = flag.lstrip("-")
+        if attr == "labels":
+            parts.extend(f'{qualifier}:"{lbl}"' for lbl in _split_csv(value))
+        else:
+            parts.append(f"{qualifier}:{value}")
+
+    search_parts = _search_parts(p)
+    parts.extend(search_parts)
+    if not any(part.startswith("sort:") for part in search_parts):
+        parts.append("sort:created-desc")
+    return " ".join(parts)
+
+
+def _search_parts(p: PRFilterParams) -> List[str]:
+    """Walk SEARCH_QUALIFIERS once and collect the qualifiers that apply."""
+    search_parts = []
+    for attr, builder in SEARCH_QUALIFIERS:
+        value = getattr(p, attr)
+        if not value:
+            continue
+        part = builder.format(value) if isinstance(builder, str) else builder(value, p)
+        if isinstance(part, list):
+            search_parts.extend(part)
+        elif part:
+            search_parts.append(part)
+    return search_parts
@@ -1,9 +1,37 @@
 """Route blueprints registration."""
 
+import orjson
 from flask import jsonify
+from flask.json.provider import DefaultJSONProvider
 
 from backend.extensions import logger
 
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, so every jsonify() is C-encoded.
+
+    datetimes are emitted as ISO 8601 (orjson's native format) rather than
+    Flask's RFC 822 dates; other types orjson can't encode fall back to
+    DefaultJSONProvider.default. Keys are not sorted and output is always
+    compact, debug mode included (Flask 3 no longer reads JSON_SORT_KEYS or
+    JSONIFY_PRETTYPRINT_REGULAR; sort_keys/compact are ignored here).
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE),
+            mimetype=self.mimetype,
+        )
+
 
 def error_response(message, status_code, log_error=None):
     """Return a sanitized JSON error response, logging the real error internally."""
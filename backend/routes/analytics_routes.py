@@ -1,36 +1,54 @@
 """Analytics routes: stats, lifecycle, responsiveness, code-activity, contributor-timeseries."""
 
-import threading
+import time
 
-from flask import Blueprint, jsonify, request
+import orjson
+from flask import Blueprint, Response, jsonify, request
 
 from backend.config import get_config
 from backend.extensions import (
     logger,
-    activity_refresh_in_progress, activity_refresh_lock,
-    contributor_ts_refresh_in_progress, contributor_ts_refresh_lock,
-    lifecycle_refresh_in_progress, lifecycle_refresh_lock,
-    stats_refresh_in_progress, stats_refresh_lock,
+    refresh_executor,
+    stats_response_cache,
+    activity_refresh_in_progress,
+    contributor_ts_refresh_in_progress,
+    lifecycle_refresh_in_progress,
+    stats_refresh_in_progress,
 )
 from backend.database import (
     get_reviews_db, get_dev_stats_db,
     get_lifecycle_cache_db, get_code_activity_cache_db,
-    get_contributor_ts_cache_db,
+    get_contributor_ts_cache_db, get_refresh_lock_db,
 )
 from backend.services.stats_service import (
     fetch_and_compute_stats, add_avg_pr_scores,
-    stats_to_cache_format, cached_stats_to_api_format,
 )
-from backend.services.lifecycle_service import fetch_pr_review_times, fetch_review_times_from_api
+from backend.services.lifecycle_service import (
+    fetch_lifecycle_bundle, fetch_review_times_from_api, save_lifecycle_cache,
+)
 from backend.services.activity_service import fetch_code_activity_data
 from backend.services.contributor_service import fetch_contributor_timeseries
-from backend.visualizers.lifecycle_visualizer import compute_lifecycle_metrics
-from backend.visualizers.responsiveness_visualizer import compute_responsiveness_metrics
 from backend.visualizers.activity_visualizer import slice_and_summarize
 from backend.routes import error_response
 
 analytics_bp = Blueprint("analytics", __name__)
 
+# How often, and for how long, a forced stats refresh waits on a lease held
+# by another worker before answering with what is already stored
+_LEASE_POLL_SECONDS = 0.5
+_LEASE_WAIT_SECONDS = 5
+
+
+class _StatsRefreshPending(Exception):
+    """Another worker still holds the stats lease after the bounded wait.
+
+    stats holds the rows already stored for the repo (possibly empty).
+    """
+
+    def __init__(self, full_repo, stats):
+        super().__init__(f"Stats refresh for {full_repo} is still running in another worker")
+        self.stats = stats
+
 
 def _normalize_timestamp(ts):
     """Normalize SQLite CURRENT_TIMESTAMP ('YYYY-MM-DD HH:MM:SS') to ISO 8601 with Z suffix."""
@@ -46,23 +64,129 @@ def _normalize_timestamp(ts):
 
 # --- Developer Stats ---
 
-def _background_refresh_stats(owner, repo, full_repo):
-    """Background task to refresh stats for a repository."""
+def _background_refresh_stats(owner, repo, full_repo, lease_key=None):
+    """Fetch and save fresh stats for a repository.
+
+    Returns the fresh stats list, or None if the fetch failed. lease_key is
+    the refresh_locks lease the caller took for this job, released when it
+    finishes.
+    """
     try:
         logger.info(f"Background refresh started for {full_repo}")
         dev_stats_db = get_dev_stats_db()
         stats_list = fetch_and_compute_stats(owner, repo)
         if stats_list:
-            cache_data = stats_to_cache_format(stats_list)
-            dev_stats_db.save_stats(full_repo, cache_data)
+            dev_stats_db.save_stats(full_repo, stats_list)
+            stats_response_cache.pop(full_repo)
             logger.info(f"Background refresh completed for {full_repo}")
         else:
             logger.warning(f"Background refresh got empty stats for {full_repo}, keeping existing cache")
+        return stats_list
     except Exception as e:
         logger.error(f"Background refresh failed for {full_repo}: {e}")
+        return None
     finally:
-        with stats_refresh_lock:
-            stats_refresh_in_progress.discard(full_repo)
+        if lease_key:
+            get_refresh_lock_db().release(lease_key)
+
+
+def _start_stats_refresh(owner, repo, full_repo):
+    """Queue a background stats refresh unless this or another worker process is running one.
+
+    Returns True if a refresh is now queued or running.
+    """
+    if full_repo in stats_refresh_in_progress:
+        return True
+    lock_db = get_refresh_lock_db()
+    lease_key = f"stats:{full_repo}"
+    if not lock_db.acquire(lease_key):
+        # Held by a live worker, unless it was released in the meantime
+        return lock_db.is_held(lease_key)
+    try:
+        _, started = stats_refresh_in_progress.submit(
+            full_repo, refresh_executor, _background_refresh_stats, owner, repo, full_repo, lease_key
+        )
+    except RuntimeError as e:
+        lock_db.release(lease_key)
+        logger.error(f"Could not queue stats refresh for {full_repo}: {e}")
+        return False
+    if not started:
+        lock_db.release(lease_key)
+    return True
+
+
+def _fetch_stats_leased(owner, repo, full_repo, dev_stats_db):
+    """Fetch stats under the stats:<repo> lease, or wait out its current holder.
+
+    When another worker process (or this one's startup refresh) holds the
+    lease, poll for up to _LEASE_WAIT_SECONDS and return what the holder
+    saved instead of repeating its GitHub fan-out. If it is still running
+    after that, raise _StatsRefreshPending rather than hold the request.
+    """
+    lock_db = get_refresh_lock_db()
+    lease_key = f"stats:{full_repo}"
+    if lock_db.acquire(lease_key):
+        return _background_refresh_stats(owner, repo, full_repo, lease_key)
+    deadline = time.monotonic() + _LEASE_WAIT_SECONDS
+    while lock_db.is_held(lease_key):
+        if time.monotonic() >= deadline:
+            raise _StatsRefreshPending(full_repo, dev_stats_db.get_stats(full_repo))
+        time.sleep(_LEASE_POLL_SECONDS)
+    return dev_stats_db.get_stats(full_repo)
+
+
+def _refresh_stats_now(owner, repo, full_repo, dev_stats_db):
+    """Fetch stats before answering, joining a refresh already in flight.
+
+    Concurrent forced or cold /stats requests for a repo share one fetch:
+    the first request thread runs it inline and the others wait on its
+    Future, as does a request arriving while a stale read's background
+    refresh is running. Running inline keeps the request from queueing
+    behind long jobs on refresh_executor.
+    Returns (stats_list, last_updated).
+    """
+    future, is_owner = stats_refresh_in_progress.claim(full_repo)
+    if future is not None and not is_owner:
+        stats_list = future.result()
+    else:
+        # Either this thread owns the fetch, or the startup refresh holds the
+        # key without a Future (and the lease, which is waited out)
+        try:
+            stats_list = _fetch_stats_leased(owner, repo, full_repo, dev_stats_db)
+        except BaseException as e:
+            if is_owner:
+                future.set_exception(e)
+            raise
+        else:
+            if is_owner:
+                future.set_result(stats_list)
+        finally:
+            if is_owner:
+                stats_refresh_in_progress.release(full_repo)
+    if stats_list is None:
+        raise RuntimeError(f"Stats refresh failed for {full_repo}")
+    return stats_list, dev_stats_db.get_last_updated(full_repo)
+
+
+def _cached_stats_response(owner, repo, full_repo, entry, reviews_db):
+    """Build a /stats response from a stats_response_cache entry.
+
+    The entry only holds what changes when stats are re-saved (the rows,
+    last_updated, stale). Review scores and the refreshing flag change
+    independently, so they are filled in on every request.
+    """
+    refreshing = full_repo in stats_refresh_in_progress
+    if entry["stale"] and not refreshing:
+        refreshing = _start_stats_refresh(owner, repo, full_repo)
+    # add_avg_pr_scores fills the rows in place; the cached ones stay unscored
+    stats = [dict(stat) for stat in entry["stats"]]
+    return {
+        "stats": add_avg_pr_scores(stats, full_repo, reviews_db),
+        "last_updated": entry["last_updated"],
+        "cached": True,
+        "stale": entry["stale"],
+        "refreshing": refreshing
+    }
 
 
 @analytics_bp.route("/api/repos/<owner>/<repo>/stats")
@@ -74,63 +198,37 @@ def get_developer_stats(owner, repo):
     dev_stats_db = get_dev_stats_db()
 
     try:
-        is_stale = dev_stats_db.is_stale(full_repo)
-        last_updated = dev_stats_db.get_last_updated(full_repo)
-        cached_stats = dev_stats_db.get_stats(full_repo)
-
-        with stats_refresh_lock:
-            refreshing = full_repo in stats_refresh_in_progress
-
-        if force_refresh:
-            stats_list = fetch_and_compute_stats(owner, repo)
-            if stats_list:
-                cache_data = stats_to_cache_format(stats_list)
-                dev_stats_db.save_stats(full_repo, cache_data)
-                last_updated = dev_stats_db.get_last_updated(full_repo)
-            stats_with_scores = add_avg_pr_scores(stats_list, full_repo, reviews_db)
-            return jsonify({
-                "stats": stats_with_scores,
-                "last_updated": _normalize_timestamp(last_updated.isoformat()) if last_updated else None,
-                "cached": False,
-                "refreshing": False
-            })
-
-        if cached_stats:
-            if is_stale and not refreshing:
-                with stats_refresh_lock:
-                    if full_repo not in stats_refresh_in_progress:
-                        stats_refresh_in_progress.add(full_repo)
-                        thread = threading.Thread(
-                            target=_background_refresh_stats,
-                            args=(owner, repo, full_repo),
-                            daemon=True
-                        )
-                        thread.start()
-                        refreshing = True
-
-            transformed_stats = cached_stats_to_api_format(cached_stats)
-            stats_with_scores = add_avg_pr_scores(transformed_stats, full_repo, reviews_db)
-            return jsonify({
-                "stats": stats_with_scores,
-                "last_updated": _normalize_timestamp(last_updated.isoformat()) if last_updated else None,
-                "cached": True,
-                "stale": is_stale,
-                "refreshing": refreshing
-            })
-
-        # No cached data: fetch synchronously
-        stats_list = fetch_and_compute_stats(owner, repo)
-        if stats_list:
-            cache_data = stats_to_cache_format(stats_list)
-            dev_stats_db.save_stats(full_repo, cache_data)
-            last_updated = dev_stats_db.get_last_updated(full_repo)
+        if not force_refresh:
+            entry = stats_response_cache.get(full_repo)
+            if entry is None:
+                cached_stats = dev_stats_db.get_stats(full_repo)
+                if cached_stats:
+                    last_updated = dev_stats_db.get_last_updated(full_repo)
+                    entry = {
+                        "stats": cached_stats,
+                        "last_updated": _normalize_timestamp(last_updated.isoformat()) if last_updated else None,
+                        "stale": dev_stats_db.is_stale(full_repo),
+                    }
+                    stats_response_cache[full_repo] = entry
+            if entry is not None:
+                return jsonify(_cached_stats_response(owner, repo, full_repo, entry, reviews_db))
+
+        # Forced refresh or no cached data: fetch synchronously
+        try:
+            stats_list, last_updated = _refresh_stats_now(owner, repo, full_repo, dev_stats_db)
+            refreshing = False
+        except _StatsRefreshPending as pending:
+            if not pending.stats:
+                return jsonify({"error": "Stats refresh in progress", "refreshing": True}), 503
+            # Serve the stored rows while the other worker finishes
+            stats_list, last_updated = pending.stats, dev_stats_db.get_last_updated(full_repo)
+            refreshing = True
         stats_with_scores = add_avg_pr_scores(stats_list, full_repo, reviews_db)
-
         return jsonify({
             "stats": stats_with_scores,
             "last_updated": _normalize_timestamp(last_updated.isoformat()) if last_updated else None,
-            "cached": False,
-            "refreshing": False
+            "cached": refreshing,
+            "refreshing": refreshing
         })
 
     except RuntimeError as e:
@@ -146,38 +244,32 @@ def _background_refresh_lifecycle(owner, repo, repo_key):
         lifecycle_cache_db = get_lifecycle_cache_db()
         data = fetch_review_times_from_api(owner, repo)
         if data:
-            lifecycle_cache_db.save_cache(repo_key, data)
+            save_lifecycle_cache(lifecycle_cache_db, repo_key, data)
             logger.info(f"Background lifecycle refresh completed for {repo_key}: {len(data)} PRs")
     except Exception as e:
         logger.error(f"Background lifecycle refresh failed for {repo_key}: {e}")
     finally:
-        with lifecycle_refresh_lock:
-            lifecycle_refresh_in_progress.discard(repo_key)
+        lifecycle_refresh_in_progress.release(repo_key)
 
 
 def _get_lifecycle_data(owner, repo):
-    """Shared helper: return (prs, cache_meta) with stale-while-revalidate."""
+    """Shared helper: return (bundle, cache_meta) with stale-while-revalidate.
+
+    bundle holds the "lifecycle" and "responsiveness" metrics.
+    """
     repo_key = f"{owner}/{repo}"
+
     lifecycle_cache_db = get_lifecycle_cache_db()
     is_stale = lifecycle_cache_db.is_stale(repo_key)
     cached = lifecycle_cache_db.get_cached(repo_key)
     refreshing = False
 
-    prs = fetch_pr_review_times(owner, repo, lifecycle_cache_db)
-
-    if is_stale and prs:
-        with lifecycle_refresh_lock:
-            if repo_key not in lifecycle_refresh_in_progress:
-                lifecycle_refresh_in_progress.add(repo_key)
-                thread = threading.Thread(
-                    target=_background_refresh_lifecycle,
-                    args=(owner, repo, repo_key),
-                    daemon=True
-                )
-                thread.start()
-                refreshing = True
-            else:
-                refreshing = True
+    bundle = fetch_lifecycle_bundle(owner, repo, lifecycle_cache_db, cached=cached)
+
+    if is_stale and cached and cached["data"]:
+        if lifecycle_refresh_in_progress.acquire(repo_key):
+            refresh_executor.submit(_background_refresh_lifecycle, owner, repo, repo_key)
+        refreshing = True
 
     cache_meta = {
         "last_updated": _normalize_timestamp(cached["updated_at"]) if cached else None,
@@ -186,17 +278,15 @@ def _get_lifecycle_data(owner, repo):
         "refreshing": refreshing,
     }
 
-    return prs, cache_meta
+    return bundle, cache_meta
 
 
 @analytics_bp.route("/api/repos/<owner>/<repo>/lifecycle-metrics")
 def get_lifecycle_metrics(owner, repo):
     """Get PR lifecycle metrics."""
     try:
-        prs, cache_meta = _get_lifecycle_data(owner, repo)
-        metrics = compute_lifecycle_metrics(prs)
-        metrics.update(cache_meta)
-        return jsonify(metrics)
+        bundle, cache_meta = _get_lifecycle_data(owner, repo)
+        return jsonify({**bundle["lifecycle"], **cache_meta})
     except Exception as e:
         return error_response("Internal server error", 500, f"Failed to fetch lifecycle metrics: {e}")
 
@@ -205,10 +295,8 @@ def get_lifecycle_metrics(owner, repo):
 def get_review_responsiveness(owner, repo):
     """Get per-reviewer responsiveness metrics and bottleneck detection."""
     try:
-        prs, cache_meta = _get_lifecycle_data(owner, repo)
-        metrics = compute_responsiveness_metrics(prs)
-        metrics.update(cache_meta)
-        return jsonify(metrics)
+        bundle, cache_meta = _get_lifecycle_data(owner, repo)
+        return jsonify({**bundle["responsiveness"], **cache_meta})
     except Exception as e:
         return error_response("Internal server error", 500, f"Failed to fetch review responsiveness: {e}")
 
@@ -227,8 +315,7 @@ def _background_refresh_code_activity(owner, repo, repo_key):
     except Exception as e:
         logger.error(f"Background code activity refresh failed for {repo_key}: {e}")
     finally:
-        with activity_refresh_lock:
-            activity_refresh_in_progress.discard(repo_key)
+        activity_refresh_in_progress.release(repo_key)
 
 
 @analytics_bp.route("/api/repos/<owner>/<repo>/code-activity")
@@ -262,18 +349,9 @@ def get_code_activity(owner, repo):
         if cached:
             refreshing = False
             if is_stale:
-                with activity_refresh_lock:
-                    if repo_key not in activity_refresh_in_progress:
-                        activity_refresh_in_progress.add(repo_key)
-                        thread = threading.Thread(
-                            target=_background_refresh_code_activity,
-                            args=(owner, repo, repo_key),
-                            daemon=True
-                        )
-                        thread.start()
-                        refreshing = True
-                    else:
-                        refreshing = True
+                if activity_refresh_in_progress.acquire(repo_key):
+                    refresh_executor.submit(_background_refresh_code_activity, owner, repo, repo_key)
+                refreshing = True
             result = slice_and_summarize(cached["data"], weeks)
             result["last_updated"] = _normalize_timestamp(cached["updated_at"])
             result["cached"] = True
@@ -313,15 +391,29 @@ def _background_refresh_contributor_ts(owner, repo, repo_key):
     except Exception as e:
         logger.error(f"Background contributor TS refresh failed for {repo_key}: {e}")
     finally:
-        with contributor_ts_refresh_lock:
-            contributor_ts_refresh_in_progress.discard(repo_key)
+        contributor_ts_refresh_in_progress.release(repo_key)
+
+
+def _top_contributors(contributors, top):
+    """Trim to the top N contributors.
+
+    Contributors are stored sorted by total commits (descending), so this
+    is a slice rather than a sort or heap selection.
+    """
+    if top is None or top <= 0:
+        return contributors
+    return contributors[:top]
 
 
 @analytics_bp.route("/api/repos/<owner>/<repo>/contributor-timeseries")
 def get_contributor_timeseries(owner, repo):
-    """Get per-contributor weekly time series data."""
+    """Get per-contributor weekly time series data.
+
+    Optional ?top=N returns only the N contributors with the most commits.
+    """
     repo_key = f"{owner}/{repo}"
     force_refresh = request.args.get("refresh", "").lower() == "true"
+    top = request.args.get("top", type=int)
     contributor_ts_cache_db = get_contributor_ts_cache_db()
 
     try:
@@ -332,38 +424,36 @@ def get_contributor_timeseries(owner, repo):
                 contributor_ts_cache_db.save_cache(repo_key, data)
             fresh_cached = contributor_ts_cache_db.get_cached(repo_key)
             return jsonify({
-                "contributors": data,
+                "contributors": _top_contributors(data, top),
                 "last_updated": _normalize_timestamp(fresh_cached["updated_at"]) if fresh_cached else None,
                 "cached": False,
                 "stale": False,
                 "refreshing": False,
             })
 
-        cached = contributor_ts_cache_db.get_cached(repo_key)
+        # The full list is served as the stored JSON text; only ?top= needs a decode
+        if top is None or top <= 0:
+            cached = contributor_ts_cache_db.get_cached_json(repo_key)
+        else:
+            cached = contributor_ts_cache_db.get_cached(repo_key)
         is_stale = contributor_ts_cache_db.is_stale(repo_key)
 
         if cached:
             refreshing = False
             if is_stale:
-                with contributor_ts_refresh_lock:
-                    if repo_key not in contributor_ts_refresh_in_progress:
-                        contributor_ts_refresh_in_progress.add(repo_key)
-                        thread = threading.Thread(
-                            target=_background_refresh_contributor_ts,
-                            args=(owner, repo, repo_key),
-                            daemon=True
-                        )
-                        thread.start()
-                        refreshing = True
-                    else:
-                        refreshing = True
-            return jsonify({
-                "contributors": cached["data"],
+                if contributor_ts_refresh_in_progress.acquire(repo_key):
+                    refresh_executor.submit(_background_refresh_contributor_ts, owner, repo, repo_key)
+                refreshing = True
+            meta = {
                 "last_updated": _normalize_timestamp(cached["updated_at"]),
                 "cached": True,
                 "stale": is_stale,
                 "refreshing": refreshing,
-            })
+            }
+            if "data_json" in cached:
+                body = b'{"contributors":' + cached["data_json"].encode() + b"," + orjson.dumps(meta)[1:]
+                return Response(body, mimetype="application/json")
+            return jsonify({"contributors": _top_contributors(cached["data"], top), **meta})
 
         # No cache: synchronous fetch
         data = fetch_contributor_timeseries(owner, repo)
@@ -371,7 +461,7 @@ def get_contributor_timeseries(owner, repo):
             contributor_ts_cache_db.save_cache(repo_key, data)
         fresh_cached = contributor_ts_cache_db.get_cached(repo_key)
         return jsonify({
-            "contributors": data,
+            "contributors": _top_contributors(data, top),
             "last_updated": _normalize_timestamp(fresh_cached["updated_at"]) if fresh_cached else None,
             "cached": False,
             "stale": False,
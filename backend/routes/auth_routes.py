@@ -1,23 +1,21 @@
 """Authentication routes: /api/user, /api/orgs."""
 
-import json
-
 from flask import Blueprint, jsonify
 
-from backend.services.github_service import run_gh_command, parse_json_output
+from backend.services.github_http import gh_get, gh_get_all
 
 auth_bp = Blueprint("auth", __name__)
 
+_ACCOUNT_FIELDS = ["login", "name", "avatar_url"]
+# Orgs are listed under their login; the API's org objects have no name
+_ORG_FIELDS = {"login": "login", "name": "login", "avatar_url": "avatar_url"}
+
 
 @auth_bp.route("/api/user")
 def get_user():
     """Get the current authenticated user."""
     try:
-        output = run_gh_command([
-            "api", "user",
-            "--jq", "{login: .login, name: .name, avatar_url: .avatar_url}"
-        ])
-        user = parse_json_output(output) if output else {}
+        user = gh_get("user", project=_ACCOUNT_FIELDS) or {}
         return jsonify({"user": user})
     except RuntimeError as e:
         return jsonify({"error": str(e)}), 500
@@ -27,20 +25,14 @@ def get_user():
 def get_orgs():
     """List organizations the user belongs to, plus their personal account."""
     try:
-        user_output = run_gh_command([
-            "api", "user",
-            "--jq", '{login: .login, name: .name, avatar_url: .avatar_url, type: "user"}'
-        ])
-        user = json.loads(user_output) if user_output else None
-
-        orgs_output = run_gh_command([
-            "api", "user/orgs",
-            "--jq", '[.[] | {login: .login, name: .login, avatar_url: .avatar_url, type: "org"}]'
-        ])
-        orgs = parse_json_output(orgs_output)
+        user = gh_get("user", project=_ACCOUNT_FIELDS)
+        orgs = gh_get_all("user/orgs", project=_ORG_FIELDS)
+        for org in orgs:
+            org["type"] = "org"
 
         accounts = []
         if user:
+            user["type"] = "user"
             user["is_personal"] = True
             accounts.append(user)
         accounts.extend(orgs)
@@ -2,12 +2,13 @@
 
 from flask import Blueprint, jsonify
 
-from backend.extensions import logger, cache
+from backend.extensions import logger, cache, head_sha_cache, stats_response_cache
 from backend.database import (
     get_workflow_cache_db,
     get_contributor_ts_cache_db,
     get_code_activity_cache_db,
     get_timeline_cache_db,
+    get_kv_cache_db,
 )
 
 cache_bp = Blueprint("cache", __name__)
@@ -17,6 +18,9 @@ cache_bp = Blueprint("cache", __name__)
 def clear_cache():
     """Clear the in-memory cache and SQLite caches."""
     cache.clear()
+    get_kv_cache_db().clear()
+    stats_response_cache.clear()
+    head_sha_cache.clear()
     get_workflow_cache_db().clear()
     get_contributor_ts_cache_db().clear()
     get_code_activity_cache_db().clear()
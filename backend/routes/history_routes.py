@@ -1,8 +1,9 @@
-"""Review history routes: list, detail, PR reviews, stats, check."""
+"""Review history routes: list, detail, content, PR reviews, stats, check."""
 
-import json
+from pathlib import Path
 
-from flask import Blueprint, jsonify, request
+import orjson
+from flask import Blueprint, Response, jsonify, request, send_file, stream_with_context
 
 from backend.extensions import logger
 from backend.database import get_reviews_db
@@ -25,38 +26,20 @@ def get_review_history():
         offset = request.args.get("offset", 0, type=int)
 
         if search:
-            reviews = reviews_db.search_reviews(search, limit=limit)
+            reviews = reviews_db.search_reviews(search, limit=limit, summary=True)
         else:
             reviews = reviews_db.list_reviews(
                 repo=repo,
                 author=author,
                 pr_number=pr_number,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                summary=True
             )
 
-        formatted = []
-        for review in reviews:
-            formatted.append({
-                "id": review["id"],
-                "pr_number": review["pr_number"],
-                "repo": review["repo"],
-                "pr_title": review["pr_title"],
-                "pr_author": review["pr_author"],
-                "pr_url": review["pr_url"],
-                "review_timestamp": review["review_timestamp"],
-                "status": review["status"],
-                "score": review["score"],
-                "is_followup": review["is_followup"],
-                "parent_review_id": review["parent_review_id"],
-                "head_commit_sha": review.get("head_commit_sha"),
-                "inline_comments_posted": review.get("inline_comments_posted", False),
-                "pr_state": review.get("pr_state_at_review")
-            })
-
         total_all = reviews_db.count_all()
 
-        return jsonify({"reviews": formatted, "total": total_all})
+        return jsonify({"reviews": reviews, "total": total_all})
 
     except Exception as e:
         return error_response("Internal server error", 500, f"Error getting review history: {e}")
@@ -76,10 +59,10 @@ def get_review_detail(review_id):
         content_json_str = result.get("content_json")
         if content_json_str:
             try:
-                parsed = json.loads(content_json_str)
+                parsed = orjson.loads(content_json_str)
                 result["content_json"] = parsed
                 result["content"] = json_to_markdown(parsed)
-            except (json.JSONDecodeError, TypeError):
+            except (orjson.JSONDecodeError, TypeError):
                 result["content_json"] = None
                 result["content"] = ""
         else:
@@ -92,45 +75,97 @@ def get_review_detail(review_id):
         return error_response("Internal server error", 500, f"Error getting review {review_id}: {e}")
 
 
+@history_bp.route("/api/review-history/<int:review_id>/content", methods=["GET"])
+def get_review_content(review_id):
+    """Serve a review's markdown as text/markdown.
+
+    The saved .md file is streamed straight from disk (conditional, so
+    repeat fetches get 304s); reviews whose file is gone fall back to
+    markdown generated from content_json.
+    """
+    try:
+        reviews_db = get_reviews_db()
+        review = reviews_db.get_review(review_id)
+        if not review:
+            return jsonify({"error": "Review not found"}), 404
+
+        file_path = review.get("review_file_path")
+        if file_path:
+            md_path = Path(file_path).resolve()
+            if md_path.is_file():
+                return send_file(md_path, mimetype="text/markdown", conditional=True)
+
+        content_json_str = review.get("content_json")
+        if content_json_str:
+            try:
+                markdown = json_to_markdown(orjson.loads(content_json_str))
+                return Response(markdown, mimetype="text/markdown")
+            except (orjson.JSONDecodeError, TypeError):
+                pass
+
+        return jsonify({"error": "Review content not found"}), 404
+
+    except Exception as e:
+        return error_response("Internal server error", 500, f"Error getting content for review {review_id}: {e}")
+
+
+def _pr_review_entry(review):
+    """Parse a summary row's stored JSON string (when selected) and add its content link."""
+    if "content_json" in review:
+        content_json_str = review["content_json"]
+        review["content_json"] = None
+        if content_json_str:
+            try:
+                review["content_json"] = orjson.loads(content_json_str)
+            except (orjson.JSONDecodeError, TypeError):
+                pass
+    review["content_url"] = f"/api/review-history/{review['id']}/content"
+    return review
+
+
 @history_bp.route("/api/review-history/pr/<owner>/<repo>/<int:pr_number>", methods=["GET"])
 def get_pr_reviews(owner, repo, pr_number):
-    """Get all reviews for a specific PR."""
+    """Get all reviews for a specific PR.
+
+    Rows are list-view metadata plus a content_url for get_review_content;
+    the parsed content_json is only read and included with
+    ?include_content=true. With ?stream=true the reviews are sent as
+    newline-delimited JSON, one row per line as it is read. The first row
+    is read before answering, so a failing query still gets a 500; an
+    error after that ends the stream with an {"error": ...} line.
+    """
     try:
         reviews_db = get_reviews_db()
         full_repo = f"{owner}/{repo}"
-        reviews = reviews_db.get_reviews_for_pr(full_repo, pr_number)
+        include_content = request.args.get("include_content", "").lower() == "true"
 
-        formatted = []
-        for review in reviews:
-            item = {
-                "id": review["id"],
-                "pr_number": review["pr_number"],
-                "repo": review["repo"],
-                "pr_title": review["pr_title"],
-                "pr_author": review["pr_author"],
-                "pr_url": review["pr_url"],
-                "review_timestamp": review["review_timestamp"],
-                "status": review["status"],
-                "score": review["score"],
-                "is_followup": review["is_followup"],
-                "parent_review_id": review["parent_review_id"]
-            }
-            # Generate markdown content from JSON
-            content_json_str = review.get("content_json")
-            if content_json_str:
+        if request.args.get("stream", "").lower() == "true":
+            rows = reviews_db.iter_reviews_for_pr(
+                full_repo, pr_number, summary=True, include_content=include_content
+            )
+            first = next(rows, None)
+            first_line = (
+                orjson.dumps(_pr_review_entry(first), option=orjson.OPT_APPEND_NEWLINE) if first else b""
+            )
+
+            def generate():
+                yield first_line
                 try:
-                    parsed = json.loads(content_json_str)
-                    item["content_json"] = parsed
-                    item["content"] = json_to_markdown(parsed)
-                except (json.JSONDecodeError, TypeError):
-                    item["content_json"] = None
-                    item["content"] = ""
-            else:
-                item["content_json"] = None
-                item["content"] = ""
-            formatted.append(item)
-
-        return jsonify({"reviews": formatted})
+                    for review in rows:
+                        yield orjson.dumps(_pr_review_entry(review), option=orjson.OPT_APPEND_NEWLINE)
+                except Exception as e:
+                    logger.error(f"Error streaming reviews for PR #{pr_number}: {e}")
+                    yield orjson.dumps({"error": "Internal server error"}, option=orjson.OPT_APPEND_NEWLINE)
+                finally:
+                    rows.close()
+
+            return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+        reviews = reviews_db.get_reviews_for_pr(full_repo, pr_number, summary=True, include_content=include_content)
+        for review in reviews:
+            _pr_review_entry(review)
+
+        return jsonify({"reviews": reviews})
 
     except Exception as e:
         return error_response("Internal server error", 500, f"Error getting reviews for PR #{pr_number}: {e}")
@@ -215,7 +250,7 @@ def reparse_review(review_id):
         if not valid:
             return jsonify({"error": "Re-parsed JSON failed validation", "details": errs[:5]}), 400
 
-        reviews_db.update_review(review_id, content_json=json.dumps(new_json))
+        reviews_db.update_review(review_id, content_json=orjson.dumps(new_json).decode())
         logger.info(f"Re-parsed review {review_id} from {file_path}")
 
         return jsonify({"success": True, "review_id": review_id})
@@ -1,20 +1,23 @@
 """PR routes: list PRs with filters, batch divergence."""
 
-from concurrent.futures import ThreadPoolExecutor
-
 from flask import Blueprint, jsonify, request
 
 from backend.config import get_config
-from backend.extensions import logger
+from backend.extensions import gh_executor, logger
 from backend.filters.pr_filter_builder import PRFilterParams, PRFilterBuilder
 from backend.routes import error_response
 from backend.database import get_timeline_cache_db
-from backend.services.github_service import run_gh_command, parse_json_output, TransientGitHubError
+from backend.services.github_http import gh_get, has_token
+from backend.services.github_service import (
+    run_gh_command, parse_json_output, search_prs, fetch_pr, TransientGitHubError,
+)
 from backend.services.pr_service import get_review_status, get_ci_status, get_current_reviewers
 from backend.services.timeline_service import get_timeline
 
 pr_bp = Blueprint("pr", __name__)
 
+DEFAULT_PER_PAGE = get_config().get("default_per_page", 30)
+
 # Map computed reviewStatus back to uppercase reviewDecision for frontend badges
 _STATUS_TO_DECISION = {
     "changes_requested": "CHANGES_REQUESTED",
@@ -32,16 +35,17 @@ PR_JSON_FIELDS = (
 
 
 def _get_pr_by_number(owner, repo, pr_number):
-    """Fetch a single PR by number using gh pr view."""
+    """Fetch a single PR by number (GraphQL with a token, else gh pr view)."""
     try:
-        output = run_gh_command([
-            "pr", "view", str(pr_number),
-            "-R", f"{owner}/{repo}",
-            "--json", PR_JSON_FIELDS
-        ])
-        pr = parse_json_output(output)
-        if not pr:
-            return jsonify({"prs": []})
+        if has_token():
+            pr = fetch_pr(owner, repo, int(pr_number))
+        else:
+            output = run_gh_command([
+                "pr", "view", str(pr_number),
+                "-R", f"{owner}/{repo}",
+                "--json", PR_JSON_FIELDS
+            ], raw=True)
+            pr = parse_json_output(output)
 
         # parse_json_output returns a list for list commands, dict for view
         if isinstance(pr, list):
@@ -55,7 +59,7 @@ def _get_pr_by_number(owner, repo, pr_number):
         pr["ciStatus"] = get_ci_status(pr.get("statusCheckRollup"))
         pr["currentReviewers"] = get_current_reviewers(reviews)
         return jsonify({"prs": [pr]})
-    except RuntimeError:
+    except (RuntimeError, ValueError):
         return jsonify({"prs": []})
 
 
@@ -68,13 +72,13 @@ def get_prs(owner, repo):
         if pr_number:
             return _get_pr_by_number(owner, repo, pr_number)
 
-        config = get_config()
-        params = PRFilterParams.from_request_args(request.args, default_per_page=config.get("default_per_page", 30))
+        params = PRFilterParams.from_request_args(request.args, default_per_page=DEFAULT_PER_PAGE)
         builder = PRFilterBuilder(owner, repo, params)
-        args = builder.build()
-
-        output = run_gh_command(args)
-        prs = parse_json_output(output)
+        if has_token():
+            prs = search_prs(builder.build_search_query(), params.limit)
+        else:
+            output = run_gh_command(builder.build(), raw=True)
+            prs = parse_json_output(output)
 
         # Post-filter by draft status (gh search qualifier draft: is unreliable)
         if params.draft == "true":
@@ -96,7 +100,7 @@ def get_prs(owner, repo):
         # GitHub's review: qualifier can be inconsistent when re-reviews are requested,
         # so we verify against our reviews-based computation for consistency.
         if params.review:
-            review_values = {r.strip() for r in params.review.split(",") if r.strip()}
+            review_values = {r for r in map(str.strip, params.review.split(",")) if r}
             review_status_map = {
                 "none": "pending",
                 "required": "review_required",
@@ -108,7 +112,7 @@ def get_prs(owner, repo):
 
         # Post-filter by CI status (gh search doesn't support status: qualifier for CI checks)
         if params.status:
-            selected_statuses = {s.strip() for s in params.status.split(",") if s.strip()}
+            selected_statuses = {s for s in map(str.strip, params.status.split(",")) if s}
             prs = [pr for pr in prs if pr.get("ciStatus") in selected_statuses]
 
         return jsonify({"prs": prs})
@@ -138,24 +142,21 @@ def get_pr_divergence(owner, repo):
             base = pr_info["base"]
             head = pr_info["head"]
             try:
-                output = run_gh_command([
-                    "api", f"repos/{owner}/{repo}/compare/{base}...{head}",
-                    "--jq", '{"status": .status, "ahead_by": .ahead_by, "behind_by": .behind_by}'
-                ])
-                result = parse_json_output(output)
-                if result:
-                    return (number, result)
-            except RuntimeError:
+                data = gh_get(f"repos/{owner}/{repo}/compare/{base}...{head}")
+                if data:
+                    return (number, {
+                        "status": data.get("status"),
+                        "ahead_by": data.get("ahead_by"),
+                        "behind_by": data.get("behind_by"),
+                    })
+            except (RuntimeError, ValueError):
                 pass
             return (number, None)
 
         divergence = {}
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(fetch_one, pr) for pr in pr_list]
-            for future in futures:
-                number, result = future.result()
-                if result:
-                    divergence[str(number)] = result
+        for number, result in gh_executor.map(fetch_one, pr_list):
+            if result:
+                divergence[str(number)] = result
 
         return jsonify({"divergence": divergence})
 
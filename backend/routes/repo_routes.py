@@ -2,11 +2,43 @@
 
 from flask import Blueprint, jsonify, request
 
-from backend.services.github_service import run_gh_command, parse_json_output
+from backend.cache.memory_cache import cached
+from backend.services.github_http import gh_get, gh_iter_all, has_token
+from backend.services.github_service import run_gh_command, parse_json_output, list_repos
 
 repo_bp = Blueprint("repo", __name__)
 
 
+# Filter dropdown data changes rarely, so each lookup is memoized per
+# (owner, repo) in the shared TTL cache instead of forking gh on every
+# click, and gh_get revalidates with If-None-Match once the TTL expires.
+# Errors propagate uncached.
+
+@cached()
+def _list_contributors(owner, repo):
+    return [c["login"] for c in gh_get(f"repos/{owner}/{repo}/contributors") or [] if c.get("login")]
+
+
+@cached()
+def _list_labels(owner, repo):
+    return [l["name"] for l in gh_get(f"repos/{owner}/{repo}/labels") or []]
+
+
+@cached()
+def _list_branches(owner, repo):
+    return [b["name"] for b in gh_iter_all(f"repos/{owner}/{repo}/branches")]
+
+
+@cached()
+def _list_milestones(owner, repo):
+    return gh_get(f"repos/{owner}/{repo}/milestones", project=["title", "state", "number"]) or []
+
+
+@cached()
+def _list_teams(owner, repo):
+    return gh_get(f"repos/{owner}/{repo}/teams", project=["slug", "name"]) or []
+
+
 @repo_bp.route("/api/repos")
 def get_repos():
     """List repositories for an organization or user."""
@@ -14,6 +46,9 @@ def get_repos():
         limit = request.args.get("limit", 100, type=int)
         owner = request.args.get("owner")
 
+        if has_token():
+            return jsonify({"repos": list_repos(owner, limit)})
+
         args = ["repo", "list"]
         if owner:
             args.append(owner)
@@ -22,7 +57,7 @@ def get_repos():
             "--limit", str(limit),
         ])
 
-        output = run_gh_command(args)
+        output = run_gh_command(args, raw=True)
         repos = parse_json_output(output)
         return jsonify({"repos": repos})
     except RuntimeError as e:
@@ -33,13 +68,7 @@ def get_repos():
 def get_contributors(owner, repo):
     """Get contributors for a repository."""
     try:
-        output = run_gh_command([
-            "api",
-            f"repos/{owner}/{repo}/contributors",
-            "--jq", ".[].login",
-        ])
-        contributors = [c.strip() for c in output.split("\n") if c.strip()]
-        return jsonify({"contributors": contributors})
+        return jsonify({"contributors": _list_contributors(owner, repo)})
     except RuntimeError as e:
         return jsonify({"error": str(e)}), 500
 
@@ -48,13 +77,7 @@ def get_contributors(owner, repo):
 def get_labels(owner, repo):
     """Get labels for a repository."""
     try:
-        output = run_gh_command([
-            "api",
-            f"repos/{owner}/{repo}/labels",
-            "--jq", ".[].name",
-        ])
-        labels = [l.strip() for l in output.split("\n") if l.strip()]
-        return jsonify({"labels": labels})
+        return jsonify({"labels": _list_labels(owner, repo)})
     except RuntimeError as e:
         return jsonify({"error": str(e)}), 500
 
@@ -63,14 +86,7 @@ def get_labels(owner, repo):
 def get_branches(owner, repo):
     """Get branches for a repository."""
     try:
-        output = run_gh_command([
-            "api",
-            f"repos/{owner}/{repo}/branches",
-            "--jq", ".[].name",
-            "--paginate",
-        ])
-        branches = [b.strip() for b in output.split("\n") if b.strip()]
-        return jsonify({"branches": branches})
+        return jsonify({"branches": _list_branches(owner, repo)})
     except RuntimeError as e:
         return jsonify({"error": str(e)}), 500
 
@@ -79,13 +95,7 @@ def get_branches(owner, repo):
 def get_milestones(owner, repo):
     """Get milestones for a repository."""
     try:
-        output = run_gh_command([
-            "api",
-            f"repos/{owner}/{repo}/milestones",
-            "--jq", "[.[] | {title: .title, state: .state, number: .number}]",
-        ])
-        milestones = parse_json_output(output)
-        return jsonify({"milestones": milestones})
+        return jsonify({"milestones": _list_milestones(owner, repo)})
     except RuntimeError as e:
         return jsonify({"error": str(e)}), 500
 
@@ -94,12 +104,6 @@ def get_milestones(owner, repo):
 def get_teams(owner, repo):
     """Get teams with access to a repository."""
     try:
-        output = run_gh_command([
-            "api",
-            f"repos/{owner}/{repo}/teams",
-            "--jq", "[.[] | {slug: .slug, name: .name}]",
-        ])
-        teams = parse_json_output(output)
-        return jsonify({"teams": teams})
-    except RuntimeError as e:
+        return jsonify({"teams": _list_teams(owner, repo)})
+    except RuntimeError:
         return jsonify({"teams": []})
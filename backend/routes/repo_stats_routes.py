@@ -1,13 +1,12 @@
 """Repo stats routes: repository overview, language breakdown, LOC calculation."""
 
-import threading
-
 from flask import Blueprint, jsonify, request
 
 from backend.extensions import (
     logger,
-    repo_stats_refresh_in_progress, repo_stats_refresh_lock,
-    loc_in_progress, loc_lock,
+    refresh_executor,
+    repo_stats_refresh_in_progress,
+    loc_in_progress,
 )
 from backend.database import get_repo_stats_cache_db, get_repo_loc_cache_db
 from backend.services.repo_stats_service import fetch_repo_stats, calculate_loc
@@ -44,8 +43,7 @@ def _background_refresh_repo_stats(owner, repo, repo_key):
     except Exception as e:
         logger.error(f"Background repo stats refresh failed for {repo_key}: {e}")
     finally:
-        with repo_stats_refresh_lock:
-            repo_stats_refresh_in_progress.discard(repo_key)
+        repo_stats_refresh_in_progress.release(repo_key)
 
 
 @repo_stats_bp.route("/api/repos/<owner>/<repo>/repo-stats")
@@ -76,18 +74,9 @@ def get_repo_stats(owner, repo):
         if cached:
             refreshing = False
             if is_stale:
-                with repo_stats_refresh_lock:
-                    if repo_key not in repo_stats_refresh_in_progress:
-                        repo_stats_refresh_in_progress.add(repo_key)
-                        thread = threading.Thread(
-                            target=_background_refresh_repo_stats,
-                            args=(owner, repo, repo_key),
-                            daemon=True,
-                        )
-                        thread.start()
-                        refreshing = True
-                    else:
-                        refreshing = True
+                if repo_stats_refresh_in_progress.acquire(repo_key):
+                    refresh_executor.submit(_background_refresh_repo_stats, owner, repo, repo_key)
+                refreshing = True
             return jsonify({
                 **cached["data"],
                 "last_updated": _normalize_timestamp(cached["updated_at"]),
@@ -140,10 +129,8 @@ def get_repo_loc(owner, repo):
 
     try:
         # Check if LOC calculation already in progress
-        with loc_lock:
-            if repo_key in loc_in_progress:
-                return jsonify({"message": "LOC calculation already in progress", "in_progress": True}), 202
-            loc_in_progress.add(repo_key)
+        if not loc_in_progress.acquire(repo_key):
+            return jsonify({"message": "LOC calculation already in progress", "in_progress": True}), 202
 
         try:
             logger.info(f"Starting LOC calculation for {repo_key}")
@@ -157,8 +144,7 @@ def get_repo_loc(owner, repo):
                 "cached": False,
             })
         finally:
-            with loc_lock:
-                loc_in_progress.discard(repo_key)
+            loc_in_progress.release(repo_key)
 
     except Exception as e:
         return error_response("Internal server error", 500, f"Failed to calculate LOC for {repo_key}: {e}")
@@ -1,14 +1,19 @@
 """Code review routes: start, cancel, status, list active, post inline comments, check new commits."""
 
+import os
+import signal
 import subprocess
 from datetime import datetime, timezone
 
 from flask import Blueprint, jsonify, request
 
-from backend.extensions import logger, active_reviews, reviews_lock
-from backend.database import get_reviews_db
-from backend.services.github_service import fetch_pr_head_sha
-from backend.services.review_service import save_review_to_db, check_review_status, start_review_process
+from backend.extensions import logger, active_reviews, reviews_lock, gh_executor, head_sha_cache
+from backend.database import get_reviews_db, get_active_reviews_db
+from backend.database.active_reviews import is_same_process
+from backend.services.github_service import fetch_pr_states_and_shas
+from backend.services.review_service import (
+    save_review_to_db, check_review_status, start_review_process, start_output_readers,
+)
 from backend.services.inline_comments_service import post_inline_comments, preview_section_issues
 from backend.services.verdict_service import post_verdict
 from backend.routes import error_response
@@ -16,6 +21,28 @@ from backend.routes import error_response
 review_bp = Blueprint("review", __name__)
 
 
+# Statuses after which an active review's fields no longer change
+_TERMINAL_STATUSES = ("completed", "failed", "cancelled")
+
+
+def _review_view(key, review):
+    """Shape an active review (or another worker's active_reviews row) for the listing."""
+    return {
+        "key": key,
+        "owner": review["owner"],
+        "repo": review["repo"],
+        "pr_number": review["pr_number"],
+        "status": review["status"],
+        "started_at": review.get("started_at") or "",
+        "completed_at": review.get("completed_at") or "",
+        "pr_url": review.get("pr_url") or "",
+        "review_file": review.get("review_file") or "",
+        "exit_code": review.get("exit_code"),
+        "error_output": review.get("error_output") or "",
+        "is_followup": bool(review.get("is_followup", False))
+    }
+
+
 @review_bp.route("/api/reviews", methods=["GET"])
 def get_reviews():
     """Get all active/recent reviews with updated statuses."""
@@ -31,21 +58,18 @@ def get_reviews():
             review = active_reviews.get(key)
             if review is None:
                 continue
-            parts = key.split("/")
-            reviews_list.append({
-                "key": key,
-                "owner": parts[0] if len(parts) >= 1 else "",
-                "repo": parts[1] if len(parts) >= 2 else "",
-                "pr_number": int(parts[2]) if len(parts) >= 3 else 0,
-                "status": review["status"],
-                "started_at": review.get("started_at", ""),
-                "completed_at": review.get("completed_at", ""),
-                "pr_url": review.get("pr_url", ""),
-                "review_file": review.get("review_file", ""),
-                "exit_code": review.get("exit_code"),
-                "error_output": review.get("error_output", ""),
-                "is_followup": review.get("is_followup", False)
-            })
+            # Finished reviews are frozen, so their view is built only once
+            view = review.get("_cached_view")
+            if view is None:
+                view = _review_view(key, review)
+                if review["status"] in _TERMINAL_STATUSES:
+                    review["_cached_view"] = view
+            reviews_list.append(view)
+
+    # Reviews started by other worker processes, polled by their owners
+    for row in get_active_reviews_db().list_remote():
+        if row["key"] not in keys:
+            reviews_list.append(_review_view(row["key"], row))
 
     return jsonify({"reviews": reviews_list})
 
@@ -66,7 +90,11 @@ def start_review():
                 logger.warning(f"Review request missing required field: {field}")
                 return jsonify({"error": f"Missing required field: {field}"}), 400
 
-        pr_number = data["number"]
+        try:
+            pr_number = int(data["number"])
+        except (TypeError, ValueError):
+            logger.warning(f"Review request with invalid PR number: {data['number']!r}")
+            return jsonify({"error": "Invalid PR number"}), 400
         pr_url = data["url"]
         owner = data["owner"]
         repo = data["repo"]
@@ -88,6 +116,10 @@ def start_review():
                 if existing["status"] == "running":
                     logger.warning(f"Review already in progress for {key}")
                     return jsonify({"error": "Review already in progress for this PR"}), 409
+        remote = get_active_reviews_db().get_remote(key)
+        if remote and remote["status"] == "running":
+            logger.warning(f"Review already in progress for {key} in worker {remote['worker_pid']}")
+            return jsonify({"error": "Review already in progress for this PR"}), 409
 
         previous_review_content = None
         parent_id = None
@@ -120,7 +152,11 @@ def start_review():
             return jsonify({"error": result}), 500
 
         with reviews_lock:
-            active_reviews[key] = {
+            review = active_reviews[key] = {
+                # Key parts stored once so listings never re-split the key
+                "owner": owner,
+                "repo": repo,
+                "pr_number": pr_number,
                 "process": process,
                 "status": "running",
                 "started_at": datetime.now(timezone.utc).isoformat(),
@@ -129,8 +165,10 @@ def start_review():
                 "is_followup": is_followup,
                 "parent_review_id": parent_id,
                 "pr_title": pr_title,
-                "pr_author": pr_author
+                "pr_author": pr_author,
+                **start_output_readers(process),
             }
+        get_active_reviews_db().save(key, review, process.pid)
 
         return jsonify({
             "message": "Review started",
@@ -151,31 +189,67 @@ def cancel_review(owner, repo, pr_number):
     key = f"{owner}/{repo}/{pr_number}"
     logger.info(f"Received cancel request for review: {key}")
 
+    # Unlist the review first so polls stop touching it, then terminate the
+    # process outside reviews_lock (waiting on it can take seconds). It is
+    # marked cancelled under the lock, so a _finish_review already saving it
+    # sees the cancellation and neither saves nor publishes it.
     with reviews_lock:
-        if key not in active_reviews:
-            logger.warning(f"Cancel request for non-existent review: {key}")
-            return jsonify({"error": "Review not found"}), 404
+        review = active_reviews.pop(key, None)
+        was_running = review is not None and review["status"] == "running"
+        if was_running:
+            review["status"] = "cancelled"
+    if review is None:
+        return _cancel_remote_review(key)
+
+    process = review.get("process")
+    if process and was_running:
+        try:
+            logger.info(f"Terminating review process (PID {process.pid}) for {key}")
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+                logger.info(f"Review process terminated gracefully for {key}")
+            except subprocess.TimeoutExpired:
+                process.kill()
+                logger.warning(f"Review process killed (did not terminate gracefully) for {key}")
+        except Exception as e:
+            with reviews_lock:
+                review["status"] = "running"
+                active_reviews.setdefault(key, review)
+            return error_response("Failed to terminate review process", 500, f"Failed to terminate review process for {key}: {e}")
+
+    get_active_reviews_db().delete(key)
+    logger.info(f"Review cancelled and removed: {key}")
 
-        review = active_reviews[key]
-        process = review.get("process")
+    return jsonify({"message": "Review cancelled", "key": key})
 
-        if process and review["status"] == "running":
+
+def _cancel_remote_review(key):
+    """Cancel a review owned by another worker process.
+
+    Its Popen lives in that worker. The process is signalled by pid only
+    when its start time still matches the row, so a reused pid is never
+    killed; otherwise the owner terminates its own Popen once it sees the
+    row marked cancelled. Either way the owner skips saving the review.
+    """
+    active_reviews_db = get_active_reviews_db()
+    row = active_reviews_db.get_remote(key)
+    if row is None:
+        logger.warning(f"Cancel request for non-existent review: {key}")
+        return jsonify({"error": "Review not found"}), 404
+
+    if row["status"] == "running":
+        if is_same_process(row["pid"], row["pid_start_time"]):
             try:
-                logger.info(f"Terminating review process (PID {process.pid}) for {key}")
-                process.terminate()
-                try:
-                    process.wait(timeout=2)
-                    logger.info(f"Review process terminated gracefully for {key}")
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    logger.warning(f"Review process killed (did not terminate gracefully) for {key}")
-                review["status"] = "cancelled"
-            except Exception as e:
+                logger.info(f"Terminating review process (PID {row['pid']}) owned by worker {row['worker_pid']} for {key}")
+                os.kill(row["pid"], signal.SIGTERM)
+            except OSError as e:
                 return error_response("Failed to terminate review process", 500, f"Failed to terminate review process for {key}: {e}")
+        active_reviews_db.mark_cancelled(key)
+    else:
+        active_reviews_db.delete(key)
 
-        del active_reviews[key]
-        logger.info(f"Review cancelled and removed: {key}")
-
+    logger.info(f"Review cancelled: {key}")
     return jsonify({"message": "Review cancelled", "key": key})
 
 
@@ -186,18 +260,20 @@ def get_review_status_endpoint(owner, repo, pr_number):
     reviews_db = get_reviews_db()
 
     review = check_review_status(key, active_reviews, reviews_lock, reviews_db)
+    if review is None:
+        review = get_active_reviews_db().get_remote(key)
     if review is None:
         return jsonify({"error": "Review not found"}), 404
 
     return jsonify({
         "key": key,
         "status": review["status"],
-        "started_at": review.get("started_at", ""),
-        "completed_at": review.get("completed_at", ""),
-        "pr_url": review.get("pr_url", ""),
-        "review_file": review.get("review_file", ""),
+        "started_at": review.get("started_at") or "",
+        "completed_at": review.get("completed_at") or "",
+        "pr_url": review.get("pr_url") or "",
+        "review_file": review.get("review_file") or "",
         "exit_code": review.get("exit_code"),
-        "error_output": review.get("error_output", "")
+        "error_output": review.get("error_output") or ""
     })
 
 
@@ -229,34 +305,98 @@ def post_inline_comments_endpoint(review_id):
         return error_response("Internal server error", 500, f"Error posting inline comments for review {review_id}: {e}")
 
 
+def _head_shas(owner, repo, numbers):
+    """Current head SHA per PR number, via head_sha_cache.
+
+    Misses are resolved together in one batched GraphQL lookup. PRs whose
+    SHA could not be fetched map to None and are not cached.
+    """
+    shas = {}
+    missing = []
+    for number in numbers:
+        sha = head_sha_cache.get((owner, repo, number))
+        if sha:
+            shas[number] = sha
+        else:
+            missing.append(number)
+    if missing:
+        fetched = fetch_pr_states_and_shas(owner, repo, missing)
+        for number in missing:
+            sha = fetched.get(number, (None, None))[1]
+            if sha:
+                head_sha_cache[(owner, repo, number)] = sha
+            shas[number] = sha
+    return shas
+
+
+def _new_commits_status(latest_review, current_sha):
+    """Compare a PR's head SHA with the SHA its latest review was run against."""
+    last_reviewed_sha = latest_review.get("head_commit_sha") if latest_review else None
+
+    has_new_commits = False
+    if last_reviewed_sha and current_sha:
+        has_new_commits = last_reviewed_sha != current_sha
+    elif current_sha and not last_reviewed_sha:
+        has_new_commits = True if latest_review else False
+
+    return {
+        "has_new_commits": has_new_commits,
+        "last_reviewed_sha": last_reviewed_sha,
+        "current_sha": current_sha
+    }
+
+
 @review_bp.route("/api/reviews/check-new-commits/<owner>/<repo>/<int:pr_number>", methods=["GET"])
 def check_new_commits(owner, repo, pr_number):
     """Check if a PR has new commits since the last review."""
     try:
         reviews_db = get_reviews_db()
-        full_repo = f"{owner}/{repo}"
-        latest_review = reviews_db.get_latest_review_for_pr(full_repo, pr_number)
+        latest_review = reviews_db.get_latest_review_for_pr(f"{owner}/{repo}", pr_number)
+        current_sha = _head_shas(owner, repo, [pr_number])[pr_number]
+        return jsonify(_new_commits_status(latest_review, current_sha))
 
-        last_reviewed_sha = None
-        if latest_review:
-            last_reviewed_sha = latest_review.get("head_commit_sha")
+    except Exception as e:
+        return error_response("Internal server error", 500, f"Error checking new commits for PR #{pr_number}: {e}")
 
-        current_sha = fetch_pr_head_sha(owner, repo, pr_number)
 
-        has_new_commits = False
-        if last_reviewed_sha and current_sha:
-            has_new_commits = last_reviewed_sha != current_sha
-        elif current_sha and not last_reviewed_sha:
-            has_new_commits = True if latest_review else False
+@review_bp.route("/api/reviews/check-new-commits-batch", methods=["POST"])
+def check_new_commits_batch():
+    """Check many PRs for new commits since their last review.
 
-        return jsonify({
-            "has_new_commits": has_new_commits,
-            "last_reviewed_sha": last_reviewed_sha,
-            "current_sha": current_sha
-        })
+    Body: {"prs": [{"owner", "repo", "number"}, ...]}. Uses one SQL query for
+    the latest reviews and one GraphQL lookup per repo (repos in parallel).
+    Returns {"results": {"owner/repo/number": {...}}}.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        numbers_by_repo = {}
+        for pr in data.get("prs") or []:
+            try:
+                key = (pr["owner"], pr["repo"])
+                number = int(pr["number"])
+            except (KeyError, TypeError, ValueError):
+                return jsonify({"error": "Each PR needs owner, repo and number"}), 400
+            numbers_by_repo.setdefault(key, []).append(number)
+
+        latest_reviews = get_reviews_db().get_latest_reviews_bulk(
+            [(f"{owner}/{repo}", number)
+             for (owner, repo), numbers in numbers_by_repo.items() for number in numbers]
+        )
+        repo_keys = list(numbers_by_repo)
+        head_shas = dict(zip(repo_keys, gh_executor.map(
+            lambda key: _head_shas(*key, numbers_by_repo[key]), repo_keys
+        )))
+
+        results = {}
+        for (owner, repo), numbers in numbers_by_repo.items():
+            for number in numbers:
+                results[f"{owner}/{repo}/{number}"] = _new_commits_status(
+                    latest_reviews.get((f"{owner}/{repo}", number)), head_shas[(owner, repo)][number]
+                )
+        return jsonify({"results": results})
 
     except Exception as e:
-        return error_response("Internal server error", 500, f"Error checking new commits for PR #{pr_number}: {e}")
+        return error_response("Internal server error", 500, f"Error checking new commits in batch: {e}")
 
 
 @review_bp.route("/api/repos/<owner>/<repo>/prs/<int:pr_number>/verdict", methods=["POST"])
@@ -1,21 +1,22 @@
 """Workflow/CI routes: workflow runs with filters and aggregate stats."""
 
-import threading
-
 from flask import Blueprint, jsonify, request
 
 from backend.config import get_config
 from backend.extensions import (
     logger,
-    workflow_refresh_in_progress, workflow_refresh_lock,
+    refresh_executor,
+    workflow_refresh_in_progress,
 )
 from backend.database import get_workflow_cache_db
 from backend.services.workflow_service import fetch_workflow_data
-from backend.visualizers.workflow_visualizer import filter_and_compute_stats
+from backend.visualizers.workflow_visualizer import stats_from_query
 from backend.routes import error_response
 
 workflow_bp = Blueprint("workflow", __name__)
 
+WORKFLOW_CACHE_TTL_MINUTES = get_config().get("workflow_cache_ttl_minutes", 60)
+
 
 def _normalize_timestamp(ts):
     """Normalize SQLite CURRENT_TIMESTAMP to ISO 8601 with Z suffix."""
@@ -30,26 +31,51 @@ def _normalize_timestamp(ts):
 
 
 def _background_refresh_workflows(owner, repo, repo_key):
-    """Background task to refresh workflow cache for a repository."""
+    """Background task to refresh workflow cache for a repository.
+
+    Returns True once fresh data is saved, False if the refresh failed.
+    """
     try:
         logger.info(f"Background workflow refresh started for {repo_key}")
         workflow_cache_db = get_workflow_cache_db()
         data = fetch_workflow_data(owner, repo)
         workflow_cache_db.save_cache(repo_key, data)
         logger.info(f"Background workflow refresh completed for {repo_key}: {len(data['runs'])} runs cached")
+        return True
     except Exception as e:
         logger.error(f"Background workflow refresh failed for {repo_key}: {e}")
-    finally:
-        with workflow_refresh_lock:
-            workflow_refresh_in_progress.discard(repo_key)
+        return False
+
+
+def _refresh_now(owner, repo, repo_key, workflow_cache_db):
+    """Refresh the cache before answering, joining a refresh already in flight.
+
+    A stale read may have queued a background refresh for this repo; waiting
+    on its Future avoids fetching the same runs twice. The key can also be
+    held by the startup refresh (no Future), in which case fetch directly.
+    """
+    future, _ = workflow_refresh_in_progress.submit(
+        repo_key, refresh_executor, _background_refresh_workflows, owner, repo, repo_key
+    )
+    if future is None:
+        workflow_cache_db.save_cache(repo_key, fetch_workflow_data(owner, repo))
+    elif not future.result():
+        raise RuntimeError(f"Workflow refresh failed for {repo_key}")
+
+
+def _query_cached(workflow_cache_db, repo_key, filters):
+    """Filtered runs + stats for a just-saved cache, with its timestamp."""
+    queried = workflow_cache_db.query_runs(repo_key, filters)
+    result = stats_from_query(queried)
+    result["last_updated"] = _normalize_timestamp(queried["updated_at"])
+    return result
 
 
 @workflow_bp.route("/api/repos/<owner>/<repo>/workflow-runs")
 def get_workflow_runs(owner, repo):
     """Get workflow runs with optional filters and aggregate stats."""
     repo_key = f"{owner}/{repo}"
-    config = get_config()
-    ttl_minutes = config.get("workflow_cache_ttl_minutes", 60)
+    ttl_minutes = WORKFLOW_CACHE_TTL_MINUTES
     force_refresh = request.args.get("refresh", "").lower() == "true"
     workflow_cache_db = get_workflow_cache_db()
 
@@ -64,48 +90,34 @@ def get_workflow_runs(owner, repo):
     try:
         if force_refresh:
             logger.info(f"Force refresh requested for {repo_key}")
-            data = fetch_workflow_data(owner, repo)
-            workflow_cache_db.save_cache(repo_key, data)
-            fresh_cached = workflow_cache_db.get_cached(repo_key)
-            result = filter_and_compute_stats(data, filters)
-            result["last_updated"] = _normalize_timestamp(fresh_cached["updated_at"]) if fresh_cached else None
+            _refresh_now(owner, repo, repo_key, workflow_cache_db)
+            result = _query_cached(workflow_cache_db, repo_key, filters)
             result["cached"] = False
             result["stale"] = False
             result["refreshing"] = False
             return jsonify(result)
 
-        cached = workflow_cache_db.get_cached(repo_key)
+        queried = workflow_cache_db.query_runs(repo_key, filters)
         is_stale = workflow_cache_db.is_stale(repo_key, ttl_minutes)
 
-        if cached:
+        if queried:
             refreshing = False
             if is_stale:
-                with workflow_refresh_lock:
-                    if repo_key not in workflow_refresh_in_progress:
-                        workflow_refresh_in_progress.add(repo_key)
-                        thread = threading.Thread(
-                            target=_background_refresh_workflows,
-                            args=(owner, repo, repo_key),
-                            daemon=True
-                        )
-                        thread.start()
-                        refreshing = True
-                    else:
-                        refreshing = True
-
-            result = filter_and_compute_stats(cached["data"], filters)
-            result["last_updated"] = _normalize_timestamp(cached["updated_at"])
+                workflow_refresh_in_progress.submit(
+                    repo_key, refresh_executor, _background_refresh_workflows, owner, repo, repo_key
+                )
+                refreshing = True
+
+            result = stats_from_query(queried)
+            result["last_updated"] = _normalize_timestamp(queried["updated_at"])
             result["cached"] = True
             result["stale"] = is_stale
             result["refreshing"] = refreshing
             return jsonify(result)
 
         # No cache: synchronous fetch
-        data = fetch_workflow_data(owner, repo)
-        workflow_cache_db.save_cache(repo_key, data)
-        fresh_cached = workflow_cache_db.get_cached(repo_key)
-        result = filter_and_compute_stats(data, filters)
-        result["last_updated"] = _normalize_timestamp(fresh_cached["updated_at"]) if fresh_cached else None
+        _refresh_now(owner, repo, repo_key, workflow_cache_db)
+        result = _query_cached(workflow_cache_db, repo_key, filters)
         result["cached"] = False
         result["stale"] = False
         result["refreshing"] = False
@@ -1,35 +1,51 @@
 """Code activity data from 3 stats APIs."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timezone
 
+from backend.extensions import gh_executor
 from backend.services.github_service import fetch_github_stats_api
+from backend.utils.dates import week_str
+from backend.visualizers.activity_visualizer import add_default_summary
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 logger = logging.getLogger(__name__)
 
 
+def _community_commits(all_p, owner_p):
+    """Per-week all-minus-owner commits; owner is zero-padded/truncated to all."""
+    if np is not None and all_p:
+        all_arr = np.asarray(all_p, dtype=np.int64)
+        owner_arr = np.zeros_like(all_arr)
+        n = min(len(all_p), len(owner_p))
+        owner_arr[:n] = owner_p[:n]
+        return np.subtract(all_arr, owner_arr).tolist()
+    padded_owner = list(owner_p[:len(all_p)]) + [0] * (len(all_p) - len(owner_p))
+    return [a - o for a, o in zip(all_p, padded_owner)]
+
+
 def fetch_code_activity_data(owner, repo):
     """Fetch and process all 52 weeks of code activity data from GitHub stats APIs.
 
-    Returns a dict with weekly_commits, code_changes, owner_commits, community_commits,
-    or None if all data sources are empty.
+    Returns a dict with weekly_commits, code_changes, owner_commits, community_commits
+    and the precomputed 52-week default_summary, or None if all data sources are empty.
     """
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        freq_future = executor.submit(fetch_github_stats_api, owner, repo, "stats/code_frequency")
-        commit_future = executor.submit(fetch_github_stats_api, owner, repo, "stats/commit_activity")
-        participation_future = executor.submit(fetch_github_stats_api, owner, repo, "stats/participation")
-
-        code_freq = freq_future.result()
-        commit_activity = commit_future.result()
-        participation = participation_future.result()
+    # The three stats endpoints go out together on the shared gh pool, whose
+    # long-lived threads reuse the pooled session's keep-alive connections
+    code_freq, commit_activity, participation = gh_executor.map(
+        lambda endpoint: fetch_github_stats_api(owner, repo, endpoint),
+        ("stats/code_frequency", "stats/commit_activity", "stats/participation"),
+    )
 
     code_changes = []
     if isinstance(code_freq, list):
         for entry in code_freq:
             if isinstance(entry, list) and len(entry) >= 3:
                 ts = entry[0]
-                date_str = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+                date_str = week_str(ts)
                 code_changes.append({
                     "week": date_str,
                     "additions": entry[1],
@@ -41,7 +57,7 @@ def fetch_code_activity_data(owner, repo):
         for entry in commit_activity:
             if isinstance(entry, dict):
                 ts = entry.get("week", 0)
-                date_str = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+                date_str = week_str(ts)
                 weekly_commits.append({
                     "week": date_str,
                     "total": entry.get("total", 0),
@@ -54,17 +70,14 @@ def fetch_code_activity_data(owner, repo):
         all_p = participation.get("all", [])
         owner_p = participation.get("owner", [])
         owner_commits = owner_p if owner_p else []
-        community_commits = [
-            (all_p[i] if i < len(all_p) else 0) - (owner_p[i] if i < len(owner_p) else 0)
-            for i in range(len(all_p))
-        ]
+        community_commits = _community_commits(all_p, owner_p)
 
     if not weekly_commits and not code_changes and not owner_commits and not community_commits:
         return None
 
-    return {
+    return add_default_summary({
         "weekly_commits": weekly_commits,
         "code_changes": code_changes,
         "owner_commits": owner_commits,
         "community_commits": community_commits,
-    }
+    })
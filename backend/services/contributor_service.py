@@ -1,9 +1,10 @@
 """Contributor time series transform."""
 
 import logging
-from datetime import datetime, timezone
+from operator import itemgetter
 
 from backend.services.github_service import fetch_github_stats_api
+from backend.utils.dates import week_str
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +32,7 @@ def fetch_contributor_timeseries(owner, repo):
             if not isinstance(w, dict):
                 continue
             ts = w.get("w", 0)
-            date_str = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+            date_str = week_str(ts)
             weeks.append({
                 "week": date_str,
                 "commits": w.get("c", 0),
@@ -46,5 +47,5 @@ def fetch_contributor_timeseries(owner, repo):
             "weeks": weeks,
         })
 
-    contributors.sort(key=lambda c: c["total"], reverse=True)
+    contributors.sort(key=itemgetter("total"), reverse=True)
     return contributors
@@ -0,0 +1,364 @@
+"""Pooled HTTP client for the GitHub REST/GraphQL API (falls back to gh CLI)."""
+
+import logging
+import os
+import subprocess
+import threading
+import time
+
+import orjson
+import requests
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from backend.config import get_config
+from backend.services.github_service import TransientGitHubError, run_gh_command
+
+logger = logging.getLogger(__name__)
+
+API_URL = "https://api.github.com"
+
+_TRANSIENT_STATUSES = (429, 502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+_token = None
+_token_loaded = False
+
+# Last X-RateLimit-* headers seen per resource ("core", "search",
+# "graphql"): resource -> (remaining, limit, reset epoch seconds). Requests
+# pause until the reset once a bucket drops below its reserve.
+_rate_limits = {}
+_rate_lock = threading.Lock()
+_config = get_config()
+RATE_LIMIT_RESERVE = _config.get("rate_limit_min_remaining", 50)
+RATE_LIMIT_MAX_WAIT = _config.get("rate_limit_max_wait_seconds", 60)
+
+# Conditional-request cache: request key -> (etag, raw body). 304 responses
+# don't count against the primary rate limit and carry no body.
+_etag_store = LRUCache(maxsize=512)
+_etag_lock = threading.Lock()
+
+
+def _load_token():
+    """Resolve a GitHub token once: GH_TOKEN / GITHUB_TOKEN, else `gh auth token`."""
+    token = os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN")
+    if token:
+        return token.strip()
+    try:
+        result = subprocess.run(
+            ["gh", "auth", "token"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout.strip() or None
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        logger.warning(f"No GitHub token available, falling back to gh CLI: {e}")
+        return None
+
+
+def get_token():
+    """Return the cached GitHub token, or None when only the gh CLI can be used."""
+    global _token, _token_loaded
+    if not _token_loaded:
+        with _session_lock:
+            if not _token_loaded:
+                _token = _load_token()
+                _token_loaded = True
+    return _token
+
+
+def has_token():
+    """True if direct HTTP access to the GitHub API is available."""
+    return get_token() is not None
+
+
+def get_session():
+    """Return the process-wide keep-alive session (created on first use)."""
+    global _session
+    if _session is None:
+        token = get_token()
+        with _session_lock:
+            if _session is None:
+                retry = Retry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=_TRANSIENT_STATUSES,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=retry)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.headers.update({
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                })
+                if token:
+                    session.headers["Authorization"] = f"Bearer {token}"
+                _session = session
+    return _session
+
+
+def _rate_resource(path):
+    """Rate-limit bucket a request path is charged to."""
+    if path == "graphql":
+        return "graphql"
+    if path.startswith("search/"):
+        return "search"
+    return "core"
+
+
+def _record_rate_limit(resource, headers):
+    try:
+        remaining = int(headers["X-RateLimit-Remaining"])
+        reset = int(headers["X-RateLimit-Reset"])
+        limit = int(headers.get("X-RateLimit-Limit") or 0)
+    except (KeyError, TypeError, ValueError):
+        return
+    resource = headers.get("X-RateLimit-Resource") or resource
+    with _rate_lock:
+        _rate_limits[resource] = (remaining, limit, reset)
+
+
+def _throttle(resource):
+    """Hold off while resource's bucket is below its reserve, until it resets.
+
+    The reserve is RATE_LIMIT_RESERVE, capped at a tenth of the bucket so
+    small buckets (search: 30/min) aren't always "low". Waits longer than
+    RATE_LIMIT_MAX_WAIT are skipped while calls remain; an empty bucket
+    raises TransientGitHubError instead of stalling the request.
+    """
+    with _rate_lock:
+        state = _rate_limits.get(resource)
+    if state is None:
+        return
+    remaining, limit, reset = state
+    reserve = min(RATE_LIMIT_RESERVE, limit // 10) if limit else RATE_LIMIT_RESERVE
+    if remaining >= reserve:
+        return
+    wait = reset - time.time()
+    if wait <= 0:
+        return
+    if wait <= RATE_LIMIT_MAX_WAIT:
+        logger.warning(f"GitHub {resource} rate limit low ({remaining} left), waiting {wait:.0f}s for reset")
+        time.sleep(wait)
+    elif remaining <= 0:
+        raise TransientGitHubError(f"GitHub {resource} rate limit exhausted, resets in {wait:.0f}s")
+
+
+def _rate_limited_wait(resp):
+    """Seconds to wait before retrying a rate-limited 403/429, else None."""
+    if resp.status_code not in (403, 429):
+        return None
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            return None
+    if resp.headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            return max(0.0, int(resp.headers["X-RateLimit-Reset"]) - time.time())
+        except (KeyError, ValueError):
+            return None
+    return None
+
+
+def api_request(method, path, params=None, json_body=None, headers=None):
+    """Send a request to the GitHub API and return the raw response.
+
+    Paces itself on the X-RateLimit-* headers (see _throttle) and retries a
+    primary or secondary rate-limit rejection once after waiting out its
+    reset / Retry-After, if that is within RATE_LIMIT_MAX_WAIT.
+
+    Raises TransientGitHubError for connection failures, rate limiting and
+    429/5xx responses that survived the adapter's retries, RuntimeError for
+    other 4xx errors.
+    """
+    url = path if path.startswith("http") else f"{API_URL}/{path.lstrip('/')}"
+    resource = _rate_resource(url[len(API_URL) + 1:] if url.startswith(API_URL) else url)
+    data = None
+    if json_body is not None:
+        data = orjson.dumps(json_body)
+        headers = {**(headers or {}), "Content-Type": "application/json"}
+
+    _throttle(resource)
+    for attempt in range(2):
+        try:
+            resp = get_session().request(method, url, params=params, data=data, headers=headers, timeout=30)
+        except requests.RequestException as e:
+            raise TransientGitHubError(f"GitHub API request failed: {e}")
+        _record_rate_limit(resource, resp.headers)
+
+        wait = _rate_limited_wait(resp)
+        if wait is None:
+            break
+        if attempt or wait > RATE_LIMIT_MAX_WAIT:
+            raise TransientGitHubError(f"GitHub API rate limited: HTTP {resp.status_code} {path}")
+        logger.warning(f"GitHub API rate limited on {path}, retrying in {wait:.0f}s")
+        time.sleep(wait)
+
+    if resp.status_code in _TRANSIENT_STATUSES:
+        raise TransientGitHubError(f"GitHub API request failed: HTTP {resp.status_code} {path}")
+    if resp.status_code >= 400:
+        raise RuntimeError(f"GitHub API request failed: HTTP {resp.status_code} {path}: {resp.text[:300]}")
+    return resp
+
+
+def _etag_key(path, params):
+    return (path, tuple(sorted((params or {}).items())))
+
+
+def project_fields(data, fields):
+    """Pick fields out of a decoded payload in Python (replaces `gh api --jq`).
+
+    fields is a list of key names, or a dict mapping output keys to dotted
+    source paths (e.g. {"login": "user.login"}). A list payload is projected
+    element-wise; missing keys/paths yield None.
+    """
+    if isinstance(fields, dict):
+        spec = [(out, src.split(".")) for out, src in fields.items()]
+    else:
+        spec = [(name, [name]) for name in fields]
+
+    def pick(item):
+        row = {}
+        for out, path in spec:
+            value = item
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            row[out] = value
+        return row
+
+    if data is None:
+        return None
+    if isinstance(data, list):
+        return [pick(item) for item in data]
+    return pick(data)
+
+
+def gh_get(path, params=None, use_etag=True, project=None):
+    """GET a GitHub API path and return the decoded JSON body.
+
+    Uses the pooled session when a token is available, otherwise shells out
+    to `gh api` so behaviour is unchanged on machines without a token. With
+    use_etag, the last ETag for the same path+params is sent as
+    If-None-Match and a 304 is answered from the stored body. project is
+    passed to project_fields() to trim the result.
+    """
+    data = _get_json(path, params, use_etag)
+    return project_fields(data, project) if project is not None else data
+
+
+def gh_iter_all(path, params=None, per_page=100):
+    """Yield the items of every page of a list endpoint as each page arrives.
+
+    Pages are walked with per_page/page until a short page comes back (the
+    `gh api --paginate` equivalent), each through gh_get's ETag cache. Only
+    one decoded page is held at a time, so callers that keep a single field
+    per item never hold the full payload.
+    """
+    page = 1
+    while True:
+        batch = _get_json(path, {**(params or {}), "per_page": per_page, "page": page}, True)
+        if not isinstance(batch, list):
+            return
+        yield from batch
+        if len(batch) < per_page:
+            return
+        page += 1
+
+
+def gh_get_all(path, params=None, project=None, per_page=100):
+    """GET every page of a list endpoint and return the concatenated items."""
+    items = list(gh_iter_all(path, params, per_page))
+    return project_fields(items, project) if project is not None else items
+
+
+def conditional_get(path, params=None):
+    """GET over the pooled session with If-None-Match; returns (status, body).
+
+    The ETag and body of each 200 are stored, and a later 304 is answered
+    as (200, stored body). Other statuses (e.g. a stats endpoint's 202) pass
+    through untouched. Requires a token (see has_token()).
+    """
+    key = _etag_key(path, params)
+    with _etag_lock:
+        stored = _etag_store.get(key)
+    headers = {"If-None-Match": stored[0]} if stored else None
+
+    resp = api_request("GET", path, params=params, headers=headers)
+    if resp.status_code == 304 and stored:
+        return 200, stored[1]
+    etag = resp.headers.get("ETag")
+    if etag and resp.status_code == 200:
+        with _etag_lock:
+            _etag_store[key] = (etag, resp.content)
+    return resp.status_code, resp.content
+
+
+def _get_json(path, params, use_etag):
+    if has_token():
+        if use_etag:
+            status, body = conditional_get(path, params)
+        else:
+            resp = api_request("GET", path, params=params)
+            status, body = resp.status_code, resp.content
+        if status == 204 or not body:
+            return None
+        return orjson.loads(body)
+
+    args = ["api", "-X", "GET", path]
+    for key, value in (params or {}).items():
+        args.extend(["-f", f"{key}={value}"])
+    output = run_gh_command(args, raw=True)
+    return None if not output or output.isspace() else orjson.loads(output)
+
+
+def gh_post(path, json_body):
+    """POST a JSON body to a GitHub API path and return the decoded response.
+
+    Uses the pooled session when a token is available (urllib3 never
+    retries a POST), otherwise pipes the body to `gh api --method POST`.
+    Failures raise RuntimeError.
+    """
+    if has_token():
+        resp = api_request("POST", path, json_body=json_body)
+        return orjson.loads(resp.content) if resp.content else None
+
+    try:
+        result = subprocess.run(
+            ["gh", "api", path, "--method", "POST", "--input", "-"],
+            input=orjson.dumps(json_body),
+            capture_output=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"GitHub API request failed: {e.stderr.decode(errors='replace')[:300]}")
+    return orjson.loads(result.stdout) if result.stdout.strip() else None
+
+
+def gh_graphql(query, variables=None):
+    """Run a GraphQL query and return its `data` object.
+
+    Partial results are returned as-is (e.g. an aliased pullRequest that
+    does not exist comes back as None); a response with errors and no data
+    raises RuntimeError.
+    """
+    if has_token():
+        resp = api_request("POST", "graphql", json_body={"query": query, "variables": variables or {}})
+        payload = orjson.loads(resp.content)
+    else:
+        args = ["api", "graphql", "-f", f"query={query}"]
+        for key, value in (variables or {}).items():
+            flag = "-F" if isinstance(value, (int, bool)) else "-f"
+            args.extend([flag, f"{key}={value}"])
+        output = run_gh_command(args, raw=True)
+        payload = {} if not output or output.isspace() else orjson.loads(output)
+
+    data = payload.get("data")
+    if not data and payload.get("errors"):
+        raise RuntimeError(f"GraphQL query failed: {payload['errors']}")
+    return data or {}
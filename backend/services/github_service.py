@@ -1,10 +1,13 @@
 """GitHub CLI wrapper: run_command, parse_json, fetch_stats_api (202-retry)."""
 
-import json
 import logging
+import random
+import re
 import subprocess
 import time
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
@@ -27,9 +30,13 @@ def is_transient_gh_error(message):
     return any(err in message for err in _TRANSIENT_ERRORS)
 
 
-def run_gh_command(args, check=True, max_retries=3, retry_delay=1):
+def run_gh_command(args, check=True, max_retries=3, retry_delay=1, raw=False):
     """Run a gh CLI command and return the output.
 
+    Output is captured as bytes. By default it is decoded and stripped; pass
+    raw=True to get the undecoded stdout bytes, which parse_json_output /
+    orjson accept directly (avoids a full decode + strip copy of large JSON).
+
     Retries automatically on transient HTTP/2 stream errors and 5xx responses
     with exponential backoff (retry_delay, 2x, 4x, ...). If all retries are
     exhausted on a transient error, raises TransientGitHubError so callers can
@@ -40,12 +47,13 @@ def run_gh_command(args, check=True, max_retries=3, retry_delay=1):
             result = subprocess.run(
                 ["gh"] + args,
                 capture_output=True,
-                text=True,
                 check=check,
             )
-            return result.stdout.strip()
+            if raw:
+                return result.stdout
+            return result.stdout.decode("utf-8", errors="replace").strip()
         except subprocess.CalledProcessError as e:
-            stderr = e.stderr or ""
+            stderr = (e.stderr or b"").decode("utf-8", errors="replace")
             transient = is_transient_gh_error(stderr)
             if attempt < max_retries and transient:
                 backoff = retry_delay * (2 ** attempt)
@@ -60,148 +68,491 @@ def run_gh_command(args, check=True, max_retries=3, retry_delay=1):
 
 
 def parse_json_output(output):
-    """Parse JSON output from gh CLI."""
-    if not output:
+    """Parse JSON output (str or bytes) from gh CLI."""
+    if not output or output.isspace():
         return []
     try:
-        return json.loads(output)
-    except json.JSONDecodeError:
+        return orjson.loads(output)
+    except orjson.JSONDecodeError:
         return []
 
 
-def fetch_github_stats_api(owner, repo, endpoint, jq_query=None, max_retries=3, retry_delay=2):
+def _stats_backoff(retry_delay, attempt):
+    """Exponential backoff with jitter for 202 polling, capped at 30s."""
+    return min(retry_delay * (2 ** attempt), 30) + random.uniform(0, 0.3)
+
+
+# Status line of `gh api -i` output, e.g. b"HTTP/2.0 202 Accepted".
+_STATUS_LINE_RE = re.compile(rb"^HTTP/[\d.]+ (\d{3})", re.M)
+
+
+def _gh_api_with_status(path):
+    """Run `gh api -i` once and return (status_code, body_bytes).
+
+    The -i output is the status line and headers, a blank line, then the body,
+    so one call yields both the status and the payload. The status is read
+    from the first 512 bytes only, never by scanning the body.
+    """
+    result = subprocess.run(["gh", "api", path, "-i"], capture_output=True, check=False)
+    out = result.stdout
+    sep = out.find(b"\r\n\r\n")
+    body = out[sep + 4:] if sep != -1 else out.partition(b"\n\n")[2]
+    match = _STATUS_LINE_RE.search(out, 0, 512)
+    status = int(match.group(1)) if match else None
+    if status is None or status >= 400:
+        stderr = result.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(f"gh command failed: {stderr or status}")
+    return status, body
+
+
+def fetch_github_stats_api(owner, repo, endpoint, transform=None, max_retries=3, retry_delay=2):
     """Fetch data from GitHub's stats API with 202-retry logic.
 
     GitHub stats endpoints return 202 while computing results. This helper
-    retries with a delay until data is ready or max retries are exhausted.
+    re-issues the same request with exponential backoff plus jitter until
+    data is ready or max retries are exhausted. Each attempt is a single
+    request: the status comes off the pooled HTTP session, or from the
+    header block of `gh api -i` when no token is available. `transform` is
+    an optional callable applied to the decoded payload (replaces the old
+    --jq filters). Over HTTP the request is conditional, so an unchanged
+    result is a body-less 304 answered from the stored copy.
     """
+    from backend.services.github_http import conditional_get, has_token
+
+    path = f"repos/{owner}/{repo}/{endpoint}"
+    use_http = has_token()
+
     for attempt in range(max_retries):
+        last_attempt = attempt == max_retries - 1
         try:
-            result = subprocess.run(
-                ["gh", "api", f"repos/{owner}/{repo}/{endpoint}", "-i"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            if use_http:
+                status, body = conditional_get(path)
+            else:
+                status, body = _gh_api_with_status(path)
 
-            if "HTTP/2.0 202" in result.stdout or "202 Accepted" in result.stdout:
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    continue
-                else:
+            if status == 202:
+                if last_attempt:
                     return []
+                time.sleep(_stats_backoff(retry_delay, attempt))
+                continue
 
-            args = ["api", f"repos/{owner}/{repo}/{endpoint}"]
-            if jq_query:
-                args.extend(["--jq", jq_query])
-
-            output = run_gh_command(args)
-            parsed = parse_json_output(output)
+            parsed = parse_json_output(body)
+            if parsed and transform:
+                parsed = transform(parsed)
             if parsed:
                 return parsed
 
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                continue
+        except (RuntimeError, ValueError):
+            if last_attempt:
+                return []
 
-        except RuntimeError:
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                continue
-            return []
+        if not last_attempt:
+            time.sleep(_stats_backoff(retry_delay, attempt))
 
     return []
 
 
-def fetch_pr_state(owner, repo, pr_number):
-    """Fetch the current state of a PR from GitHub.
+# Aliased pullRequest lookups per GraphQL request; keeps well under node limits.
+PR_STATE_BATCH_SIZE = 50
+
+
+def fetch_pr_states_and_shas(owner, repo, numbers):
+    """Fetch state and head SHA for many PRs of one repo via batched GraphQL.
+
+    Each batch of up to PR_STATE_BATCH_SIZE numbers is a single request with
+    one aliased `pullRequest(number:)` field per PR.
 
     Returns:
-        str: PR state (OPEN, CLOSED, or MERGED), or None on error.
+        dict: {pr_number: (state, head_sha)}. PRs that could not be fetched
+        are omitted.
     """
-    try:
-        output = run_gh_command([
-            "pr", "view", str(pr_number),
-            "-R", f"{owner}/{repo}",
-            "--json", "state",
-            "--jq", ".state"
-        ])
-        return output.strip().upper() if output else None
-    except RuntimeError as e:
-        logger.warning(f"Failed to fetch PR state for {owner}/{repo}#{pr_number}: {e}")
-        return None
+    from backend.services.github_http import gh_graphql
+
+    numbers = sorted({int(n) for n in numbers})
+    results = {}
+    for i in range(0, len(numbers), PR_STATE_BATCH_SIZE):
+        batch = numbers[i:i + PR_STATE_BATCH_SIZE]
+        fields = " ".join(f"pr{n}: pullRequest(number: {n}) {{ state headRefOid }}" for n in batch)
+        query = f"query($o: String!, $r: String!) {{ repository(owner: $o, name: $r) {{ {fields} }} }}"
+        try:
+            data = gh_graphql(query, {"o": owner, "r": repo})
+        except (RuntimeError, ValueError) as e:
+            logger.warning(f"Failed to fetch PR states/SHAs for {owner}/{repo} {batch}: {e}")
+            continue
+        repository = data.get("repository") or {}
+        for n in batch:
+            node = repository.get(f"pr{n}")
+            if node:
+                results[n] = ((node.get("state") or "").upper() or None, node.get("headRefOid") or None)
+    return results
+
+
+def fetch_pr_state_and_sha(owner, repo, pr_number):
+    """Fetch PR state and head SHA in a single request.
+
+    Thin wrapper over fetch_pr_states_and_shas for single-PR callers.
+
+    Returns:
+        tuple: (state, head_sha) - either may be None on error.
+    """
+    return fetch_pr_states_and_shas(owner, repo, [pr_number]).get(int(pr_number), (None, None))
 
 
 def fetch_pr_head_sha(owner, repo, pr_number):
     """Fetch the current head commit SHA of a PR from GitHub."""
-    try:
-        output = run_gh_command([
-            "pr", "view", str(pr_number),
-            "-R", f"{owner}/{repo}",
-            "--json", "headRefOid",
-            "--jq", ".headRefOid"
-        ])
-        return output.strip() if output else None
-    except RuntimeError as e:
-        logger.warning(f"Failed to fetch PR head SHA for {owner}/{repo}#{pr_number}: {e}")
-        return None
+    return fetch_pr_state_and_sha(owner, repo, pr_number)[1]
+
+
+_STATUS_ROLLUP_FIELDS = """
+        commits(last: 1) {
+          nodes {
+            commit {
+              statusCheckRollup {
+                contexts(first: 100) {
+                  nodes {
+                    __typename
+                    ... on CheckRun {
+                      name status conclusion startedAt completedAt detailsUrl
+                      checkSuite { workflowRun { workflow { name } } }
+                    }
+                    ... on StatusContext { context state targetUrl description createdAt }
+                  }
+                }
+              }
+            }
+          }
+        }"""
 
+_QUEUE_PR_FIELDS = """state headRefOid reviewDecision isDraft
+        reviews(first: 100) { nodes { author { login avatarUrl } state submittedAt } }""" + _STATUS_ROLLUP_FIELDS
 
-def fetch_pr_state_and_sha(owner, repo, pr_number):
-    """Fetch PR state and head SHA in a single gh call.
+EMPTY_QUEUE_DATA = {
+    "state": None, "headRefOid": None, "reviewDecision": None,
+    "statusCheckRollup": None, "isDraft": False, "reviews": None,
+}
+
+
+def fetch_prs_queue_data(owner, repo, numbers):
+    """Fetch merge-queue data for many PRs of one repo via batched GraphQL.
+
+    Each batch of up to PR_STATE_BATCH_SIZE numbers is a single request with
+    one aliased `pullRequest(number:)` field per PR, so a queue costs one
+    round trip per repo instead of a `gh pr view` per item. Uses 'reviews'
+    (full history) instead of 'latestReviews' so the caller can compute the
+    effective blocking state even when a re-review is requested.
 
     Returns:
-        tuple: (state, head_sha) - either may be None on error.
+        dict: {pr_number: {state, headRefOid, reviewDecision, statusCheckRollup,
+        isDraft, reviews}}, shaped like `gh pr view --json`. PRs that could not
+        be fetched are omitted.
     """
-    try:
-        output = run_gh_command([
-            "pr", "view", str(pr_number),
-            "-R", f"{owner}/{repo}",
-            "--json", "state,headRefOid",
-        ])
-        data = parse_json_output(output)
-        if isinstance(data, dict):
-            state = data.get("state", "").upper() or None
-            sha = data.get("headRefOid") or None
-            return state, sha
-        return None, None
-    except RuntimeError as e:
-        logger.warning(f"Failed to fetch PR state/SHA for {owner}/{repo}#{pr_number}: {e}")
-        return None, None
-
-
-def fetch_pr_queue_data(owner, repo, pr_number):
-    """Fetch PR state, head SHA, review decision, CI status, and all reviews in a single gh call.
-
-    Used by merge queue enrichment to avoid multiple API calls per item.
-    Uses 'reviews' (full history) instead of 'latestReviews' so the caller
-    can compute the effective blocking state even when a re-review is requested.
+    from backend.services.github_http import gh_graphql
+
+    numbers = sorted({int(n) for n in numbers})
+    results = {}
+    for i in range(0, len(numbers), PR_STATE_BATCH_SIZE):
+        batch = numbers[i:i + PR_STATE_BATCH_SIZE]
+        fields = " ".join(f"pr{n}: pullRequest(number: {n}) {{ {_QUEUE_PR_FIELDS} }}" for n in batch)
+        query = f"query($o: String!, $r: String!) {{ repository(owner: $o, name: $r) {{ {fields} }} }}"
+        try:
+            data = gh_graphql(query, {"o": owner, "r": repo})
+        except (RuntimeError, ValueError) as e:
+            logger.warning(f"Failed to fetch PR queue data for {owner}/{repo} {batch}: {e}")
+            continue
+        repository = data.get("repository") or {}
+        for n in batch:
+            node = repository.get(f"pr{n}")
+            if node:
+                results[n] = {
+                    "state": (node.get("state") or "").upper() or None,
+                    "headRefOid": node.get("headRefOid") or None,
+                    "reviewDecision": node.get("reviewDecision") or None,
+                    "statusCheckRollup": _normalize_status_rollup(node) or None,
+                    "isDraft": node.get("isDraft", False),
+                    "reviews": (node.get("reviews") or {}).get("nodes") or None,
+                }
+    return results
+
+
+# Every field of PR_JSON_FIELDS (the `gh pr list/view --json` set), as GraphQL
+_PR_LIST_FIELDS = """
+        number title state isDraft createdAt updatedAt closedAt mergedAt url body
+        headRefName baseRefName reviewDecision mergeable additions deletions changedFiles
+        author { login avatarUrl }
+        labels(first: 100) { nodes { id name description color } }
+        assignees(first: 100) { nodes { id login name avatarUrl } }
+        reviewRequests(first: 100) {
+          nodes {
+            requestedReviewer {
+              __typename
+              ... on User { login }
+              ... on Bot { login }
+              ... on Mannequin { login }
+              ... on Team { name slug }
+            }
+          }
+        }
+        reviews(first: 100) {
+          nodes { id author { login avatarUrl } authorAssociation body submittedAt state commit { oid } }
+        }
+        milestone { number title description dueOn }""" + _STATUS_ROLLUP_FIELDS
+
+_PR_SEARCH_QUERY = """
+query($q: String!, $first: Int!, $after: String) {
+  search(query: $q, type: ISSUE, first: $first, after: $after) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest {""" + _PR_LIST_FIELDS + """
+      }
+    }
+  }
+}
+"""
+
+_PR_BY_NUMBER_QUERY = """
+query($o: String!, $r: String!, $n: Int!) {
+  repository(owner: $o, name: $r) {
+    pullRequest(number: $n) {""" + _PR_LIST_FIELDS + """
+    }
+  }
+}
+"""
+
+
+def _normalize_search_pr(node):
+    """Flatten a GraphQL PullRequest node into the shape `gh pr list --json` emits."""
+    pr = {k: v for k, v in node.items() if k not in ("labels", "assignees", "reviewRequests", "reviews", "commits")}
+    pr["labels"] = (node.get("labels") or {}).get("nodes") or []
+    pr["assignees"] = (node.get("assignees") or {}).get("nodes") or []
+    pr["reviewRequests"] = [
+        r["requestedReviewer"]
+        for r in (node.get("reviewRequests") or {}).get("nodes") or []
+        if r.get("requestedReviewer")
+    ]
+    pr["reviews"] = (node.get("reviews") or {}).get("nodes") or []
+    pr["statusCheckRollup"] = _normalize_status_rollup(node)
+    return pr
+
+
+def _normalize_status_rollup(node):
+    """Flatten a PR node's last-commit check contexts into `gh --json statusCheckRollup` items."""
+    checks = []
+    commits = (node.get("commits") or {}).get("nodes") or []
+    rollup = (commits[0].get("commit") or {}).get("statusCheckRollup") if commits else None
+    for ctx in ((rollup or {}).get("contexts") or {}).get("nodes") or []:
+        if ctx.get("__typename") == "CheckRun":
+            workflow = (((ctx.pop("checkSuite", None) or {}).get("workflowRun") or {}).get("workflow") or {})
+            ctx["workflowName"] = workflow.get("name", "")
+        elif ctx.get("__typename") == "StatusContext":
+            ctx["startedAt"] = ctx.pop("createdAt", None)
+        checks.append(ctx)
+    return checks
+
+
+def search_prs(query, limit):
+    """Run a PR search through the GraphQL search API.
+
+    Args:
+        query: GitHub search query (see PRFilterBuilder.build_search_query).
+        limit: Maximum number of PRs to return.
 
     Returns:
-        dict with keys: state, headRefOid, reviewDecision, statusCheckRollup, reviews.
-        All values may be None on error.
+        list of PR dicts in the same shape as `gh pr list --json`.
     """
-    empty = {
-        "state": None, "headRefOid": None, "reviewDecision": None,
-        "statusCheckRollup": None, "isDraft": False, "reviews": None,
+    from backend.services.github_http import gh_graphql
+
+    prs = []
+    after = None
+    while len(prs) < limit:
+        variables = {"q": query, "first": min(limit - len(prs), 100)}
+        if after:
+            variables["after"] = after
+        search = gh_graphql(_PR_SEARCH_QUERY, variables).get("search") or {}
+        prs.extend(_normalize_search_pr(n) for n in search.get("nodes") or [] if n)
+        page_info = search.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            break
+        after = page_info.get("endCursor")
+    return prs[:limit]
+
+
+def fetch_pr(owner, repo, pr_number):
+    """Fetch one PR through GraphQL in the shape `gh pr view --json` emits.
+
+    Returns None if the PR does not exist.
+    """
+    from backend.services.github_http import gh_graphql
+
+    data = gh_graphql(_PR_BY_NUMBER_QUERY, {"o": owner, "r": repo, "n": int(pr_number)})
+    node = (data.get("repository") or {}).get("pullRequest")
+    return _normalize_search_pr(node) if node else None
+
+
+_REPO_LIST_FIELDS = """
+    repositories(first: $first, after: $after, ownerAffiliations: OWNER,
+                 orderBy: {field: PUSHED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name owner { id login } description isPrivate updatedAt }
     }
-    try:
-        output = run_gh_command([
-            "pr", "view", str(pr_number),
-            "-R", f"{owner}/{repo}",
-            "--json", "state,headRefOid,reviewDecision,statusCheckRollup,isDraft,reviews",
-        ])
-        data = parse_json_output(output)
-        if isinstance(data, dict):
-            return {
-                "state": data.get("state", "").upper() or None,
-                "headRefOid": data.get("headRefOid") or None,
-                "reviewDecision": data.get("reviewDecision") or None,
-                "statusCheckRollup": data.get("statusCheckRollup") or None,
-                "isDraft": data.get("isDraft", False),
-                "reviews": data.get("reviews") or None,
+"""
+
+_OWNER_REPOS_QUERY = """
+query($owner: String!, $first: Int!, $after: String) {
+  repositoryOwner(login: $owner) {""" + _REPO_LIST_FIELDS + """
+  }
+}
+"""
+
+_VIEWER_REPOS_QUERY = """
+query($first: Int!, $after: String) {
+  viewer {""" + _REPO_LIST_FIELDS + """
+  }
+}
+"""
+
+
+def list_repos(owner, limit):
+    """List an owner's repositories (the viewer's if owner is None) via GraphQL.
+
+    Same fields and order as `gh repo list [owner] --json
+    name,owner,description,isPrivate,updatedAt`.
+    """
+    from backend.services.github_http import gh_graphql
+
+    query, root = (_OWNER_REPOS_QUERY, "repositoryOwner") if owner else (_VIEWER_REPOS_QUERY, "viewer")
+    repos = []
+    after = None
+    while len(repos) < limit:
+        variables = {"first": min(limit - len(repos), 100)}
+        if owner:
+            variables["owner"] = owner
+        if after:
+            variables["after"] = after
+        connection = (gh_graphql(query, variables).get(root) or {}).get("repositories") or {}
+        repos.extend(n for n in connection.get("nodes") or [] if n)
+        page_info = connection.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            break
+        after = page_info.get("endCursor")
+    return repos[:limit]
+
+
+_PR_REVIEWS_QUERY = """
+query($o: String!, $r: String!, $first: Int!, $after: String) {
+  repository(owner: $o, name: $r) {
+    pullRequests(first: $first, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state createdAt mergedAt closedAt updatedAt
+        author { login }
+        reviews(first: 50) { nodes { author { login } submittedAt state } }
+      }
+    }
+  }
+}
+"""
+
+
+def _paginate_pull_requests(query, owner, repo, limit):
+    """Yield up to `limit` repository.pullRequests nodes, 100 per GraphQL page.
+
+    query must take $o, $r, $first and $after and select pageInfo and nodes
+    under repository.pullRequests.
+    """
+    from backend.services.github_http import gh_graphql
+
+    fetched = 0
+    after = None
+    while fetched < limit:
+        variables = {"o": owner, "r": repo, "first": min(limit - fetched, 100)}
+        if after:
+            variables["after"] = after
+        repository = gh_graphql(query, variables).get("repository") or {}
+        connection = repository.get("pullRequests") or {}
+        for node in connection.get("nodes") or []:
+            if node and fetched < limit:
+                fetched += 1
+                yield node
+        page_info = connection.get("pageInfo") or {}
+        if not page_info.get("hasNextPage"):
+            break
+        after = page_info.get("endCursor")
+
+
+def fetch_prs_with_reviews(owner, repo, limit):
+    """Fetch recent PRs (all states) with their reviews in one paginated GraphQL query.
+
+    Replaces `gh pr list` plus one reviews call per PR. Each PR has the
+    `gh pr list --json number,title,createdAt,mergedAt,closedAt,updatedAt,author,state`
+    fields plus `all_reviews` ({login, submitted_at, state}, oldest first),
+    `first_review_at` and `first_reviewer`.
+    """
+    prs = []
+    for node in _paginate_pull_requests(_PR_REVIEWS_QUERY, owner, repo, limit):
+        reviews = [
+            {
+                "login": (review.get("author") or {}).get("login"),
+                "submitted_at": review.get("submittedAt"),
+                "state": review.get("state"),
             }
-        return empty
-    except RuntimeError as e:
-        logger.warning(f"Failed to fetch PR queue data for {owner}/{repo}#{pr_number}: {e}")
-        return empty
+            for review in (node.pop("reviews", None) or {}).get("nodes") or []
+        ]
+        node["author"] = node.get("author") or {}
+        node["all_reviews"] = reviews
+        node["first_review_at"] = reviews[0]["submitted_at"] if reviews else None
+        node["first_reviewer"] = reviews[0]["login"] if reviews else None
+        prs.append(node)
+    return prs
+
+
+_REVIEW_AUTHORS_QUERY = """
+query($o: String!, $r: String!, $first: Int!, $after: String) {
+  repository(owner: $o, name: $r) {
+    pullRequests(first: $first, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { reviews(first: 100) { nodes { author { login avatarUrl } state } } }
+    }
+  }
+}
+"""
+
+
+def iter_recent_reviews(owner, repo, limit):
+    """Yield (login, avatar_url, state) for every review on the `limit` most recent PRs.
+
+    One paginated GraphQL query instead of `gh pr list` plus a REST reviews
+    call per PR, streamed page by page like iter_pr_authors. Reviews by
+    deleted accounts are skipped.
+    """
+    for node in _paginate_pull_requests(_REVIEW_AUTHORS_QUERY, owner, repo, limit):
+        for review in (node.get("reviews") or {}).get("nodes") or []:
+            author = review.get("author") or {}
+            login = author.get("login")
+            if login:
+                yield login, author.get("avatarUrl") or "", (review.get("state") or "").upper()
+
+
+_PR_AUTHORS_QUERY = """
+query($o: String!, $r: String!, $first: Int!, $after: String) {
+  repository(owner: $o, name: $r) {
+    pullRequests(first: $first, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { state author { login avatarUrl } }
+    }
+  }
+}
+"""
+
+
+def iter_pr_authors(owner, repo, limit):
+    """Yield (login, avatar_url, state) for the `limit` most recent PRs (all states).
+
+    Streams page by page (100 PRs per GraphQL request), so callers can
+    aggregate without holding the whole PR list. PRs without an author
+    (deleted accounts) are skipped.
+    """
+    for node in _paginate_pull_requests(_PR_AUTHORS_QUERY, owner, repo, limit):
+        author = node.get("author") or {}
+        login = author.get("login")
+        if login:
+            yield login, author.get("avatarUrl") or "", (node.get("state") or "").upper()
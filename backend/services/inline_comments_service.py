@@ -4,11 +4,13 @@ Supports JSON-first extraction (from content_json) with fallback to
 markdown regex parsing for backward compatibility.
 """
 
-import json
 import logging
 import re
-import subprocess
+from functools import lru_cache
 
+import orjson
+
+from backend.services.github_http import gh_post
 from backend.services.github_service import fetch_pr_head_sha
 
 logger = logging.getLogger(__name__)
@@ -25,6 +27,17 @@ SECTION_DB_COLUMNS = {
     "minor": "minor_issues_posted",
 }
 
+# Markdown parsing patterns, compiled once at import
+_LOC_RE_COLON = re.compile(r'`?([^`:\s]+)`?\s*:\s*(\d+)(?:\s*-\s*(\d+))?')
+_LOC_PATH_RE = re.compile(r'`([^`]+)`')
+_LINE_RANGE_RE = re.compile(r'lines?\s+(\d+)\s*[-\u2013]\s*(\d+)')
+_LINE_SINGLE_RE = re.compile(r'line\s+(\d+)')
+_ISSUE_HEADER_RE = re.compile(r'\*\*(\d+)\.\s*(.+?)\*\*')
+_FIELD_RES = {
+    name: re.compile(rf'-\s*{name}:\s*(.*?)(?=\n-\s*(?:Location|Problem|Fix):|\Z)', re.DOTALL)
+    for name in ("Location", "Problem", "Fix")
+}
+
 # ---------------------------------------------------------------------------
 # JSON-first parsing
 # ---------------------------------------------------------------------------
@@ -69,20 +82,20 @@ def _parse_location(location):
     if not location:
         return None
 
-    loc_match = re.match(r'`?([^`:\s]+)`?\s*:\s*(\d+)(?:\s*-\s*(\d+))?', location)
+    loc_match = _LOC_RE_COLON.match(location)
     if loc_match:
         file_path = loc_match.group(1).strip()
         start_line = int(loc_match.group(2))
         end_line = int(loc_match.group(3)) if loc_match.group(3) else start_line
         return file_path, start_line, end_line
 
-    path_match = re.match(r'`([^`]+)`', location)
+    path_match = _LOC_PATH_RE.match(location)
     if path_match:
         file_path = path_match.group(1).strip()
-        line_match = re.search(r'lines?\s+(\d+)\s*[-\u2013]\s*(\d+)', location)
+        line_match = _LINE_RANGE_RE.search(location)
         if line_match:
             return file_path, int(line_match.group(1)), int(line_match.group(2))
-        line_match = re.search(r'line\s+(\d+)', location)
+        line_match = _LINE_SINGLE_RE.search(location)
         if line_match:
             line_num = int(line_match.group(1))
             return file_path, line_num, line_num
@@ -94,16 +107,22 @@ def _parse_location(location):
 
 def _extract_issue_field(content, field_name):
     """Extract a field's full content from an issue block."""
-    pattern = re.compile(
-        rf'-\s*{field_name}:\s*(.*?)(?=\n-\s*(?:Location|Problem|Fix):|\Z)',
-        re.DOTALL
-    )
-    match = pattern.search(content)
+    match = _FIELD_RES[field_name].search(content)
     if match:
         return match.group(1).strip()
     return None
 
 
+@lru_cache(maxsize=16)
+def _section_re(section_heading):
+    """Compiled pattern capturing the body of a bold-headed section."""
+    escaped_heading = re.escape(section_heading)
+    return re.compile(
+        rf'\*\*{escaped_heading}\*\*\s*(.*?)(?=\n---|\n\*\*[A-Z]|\Z)',
+        re.DOTALL | re.IGNORECASE
+    )
+
+
 def parse_section_issues(content, section_heading):
     """Parse issues from a named section in review markdown content.
 
@@ -119,54 +138,62 @@ def parse_section_issues(content, section_heading):
     if not content:
         return issues
 
-    escaped_heading = re.escape(section_heading)
-    section_match = re.search(
-        rf'\*\*{escaped_heading}\*\*\s*(.*?)(?=\n---|\n\*\*[A-Z]|\Z)',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
+    # Most reviews lack a given section; a substring test is far cheaper than
+    # a regex miss. The exact-case check covers the usual heading, the
+    # lowered one keeps parity with the IGNORECASE pattern.
+    heading = f"**{section_heading}**"
+    if heading not in content and heading.lower() not in content.lower():
+        return issues
+
+    section_match = _section_re(section_heading).search(content)
 
     if not section_match:
         return issues
 
     section_text = section_match.group(1)
-    issue_headers = list(re.finditer(r'\*\*(\d+)\.\s*(.+?)\*\*', section_text))
 
-    for idx, header_match in enumerate(issue_headers):
-        title = header_match.group(2).strip()
+    # Stream the headers: each issue runs from its header to the next one
+    # (or the end of the section), so only the previous match is held.
+    prev = None
+    for header_match in _ISSUE_HEADER_RE.finditer(section_text):
+        if prev is not None:
+            _append_issue(issues, prev, section_text[prev.end():header_match.start()])
+        prev = header_match
+    if prev is not None:
+        _append_issue(issues, prev, section_text[prev.end():])
 
-        start = header_match.end()
-        end = issue_headers[idx + 1].start() if idx + 1 < len(issue_headers) else len(section_text)
-        issue_content = section_text[start:end]
+    return issues
 
-        location = _extract_issue_field(issue_content, 'Location')
-        problem = _extract_issue_field(issue_content, 'Problem')
-        fix = _extract_issue_field(issue_content, 'Fix')
 
-        if not location:
-            continue
+def _append_issue(issues, header_match, issue_content):
+    """Parse one issue block and append it to issues if it has a usable location."""
+    title = header_match.group(2).strip()
 
-        parsed = _parse_location(location)
-        if not parsed:
-            continue
+    location = _extract_issue_field(issue_content, 'Location')
+    if not location:
+        return
 
-        file_path, start_line, end_line = parsed
+    parsed = _parse_location(location)
+    if not parsed:
+        return
 
-        body_parts = [f"**{title}**"]
-        if problem:
-            body_parts.append(f"\n**Problem:** {problem}")
-        if fix:
-            body_parts.append(f"\n**Fix:** {fix}")
+    file_path, start_line, end_line = parsed
+    problem = _extract_issue_field(issue_content, 'Problem')
+    fix = _extract_issue_field(issue_content, 'Fix')
 
-        issues.append({
-            "title": title,
-            "path": file_path,
-            "start_line": start_line,
-            "end_line": end_line,
-            "body": "\n".join(body_parts)
-        })
+    body_parts = [f"**{title}**"]
+    if problem:
+        body_parts.append(f"\n**Problem:** {problem}")
+    if fix:
+        body_parts.append(f"\n**Fix:** {fix}")
 
-    return issues
+    issues.append({
+        "title": title,
+        "path": file_path,
+        "start_line": start_line,
+        "end_line": end_line,
+        "body": "\n".join(body_parts)
+    })
 
 
 def parse_critical_issues(content):
@@ -182,19 +209,18 @@ def _post_file_comment(owner, repo_name, pr_number, commit_sha, issue):
         "body": issue["body"],
         "subject_type": "file"
     }
-    result = subprocess.run(
-        [
-            "gh", "api",
-            f"repos/{owner}/{repo_name}/pulls/{pr_number}/comments",
-            "--method", "POST",
-            "--input", "-"
-        ],
-        input=json.dumps(comment_body),
-        capture_output=True,
-        text=True,
-        check=True
-    )
-    return result
+    return gh_post(f"repos/{owner}/{repo_name}/pulls/{pr_number}/comments", comment_body)
+
+
+def _review_section_issues(review, section):
+    """Issues of one section of a stored review, parsed from its content_json."""
+    content_json_str = review.get("content_json")
+    if not content_json_str:
+        return []
+    try:
+        return parse_section_issues_from_json(orjson.loads(content_json_str), section)
+    except (orjson.JSONDecodeError, TypeError):
+        return []
 
 
 def preview_section_issues(reviews_db, review_id, section="critical"):
@@ -217,14 +243,7 @@ def preview_section_issues(reviews_db, review_id, section="critical"):
     if not review:
         return {"error": "Review not found"}, 404
 
-    issues = []
-    content_json_str = review.get("content_json")
-    if content_json_str:
-        try:
-            content_json = json.loads(content_json_str)
-            issues = parse_section_issues_from_json(content_json, section)
-        except (json.JSONDecodeError, TypeError):
-            pass
+    issues = _review_section_issues(review, section)
 
     if not issues:
         return {"error": f"No {section_heading.lower()} found in review content", "issues": []}, 400
@@ -274,15 +293,7 @@ def post_inline_comments(reviews_db, review_id, section="critical", selected_ind
     if review.get(db_column):
         return {"error": f"{section_heading} have already been posted for this review"}, 409
 
-    # JSON-first: parse from content_json, fall back to markdown regex
-    all_issues = []
-    content_json_str = review.get("content_json")
-    if content_json_str:
-        try:
-            content_json = json.loads(content_json_str)
-            all_issues = parse_section_issues_from_json(content_json, section)
-        except (json.JSONDecodeError, TypeError):
-            pass
+    all_issues = _review_section_issues(review, section)
 
     if not all_issues:
         return {"error": f"No {section_heading.lower()} found in review content", "issues_found": 0}, 400
@@ -342,22 +353,11 @@ def post_inline_comments(reviews_db, review_id, section="critical", selected_ind
         }
 
         try:
-            result = subprocess.run(
-                [
-                    "gh", "api",
-                    f"repos/{owner}/{repo_name}/pulls/{pr_number}/reviews",
-                    "--method", "POST",
-                    "--input", "-"
-                ],
-                input=json.dumps(review_body),
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            gh_post(f"repos/{owner}/{repo_name}/pulls/{pr_number}/reviews", review_body)
             logger.info(f"Posted {len(line_issues)} line-level comments for review {review_id}")
             posted_count += len(line_issues)
-        except subprocess.CalledProcessError as e:
-            logger.warning(f"Batch line-level comments failed: {e.stderr[:200]}")
+        except RuntimeError as e:
+            logger.warning(f"Batch line-level comments failed: {str(e)[:200]}")
             # Fall back to individual file-level comments for these too
             for issue in line_issues:
                 issue_with_lines = dict(issue)
@@ -374,19 +374,8 @@ def post_inline_comments(reviews_db, review_id, section="critical", selected_ind
                     "event": "COMMENT",
                     "body": f"**Code Review {section_heading}** ({len(issues)} issue(s) flagged)"
                 }
-                subprocess.run(
-                    [
-                        "gh", "api",
-                        f"repos/{owner}/{repo_name}/pulls/{pr_number}/reviews",
-                        "--method", "POST",
-                        "--input", "-"
-                    ],
-                    input=json.dumps(summary_body),
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-            except subprocess.CalledProcessError:
+                gh_post(f"repos/{owner}/{repo_name}/pulls/{pr_number}/reviews", summary_body)
+            except RuntimeError:
                 pass  # Non-critical, continue posting individual comments
 
         for issue in file_issues:
@@ -394,8 +383,8 @@ def post_inline_comments(reviews_db, review_id, section="critical", selected_ind
                 _post_file_comment(owner, repo_name, pr_number, current_sha, issue)
                 posted_count += 1
                 logger.info(f"Posted file-level comment on {issue['path']} for review {review_id}")
-            except subprocess.CalledProcessError as e:
-                logger.warning(f"Failed to post file comment on {issue['path']}: {e.stderr[:200]}")
+            except RuntimeError as e:
+                logger.warning(f"Failed to post file comment on {issue['path']}: {str(e)[:200]}")
                 errors.append(issue["path"])
 
     if posted_count == 0:
@@ -1,13 +1,19 @@
-"""PR review times fetch (ThreadPoolExecutor) with SQLite cache."""
+"""PR review times fetch (single GraphQL query) with SQLite cache."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor
 
 from backend.config import get_config
-from backend.services.github_service import run_gh_command, parse_json_output
+from backend.services.github_service import fetch_prs_with_reviews
+from backend.visualizers.lifecycle_visualizer import finalize_lifecycle_metrics, precompute_lifecycle_metrics
+from backend.visualizers.responsiveness_visualizer import (
+    finalize_responsiveness_metrics,
+    precompute_responsiveness_metrics,
+)
 
 logger = logging.getLogger(__name__)
 
+REVIEW_SAMPLE_LIMIT = get_config().get("review_sample_limit", 250)
+
 
 def fetch_pr_review_times(owner, repo, lifecycle_cache_db, limit=None):
     """Return cached lifecycle data if available (even stale).
@@ -16,8 +22,7 @@ def fetch_pr_review_times(owner, repo, lifecycle_cache_db, limit=None):
     Callers should check staleness separately and trigger background refresh.
     """
     if limit is None:
-        config = get_config()
-        limit = config.get("review_sample_limit", 250)
+        limit = REVIEW_SAMPLE_LIMIT
 
     repo_key = f"{owner}/{repo}"
     cached = lifecycle_cache_db.get_cached(repo_key)
@@ -27,50 +32,73 @@ def fetch_pr_review_times(owner, repo, lifecycle_cache_db, limit=None):
 
     # No cache at all: must fetch synchronously
     data = fetch_review_times_from_api(owner, repo, limit)
-    lifecycle_cache_db.save_cache(repo_key, data)
+    save_lifecycle_cache(lifecycle_cache_db, repo_key, data)
     return data
 
 
+def _compute_lifecycle_bundle(prs):
+    """Compute the time-independent parts of both metric bundles for the cache."""
+    return {
+        "lifecycle": precompute_lifecycle_metrics(prs),
+        "responsiveness": precompute_responsiveness_metrics(prs),
+    }
+
+
+def _finalize_lifecycle_bundle(bundle):
+    """Derive the now-relative fields (stale PR ages, review wait hours) at read time."""
+    return {
+        "lifecycle": finalize_lifecycle_metrics(bundle["lifecycle"]),
+        "responsiveness": finalize_responsiveness_metrics(bundle["responsiveness"]),
+    }
+
+
+def _is_current_bundle(bundle):
+    # Bundles stored before the split carried frozen stale/bottleneck fields
+    return bool(bundle) and "open_prs" in bundle.get("lifecycle", {})
+
+
+def save_lifecycle_cache(lifecycle_cache_db, repo_key, data):
+    """Store enriched PRs together with their precomputed metric bundles."""
+    lifecycle_cache_db.save_cache(repo_key, data, _compute_lifecycle_bundle(data))
+
+
+def fetch_lifecycle_bundle(owner, repo, lifecycle_cache_db, cached=None, limit=None):
+    """Return the {"lifecycle", "responsiveness"} metric bundles.
+
+    The time-independent aggregates come precomputed from the cache; stale
+    PR ages and review wait hours are derived from stored timestamps on
+    every call, so they keep moving for the cache's whole lifetime.
+    cached is an already-read cache row (saves a second read). Rows written
+    without current bundles are backfilled once; with no cache at all the
+    PRs are fetched synchronously as in fetch_pr_review_times.
+    """
+    repo_key = f"{owner}/{repo}"
+    if cached is None:
+        cached = lifecycle_cache_db.get_cached(repo_key)
+
+    if cached:
+        bundle = cached.get("precomputed")
+        if not _is_current_bundle(bundle):
+            bundle = _compute_lifecycle_bundle(cached["data"])
+            lifecycle_cache_db.save_precomputed(repo_key, bundle)
+        return _finalize_lifecycle_bundle(bundle)
+
+    data = fetch_review_times_from_api(owner, repo, limit)
+    bundle = _compute_lifecycle_bundle(data)
+    lifecycle_cache_db.save_cache(repo_key, data, bundle)
+    return _finalize_lifecycle_bundle(bundle)
+
+
 def fetch_review_times_from_api(owner, repo, limit=None):
-    """Fetch PRs with review timing data directly from the GitHub API."""
+    """Fetch PRs with review timing data directly from the GitHub API.
+
+    One paginated GraphQL query returns the PRs and their reviews together.
+    """
     if limit is None:
-        config = get_config()
-        limit = config.get("review_sample_limit", 250)
+        limit = REVIEW_SAMPLE_LIMIT
 
     try:
-        pr_output = run_gh_command([
-            "pr", "list", "-R", f"{owner}/{repo}",
-            "--state", "all", "--limit", str(limit),
-            "--json", "number,title,createdAt,mergedAt,closedAt,updatedAt,author,state"
-        ])
-        prs = parse_json_output(pr_output) or []
-    except RuntimeError:
-        prs = []
-
-    if not prs:
+        return fetch_prs_with_reviews(owner, repo, limit)
+    except RuntimeError as e:
+        logger.warning(f"Failed to fetch PR review times for {owner}/{repo}: {e}")
         return []
-
-    def fetch_reviews_for_pr(pr):
-        number = pr.get("number")
-        try:
-            output = run_gh_command([
-                "api", f"repos/{owner}/{repo}/pulls/{number}/reviews",
-                "--jq", '[.[] | {login: .user.login, submitted_at: .submitted_at, state: .state}]'
-            ])
-            reviews = parse_json_output(output) or []
-        except RuntimeError:
-            reviews = []
-
-        pr["all_reviews"] = reviews
-        if reviews:
-            pr["first_review_at"] = reviews[0].get("submitted_at")
-            pr["first_reviewer"] = reviews[0].get("login")
-        else:
-            pr["first_review_at"] = None
-            pr["first_reviewer"] = None
-        return pr
-
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        enriched = list(executor.map(fetch_reviews_for_pr, prs))
-
-    return enriched
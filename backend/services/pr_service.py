@@ -4,6 +4,34 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Check outcome lookups for get_ci_status(). A conclusion not listed here
+# means the check has not settled yet; CANCELLED/SKIPPED are not failures —
+# they indicate a superseded or intentionally skipped run.
+_CONCLUSION_OUTCOMES = {
+    "FAILURE": "failure",
+    "TIMED_OUT": "failure",
+    "ACTION_REQUIRED": "failure",
+    "SUCCESS": "success",
+    "CANCELLED": None,
+    "SKIPPED": None,
+    "NEUTRAL": None,
+}
+_STATE_OUTCOMES = {
+    "FAILURE": "failure",
+    "ERROR": "failure",
+    "SUCCESS": "success",
+    "PENDING": "pending",
+}
+_PENDING_STATUSES = frozenset({"IN_PROGRESS", "QUEUED", "WAITING", "PENDING"})
+
+# Review states that decide whether a reviewer is blocking or approving
+_ACTIONABLE_REVIEW_STATES = frozenset({"APPROVED", "CHANGES_REQUESTED"})
+_DECISION_STATUSES = {
+    "CHANGES_REQUESTED": "changes_requested",
+    "APPROVED": "approved",
+    "REVIEW_REQUIRED": "review_required",
+}
+
 
 def get_review_status(review_decision, reviews=None):
     """Determine review status using full reviews history with reviewDecision fallback.
@@ -19,8 +47,6 @@ def get_review_status(review_decision, reviews=None):
     """
     # Compute effective state from full reviews history
     if reviews:
-        has_changes_requested = False
-        has_approved = False
         reviewer_state = {}  # login -> latest actionable state
         for review in reviews:
             author = review.get("author") or {}
@@ -28,33 +54,19 @@ def get_review_status(review_decision, reviews=None):
             if not login:
                 continue
             state = (review.get("state") or "").upper()
-            if state in ("APPROVED", "CHANGES_REQUESTED"):
+            if state in _ACTIONABLE_REVIEW_STATES:
                 reviewer_state[login] = state
 
-        for state in reviewer_state.values():
-            if state == "CHANGES_REQUESTED":
-                has_changes_requested = True
-            elif state == "APPROVED":
-                has_approved = True
-
-        if has_changes_requested:
+        latest_states = set(reviewer_state.values())
+        if "CHANGES_REQUESTED" in latest_states:
             return "changes_requested"
-        if has_approved:
+        if latest_states:
             return "approved"
 
     # Fall back to reviewDecision
     if not review_decision:
         return "pending"
-
-    decision = review_decision.upper()
-
-    if decision == "CHANGES_REQUESTED":
-        return "changes_requested"
-    if decision == "APPROVED":
-        return "approved"
-    if decision == "REVIEW_REQUIRED":
-        return "review_required"
-    return "pending"
+    return _DECISION_STATUSES.get(review_decision.upper(), "pending")
 
 
 def get_current_reviewers(reviews):
@@ -73,8 +85,6 @@ def get_current_reviewers(reviews):
     if not reviews:
         return []
 
-    actionable_states = {"APPROVED", "CHANGES_REQUESTED"}
-
     # Walk reviews in order (oldest first) to find each reviewer's latest actionable state
     reviewer_state = {}  # login -> {avatarUrl, state}
     for review in reviews:
@@ -83,7 +93,7 @@ def get_current_reviewers(reviews):
         if not login:
             continue
         state = (review.get("state") or "").upper()
-        if state not in actionable_states:
+        if state not in _ACTIONABLE_REVIEW_STATES:
             continue
         reviewer_state[login] = {
             "login": login,
@@ -142,38 +152,29 @@ def get_ci_status(status_check_rollup):
     # Deduplicate: only evaluate the latest run per check name
     contexts = _dedupe_checks(contexts)
 
-    has_failure = False
     has_pending = False
     has_success = False
 
     for check in contexts:
-        state = check.get("state", "").upper()
-        conclusion = check.get("conclusion", "").upper() if check.get("conclusion") else None
-        status = check.get("status", "").upper()
-
+        conclusion = check.get("conclusion")
         if conclusion:
-            if conclusion in ("FAILURE", "TIMED_OUT", "ACTION_REQUIRED"):
-                has_failure = True
-            elif conclusion in ("SUCCESS", "CANCELLED", "SKIPPED", "NEUTRAL"):
-                # CANCELLED/SKIPPED are not failures — they indicate a
-                # superseded or intentionally skipped run
-                if conclusion == "SUCCESS":
-                    has_success = True
+            outcome = _CONCLUSION_OUTCOMES.get(conclusion.upper(), "pending")
+        else:
+            state = check.get("state")
+            if state:
+                outcome = _STATE_OUTCOMES.get(state.upper())
             else:
-                has_pending = True
-        elif state:
-            if state == "FAILURE" or state == "ERROR":
-                has_failure = True
-            elif state == "SUCCESS":
-                has_success = True
-            elif state == "PENDING":
-                has_pending = True
-        elif status:
-            if status in ("IN_PROGRESS", "QUEUED", "WAITING", "PENDING"):
-                has_pending = True
-
-    if has_failure:
-        return "failure"
+                status = check.get("status")
+                outcome = "pending" if status and status.upper() in _PENDING_STATUSES else None
+
+        if outcome == "failure":
+            # Failure outranks everything; the remaining checks can't change the result
+            return "failure"
+        if outcome == "pending":
+            has_pending = True
+        elif outcome == "success":
+            has_success = True
+
     if has_pending:
         return "pending"
     if has_success:
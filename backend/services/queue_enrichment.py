@@ -6,19 +6,22 @@ inline-comment counts, current reviewers, etc.
 """
 
 import json
-from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 
 from backend.database import get_queue_db, get_reviews_db
-from backend.services.github_service import fetch_pr_queue_data
+from backend.extensions import gh_executor
+from backend.services.github_service import EMPTY_QUEUE_DATA, fetch_prs_queue_data
 from backend.services.pr_service import get_ci_status, get_current_reviewers, get_review_status
 
 
-def enrich_queue_items(items: List[Dict[str, Any]], max_workers: int = 5) -> List[Dict[str, Any]]:
+def enrich_queue_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Enrich a list of raw merge_queue rows with live PR + review data.
 
     Returned dicts use the same keys the frontend QueueItem expects, so they can be
-    rendered identically in the merge queue panel and the swimlane board.
+    rendered identically in the merge queue panel and the swimlane board. Live PR
+    data is fetched up front with one batched GraphQL request per repository
+    (repos in parallel on the shared gh_executor); per-item work is then local.
     """
     if not items:
         return []
@@ -26,15 +29,32 @@ def enrich_queue_items(items: List[Dict[str, Any]], max_workers: int = 5) -> Lis
     queue_db = get_queue_db()
     reviews_db = get_reviews_db()
 
-    def enrich(item: Dict[str, Any]) -> Dict[str, Any]:
-        return _enrich_one(item, queue_db, reviews_db)
+    numbers_by_repo = defaultdict(list)
+    for item in items:
+        if len(item["repo"].split("/")) == 2:
+            numbers_by_repo[item["repo"]].append(item["pr_number"])
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        return list(executor.map(enrich, items))
+    def fetch(repo_numbers):
+        full_repo, numbers = repo_numbers
+        owner, repo = full_repo.split("/")
+        return full_repo, fetch_prs_queue_data(owner, repo, numbers)
+
+    live_data = {
+        (full_repo, number): data
+        for full_repo, by_number in gh_executor.map(fetch, numbers_by_repo.items())
+        for number, data in by_number.items()
+    }
+
+    notes_counts = queue_db.get_all_notes_counts()
+    latest_reviews = reviews_db.get_latest_reviews_bulk(
+        [(item["repo"], item["pr_number"]) for item in items]
+    )
+
+    return [_enrich_one(item, live_data, notes_counts, latest_reviews) for item in items]
 
 
-def _enrich_one(item: Dict[str, Any], queue_db, reviews_db) -> Dict[str, Any]:
-    notes_count = queue_db.get_notes_count(item["id"])
+def _enrich_one(item: Dict[str, Any], live_data, notes_counts, latest_reviews) -> Dict[str, Any]:
+    notes_count = notes_counts.get(item["id"], 0)
     repo_parts = item["repo"].split("/")
     pr_state: Optional[str] = None
     has_new_commits = False
@@ -63,8 +83,7 @@ def _enrich_one(item: Dict[str, Any], queue_db, reviews_db) -> Dict[str, Any]:
     current_reviewers: List[Dict[str, Any]] = []
 
     if len(repo_parts) == 2:
-        owner, repo = repo_parts
-        queue_data = fetch_pr_queue_data(owner, repo, item["pr_number"])
+        queue_data = live_data.get((item["repo"], int(item["pr_number"])), EMPTY_QUEUE_DATA)
         pr_state = queue_data["state"]
         current_sha = queue_data["headRefOid"]
         queue_reviews = queue_data.get("reviews")
@@ -86,7 +105,7 @@ def _enrich_one(item: Dict[str, Any], queue_db, reviews_db) -> Dict[str, Any]:
         is_draft = queue_data.get("isDraft", False)
         current_reviewers = get_current_reviewers(queue_reviews)
 
-        latest_review = reviews_db.get_latest_review_for_pr(item["repo"], item["pr_number"])
+        latest_review = latest_reviews.get((item["repo"], int(item["pr_number"])))
         if latest_review:
             has_review = True
             review_score = latest_review.get("score")
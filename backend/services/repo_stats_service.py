@@ -7,10 +7,12 @@ import shutil
 import subprocess
 import tempfile
 from collections import Counter, defaultdict
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
-from backend.services.github_service import run_gh_command, parse_json_output, fetch_github_stats_api
+from backend.extensions import gh_executor
+from backend.services.github_http import gh_get, gh_get_all
+from backend.services.github_service import fetch_github_stats_api
+from backend.utils.dates import parse_iso8601
 
 logger = logging.getLogger(__name__)
 
@@ -170,7 +172,7 @@ BINARY_EXTENSIONS = {
 # ---------------------------------------------------------------------------
 
 def fetch_repo_stats(owner, repo):
-    """Fetch all repository statistics in parallel using ThreadPoolExecutor.
+    """Fetch all repository statistics in parallel on the shared gh_executor.
 
     Returns a dict with keys: overview, languages, files_by_extension, code, prs.
     """
@@ -178,68 +180,43 @@ def fetch_repo_stats(owner, repo):
 
     def _fetch_overview():
         try:
-            output = run_gh_command(["api", f"repos/{full_repo}"])
-            return parse_json_output(output)
-        except RuntimeError as e:
+            return gh_get(f"repos/{full_repo}") or {}
+        except (RuntimeError, ValueError) as e:
             logger.warning(f"Failed to fetch overview for {full_repo}: {e}")
             return {}
 
     def _fetch_languages():
         try:
-            output = run_gh_command(["api", f"repos/{full_repo}/languages"])
-            result = parse_json_output(output)
+            result = gh_get(f"repos/{full_repo}/languages")
             return result if isinstance(result, dict) else {}
-        except RuntimeError as e:
+        except (RuntimeError, ValueError) as e:
             logger.warning(f"Failed to fetch languages for {full_repo}: {e}")
             return {}
 
     def _fetch_file_tree():
+        # The trees endpoint returns the whole recursive listing in one
+        # response (it sets "truncated" rather than paginating)
         try:
-            result = subprocess.run(
-                ["gh", "api", f"repos/{full_repo}/git/trees/HEAD",
-                 "-q", ".tree[].path", "--paginate", "-X", "GET", "-f", "recursive=1"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.stdout:
-                return [p for p in result.stdout.split("\n") if p.strip()]
-            return []
-        except Exception as e:
+            result = gh_get(f"repos/{full_repo}/git/trees/HEAD", params={"recursive": 1}) or {}
+            return [entry["path"] for entry in result.get("tree") or () if entry.get("path")]
+        except (RuntimeError, ValueError) as e:
             logger.warning(f"Failed to fetch file tree for {full_repo}: {e}")
             return []
 
     def _fetch_pr_count(qualifier):
         try:
-            q = f"repo:{full_repo}+is:pr+{qualifier.replace(' ', '+')}"
-            output = run_gh_command([
-                "api", f"search/issues?q={q}&per_page=1",
-                "--jq", ".total_count",
-            ])
-            return int(output.strip()) if output.strip().isdigit() else 0
+            data = gh_get("search/issues", params={"q": f"repo:{full_repo} is:pr {qualifier}", "per_page": 1}) or {}
+            return int(data.get("total_count") or 0)
         except (RuntimeError, ValueError) as e:
             logger.warning(f"Failed to fetch PR count ({qualifier}) for {full_repo}: {e}")
             return 0
 
     def _fetch_branch_count():
-        total = 0
-        page = 1
-        while True:
-            try:
-                output = run_gh_command([
-                    "api", f"repos/{full_repo}/branches?per_page=100&page={page}",
-                ])
-                branches = parse_json_output(output)
-                if not isinstance(branches, list):
-                    break
-                total += len(branches)
-                if len(branches) < 100:
-                    break
-                page += 1
-            except RuntimeError as e:
-                logger.warning(f"Failed to fetch branches page {page} for {full_repo}: {e}")
-                break
-        return total
+        try:
+            return len(gh_get_all(f"repos/{full_repo}/branches"))
+        except (RuntimeError, ValueError) as e:
+            logger.warning(f"Failed to fetch branches for {full_repo}: {e}")
+            return 0
 
     def _fetch_contributors_stats():
         """Fetch stats/contributors and return (total_commits, contributor_count)."""
@@ -249,24 +226,23 @@ def fetch_repo_stats(owner, repo):
         total = sum(c.get("total", 0) for c in contributors if isinstance(c, dict))
         return total, len(contributors)
 
-    with ThreadPoolExecutor(max_workers=7) as executor:
-        f_overview = executor.submit(_fetch_overview)
-        f_languages = executor.submit(_fetch_languages)
-        f_tree = executor.submit(_fetch_file_tree)
-        f_pr_open = executor.submit(_fetch_pr_count, "is:open")
-        f_pr_closed = executor.submit(_fetch_pr_count, "is:closed is:unmerged")
-        f_pr_merged = executor.submit(_fetch_pr_count, "is:merged")
-        f_branches = executor.submit(_fetch_branch_count)
-        f_contrib_stats = executor.submit(_fetch_contributors_stats)
-
-        overview_raw = f_overview.result()
-        languages_raw = f_languages.result()
-        tree_paths = f_tree.result()
-        pr_open = f_pr_open.result()
-        pr_closed = f_pr_closed.result()
-        pr_merged = f_pr_merged.result()
-        branch_count = f_branches.result()
-        total_commits, total_contributors = f_contrib_stats.result()
+    f_overview = gh_executor.submit(_fetch_overview)
+    f_languages = gh_executor.submit(_fetch_languages)
+    f_tree = gh_executor.submit(_fetch_file_tree)
+    f_pr_open = gh_executor.submit(_fetch_pr_count, "is:open")
+    f_pr_closed = gh_executor.submit(_fetch_pr_count, "is:closed is:unmerged")
+    f_pr_merged = gh_executor.submit(_fetch_pr_count, "is:merged")
+    f_branches = gh_executor.submit(_fetch_branch_count)
+    f_contrib_stats = gh_executor.submit(_fetch_contributors_stats)
+
+    overview_raw = f_overview.result()
+    languages_raw = f_languages.result()
+    tree_paths = f_tree.result()
+    pr_open = f_pr_open.result()
+    pr_closed = f_pr_closed.result()
+    pr_merged = f_pr_merged.result()
+    branch_count = f_branches.result()
+    total_commits, total_contributors = f_contrib_stats.result()
 
     # --- overview ---
     license_info = overview_raw.get("license") or {}
@@ -274,8 +250,7 @@ def fetch_repo_stats(owner, repo):
     age_days = None
     if created_at_str:
         try:
-            created_dt = datetime.fromisoformat(created_at_str.replace("Z", "+00:00"))
-            age_days = (datetime.now(timezone.utc) - created_dt).days
+            age_days = (datetime.now(timezone.utc) - parse_iso8601(created_at_str)).days
         except (ValueError, TypeError):
             pass
 
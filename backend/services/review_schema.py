@@ -372,35 +372,58 @@ def _empty_review(metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     }
 
 
+# Review header / summary patterns, compiled once at import (every saved
+# review goes through _parse_summary, and markdown-only ones _parse_metadata)
+_H1_PR_NUMBER_RE = re.compile(r'^#\s+.*?PR\s*#(\d+)', re.MULTILINE | re.IGNORECASE)
+_H1_TITLE_RE = re.compile(r'^#\s+.*?PR\s*#\d+\s*[—–:\-]\s*(.+)', re.MULTILINE)
+_META_FIELD_RES = {
+    "repository": re.compile(r'\*\*Repository\*?\*?:?\s*(.+)', re.IGNORECASE),
+    "author": re.compile(r'\*\*Author\*?\*?:?\s*(.+)', re.IGNORECASE),
+    "pr_url": re.compile(r'\*\*PR\s*URL\*?\*?:?\s*(https?\S+)', re.IGNORECASE),
+    "review_date": re.compile(r'\*\*Review\s*Date\*?\*?:?\s*(.+)', re.IGNORECASE),
+}
+_BRANCH_RE = re.compile(r'\*\*Branch\*?\*?:?\s*(\S+)\s*->\s*(\S+)', re.IGNORECASE)
+_FILES_CHANGED_RE = re.compile(r'\*\*Files?\s*Changed?\*?\*?:?\s*(.+)', re.IGNORECASE)
+_FILE_COUNT_RE = re.compile(r'(\d+)\s*(?:files?\s*changed|new)', re.IGNORECASE)
+_ADDITIONS_RE = re.compile(r'([\d,]+)\s*addition', re.IGNORECASE)
+_DELETIONS_RE = re.compile(r'([\d,]+)\s*deletion', re.IGNORECASE)
+_FOLLOWUP_RE = re.compile(r'follow[- ]?up', re.IGNORECASE)
+_SUMMARY_HEADING_RE = re.compile(
+    r'^#{2,6}\s*Summary\s*\n+(.*?)(?=\n#{2,6}\s|\n---\s*\n|\n\*\*(?:Critical|Major|Minor|Positive|Score|Recommendations)\*\*)',
+    re.DOTALL | re.IGNORECASE | re.MULTILINE
+)
+_SUMMARY_BOLD_RE = re.compile(
+    r'\*\*Summary\*\*\s*\n+(.*?)(?=\n---|\n\*\*(?:Critical|Major|Minor|Positive|Score|Recommendations))',
+    re.DOTALL | re.IGNORECASE
+)
+_HRULE_RE = re.compile(r'\n---\s*\n')
+_SECTION_START_RE = re.compile(r'\*\*(?:Critical|Major|Minor)', re.IGNORECASE)
+_SUMMARY_LABEL_RE = re.compile(r'^(?:\*\*Summary\*\*|#{2,6}\s*Summary)\s*\n*')
+
+
 def _parse_metadata(content: str, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """Extract metadata from the review header."""
     meta: Dict[str, Any] = {}
     ov = overrides or {}
 
     # PR number from H1: "# Code Review: PR #123" or "# Code Review: PR #123 — Title"
-    h1 = re.search(r'^#\s+.*?PR\s*#(\d+)', content, re.MULTILINE | re.IGNORECASE)
+    h1 = _H1_PR_NUMBER_RE.search(content)
     if h1:
         meta["pr_number"] = int(h1.group(1))
 
     # PR title from H1 after em-dash or colon
-    title_match = re.search(r'^#\s+.*?PR\s*#\d+\s*[—–:\-]\s*(.+)', content, re.MULTILINE)
+    title_match = _H1_TITLE_RE.search(content)
     if title_match:
         meta["pr_title"] = title_match.group(1).strip()
 
     # Metadata fields with **Label**: value pattern
-    field_patterns = {
-        "repository": r'\*\*Repository\*?\*?:?\s*(.+)',
-        "author": r'\*\*Author\*?\*?:?\s*(.+)',
-        "pr_url": r'\*\*PR\s*URL\*?\*?:?\s*(https?\S+)',
-        "review_date": r'\*\*Review\s*Date\*?\*?:?\s*(.+)',
-    }
-    for field, pattern in field_patterns.items():
-        m = re.search(pattern, content, re.IGNORECASE)
+    for field, pattern in _META_FIELD_RES.items():
+        m = pattern.search(content)
         if m:
             meta[field] = m.group(1).strip()
 
     # Branch: head -> base
-    branch_match = re.search(r'\*\*Branch\*?\*?:?\s*(\S+)\s*->\s*(\S+)', content, re.IGNORECASE)
+    branch_match = _BRANCH_RE.search(content)
     if branch_match:
         meta["branch"] = {
             "head": branch_match.group(1).strip(),
@@ -408,26 +431,23 @@ def _parse_metadata(content: str, overrides: Optional[Dict[str, Any]] = None) ->
         }
 
     # Files changed: "6 files changed", "12 new files", etc. and additions/deletions
-    changes_match = re.search(
-        r'\*\*Files?\s*Changed?\*?\*?:?\s*(.+)',
-        content, re.IGNORECASE
-    )
+    changes_match = _FILES_CHANGED_RE.search(content)
     if changes_match:
         changes_text = changes_match.group(1)
-        fc = re.search(r'(\d+)\s*(?:files?\s*changed|new)', changes_text, re.IGNORECASE)
+        fc = _FILE_COUNT_RE.search(changes_text)
         if fc:
             meta["files_changed"] = int(fc.group(1))
-        add_m = re.search(r'([\d,]+)\s*addition', changes_text, re.IGNORECASE)
+        add_m = _ADDITIONS_RE.search(changes_text)
         if add_m:
             meta["additions"] = int(add_m.group(1).replace(",", ""))
-        del_m = re.search(r'([\d,]+)\s*deletion', changes_text, re.IGNORECASE)
+        del_m = _DELETIONS_RE.search(changes_text)
         if del_m:
             meta["deletions"] = int(del_m.group(1).replace(",", ""))
 
     # Determine review type
     if ov.get("is_followup"):
         meta["review_type"] = "followup"
-    elif re.search(r'follow[- ]?up', content[:500], re.IGNORECASE):
+    elif _FOLLOWUP_RE.search(content[:500]):
         meta["review_type"] = "followup"
     else:
         meta["review_type"] = "initial"
@@ -461,29 +481,23 @@ def _parse_summary(content: str) -> str:
     """
     # Heading-style: "## Summary" or "### Summary" — terminator is any
     # subsequent section heading or horizontal rule.
-    m = re.search(
-        r'^#{2,6}\s*Summary\s*\n+(.*?)(?=\n#{2,6}\s|\n---\s*\n|\n\*\*(?:Critical|Major|Minor|Positive|Score|Recommendations)\*\*)',
-        content, re.DOTALL | re.IGNORECASE | re.MULTILINE
-    )
+    m = _SUMMARY_HEADING_RE.search(content)
     if m:
         return m.group(1).strip()
 
     # Bold-style: **Summary**
-    m = re.search(
-        r'\*\*Summary\*\*\s*\n+(.*?)(?=\n---|\n\*\*(?:Critical|Major|Minor|Positive|Score|Recommendations))',
-        content, re.DOTALL | re.IGNORECASE
-    )
+    m = _SUMMARY_BOLD_RE.search(content)
     if m:
         return m.group(1).strip()
 
     # Fallback: text between first --- and second --- (or first section heading)
-    parts = re.split(r'\n---\s*\n', content, maxsplit=2)
+    parts = _HRULE_RE.split(content, maxsplit=2)
     if len(parts) >= 2:
         candidate = parts[1].strip()
         # Skip if it starts with a section heading
-        if candidate and not re.match(r'\*\*(?:Critical|Major|Minor)', candidate, re.IGNORECASE):
+        if candidate and not _SECTION_START_RE.match(candidate):
             # Remove leading **Summary** or ## Summary if present
-            candidate = re.sub(r'^(?:\*\*Summary\*\*|#{2,6}\s*Summary)\s*\n*', '', candidate).strip()
+            candidate = _SUMMARY_LABEL_RE.sub('', candidate).strip()
             return candidate
 
     return ""
@@ -546,6 +560,23 @@ def _parse_sections(content: str) -> List[Dict[str, Any]]:
     return sections
 
 
+# Issue block patterns, compiled once at import
+_ISSUE_HEADER_RE = re.compile(r'\*\*(\d+)\.\s*(.+?)\*\*')
+_ISSUE_FIELD_RES = {
+    name: re.compile(
+        rf'-\s*{name}:\s*(.*?)(?=\n-\s*(?:Location|Principle|Problem|Fix):|\n\*\*\d+\.|\n```|\Z)',
+        re.DOTALL
+    )
+    for name in ("Location", "Principle", "Problem", "Fix")
+}
+_CODE_SNIPPET_RE = re.compile(r'```[\w]*\n(.*?)```', re.DOTALL)
+_LOC_COLON_RE = re.compile(r'`?([^`:\s]+)`?\s*:\s*(\d+)(?:\s*-\s*(\d+))?')
+_LOC_PATH_RE = re.compile(r'`([^`]+)`')
+_LINE_RANGE_RE = re.compile(r'lines?\s+(\d+)\s*[-–]\s*(\d+)')
+_LINE_SINGLE_RE = re.compile(r'line\s+(\d+)')
+_LOC_BARE_RE = re.compile(r'(\S+):(\d+)(?:-(\d+))?')
+
+
 def _parse_issues_from_section(section_text: str) -> List[Dict[str, Any]]:
     """Parse individual issues from a section block.
 
@@ -557,7 +588,7 @@ def _parse_issues_from_section(section_text: str) -> List[Dict[str, Any]]:
     """
     issues = []
     # Match issue headers: **1. Title** or **N. Title**
-    headers = list(re.finditer(r'\*\*(\d+)\.\s*(.+?)\*\*', section_text))
+    headers = list(_ISSUE_HEADER_RE.finditer(section_text))
 
     for idx, header in enumerate(headers):
         title = header.group(2).strip()
@@ -585,7 +616,7 @@ def _parse_issues_from_section(section_text: str) -> List[Dict[str, Any]]:
             issue["fix"] = fix
 
         # Extract code snippets
-        code_match = re.search(r'```[\w]*\n(.*?)```', block, re.DOTALL)
+        code_match = _CODE_SNIPPET_RE.search(block)
         if code_match:
             issue["code_snippet"] = code_match.group(1).strip()
 
@@ -596,11 +627,7 @@ def _parse_issues_from_section(section_text: str) -> List[Dict[str, Any]]:
 
 def _extract_field(block: str, field_name: str) -> Optional[str]:
     """Extract a field from an issue block (e.g. '- Location: value')."""
-    pattern = re.compile(
-        rf'-\s*{field_name}:\s*(.*?)(?=\n-\s*(?:Location|Principle|Problem|Fix):|\n\*\*\d+\.|\n```|\Z)',
-        re.DOTALL
-    )
-    m = pattern.search(block)
+    m = _ISSUE_FIELD_RES[field_name].search(block)
     if m:
         return m.group(1).strip()
     return None
@@ -612,7 +639,7 @@ def _parse_location_string(loc_str: Optional[str]) -> Optional[Dict[str, Any]]:
         return None
 
     # Pattern: `file.py:123-456` or `file.py:123` or file.py:123-456
-    m = re.match(r'`?([^`:\s]+)`?\s*:\s*(\d+)(?:\s*-\s*(\d+))?', loc_str)
+    m = _LOC_COLON_RE.match(loc_str)
     if m:
         return {
             "file": m.group(1).strip(),
@@ -621,17 +648,17 @@ def _parse_location_string(loc_str: Optional[str]) -> Optional[Dict[str, Any]]:
         }
 
     # Pattern: `file.py` with separate line reference
-    path_m = re.match(r'`([^`]+)`', loc_str)
+    path_m = _LOC_PATH_RE.match(loc_str)
     if path_m:
         file_path = path_m.group(1).strip()
-        line_m = re.search(r'lines?\s+(\d+)\s*[-–]\s*(\d+)', loc_str)
+        line_m = _LINE_RANGE_RE.search(loc_str)
         if line_m:
             return {
                 "file": file_path,
                 "start_line": int(line_m.group(1)),
                 "end_line": int(line_m.group(2)),
             }
-        line_m = re.search(r'line\s+(\d+)', loc_str)
+        line_m = _LINE_SINGLE_RE.search(loc_str)
         if line_m:
             return {
                 "file": file_path,
@@ -641,7 +668,7 @@ def _parse_location_string(loc_str: Optional[str]) -> Optional[Dict[str, Any]]:
         return {"file": file_path, "start_line": None, "end_line": None}
 
     # Bare path with colon-line
-    bare_m = re.match(r'(\S+):(\d+)(?:-(\d+))?', loc_str)
+    bare_m = _LOC_BARE_RE.match(loc_str)
     if bare_m:
         return {
             "file": bare_m.group(1).strip(),
@@ -1,14 +1,20 @@
 """Claude CLI subprocess management: start, cancel, poll, save to DB."""
 
-import json
 import logging
+import shutil
 import subprocess
+import threading
 import time
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
+
 from backend.config import get_reviews_dir
-from backend.services.github_service import fetch_pr_head_sha, fetch_pr_state
+from backend.database import get_active_reviews_db
+from backend.extensions import review_executor
+from backend.services.github_service import fetch_pr_state_and_sha
 from backend.services.review_schema import (
     extract_markdown_summary,
     markdown_to_json,
@@ -57,11 +63,11 @@ def save_review_to_db(key, review, status, reviews_db):
                 review_path = Path(review_file)
                 json_path = review_path.with_suffix(".json")
 
-                # Try reading the .json file first (agent writes both .md and .json)
+                # Try reading the .json file first (agent writes both .md and .json);
+                # orjson parses the raw bytes without a separate decode step
                 if json_path.exists():
                     try:
-                        raw = json_path.read_text(encoding="utf-8")
-                        parsed = json.loads(raw)
+                        parsed = orjson.loads(json_path.read_bytes())
                         valid, errs = validate_review_json(parsed)
                         if valid:
                             review_json_data = parsed
@@ -71,10 +77,18 @@ def save_review_to_db(key, review, status, reviews_db):
                     except Exception as e:
                         logger.warning(f"Could not read/parse JSON review file {json_path}: {e}")
 
-                # Fallback: read the .md file and convert to JSON
-                if review_json_data is None and review_path.exists():
+                # The .md file is read once and shared by the fallback conversion
+                # and the summary override below
+                md_content = None
+                if review_path.exists():
+                    try:
+                        md_content = review_path.read_bytes().decode("utf-8")
+                    except Exception as e:
+                        logger.warning(f"Could not read review file {review_file}: {e}")
+
+                # Fallback: convert the .md file to JSON
+                if review_json_data is None and md_content is not None:
                     try:
-                        md_content = review_path.read_text(encoding="utf-8")
                         metadata = {
                             "pr_number": pr_number,
                             "repo": full_repo,
@@ -87,14 +101,13 @@ def save_review_to_db(key, review, status, reviews_db):
                         review_json_data = markdown_to_json(md_content, metadata)
                         logger.info(f"Converted markdown review to JSON for {key}")
                     except Exception as e:
-                        logger.warning(f"Could not read/convert review file {review_file}: {e}")
+                        logger.warning(f"Could not convert review file {review_file}: {e}")
 
                 # Override JSON summary with verbatim markdown summary when both
                 # files exist. The agent produces the two files independently
                 # and often reworks the JSON summary; the markdown is canonical.
-                if review_json_data is not None and review_path.exists():
+                if review_json_data is not None and md_content is not None:
                     try:
-                        md_content = review_path.read_text(encoding="utf-8")
                         md_summary = extract_markdown_summary(md_content)
                         if md_summary:
                             review_json_data["summary"] = md_summary
@@ -115,7 +128,7 @@ def save_review_to_db(key, review, status, reviews_db):
                     "score": {"overall": 0},
                 }
 
-            content_json_str = json.dumps(review_json_data, ensure_ascii=False)
+            content_json_str = orjson.dumps(review_json_data).decode()
 
             pr_url = review.get("pr_url", "")
             pr_title = review.get("pr_title")
@@ -129,16 +142,17 @@ def save_review_to_db(key, review, status, reviews_db):
                 pr_title = f"PR #{pr_number} Review"
 
             # The head SHA is critical for the "new commits since review" badge
-            # in the merge queue and swimlane views. fetch_pr_head_sha already
-            # retries transient errors via run_gh_command, but if it still comes
-            # back empty (because gh succeeded but returned no SHA, or a rare
-            # double failure), retry with a short delay before giving up — a
-            # review without a SHA permanently loses its follow-up signal.
-            head_commit_sha = fetch_pr_head_sha(owner, repo, pr_number)
+            # in the merge queue and swimlane views. State and SHA come from one
+            # GraphQL lookup, which already retries transient errors, but if the
+            # SHA still comes back empty (gh succeeded but returned no SHA, or
+            # a rare double failure), retry with a short delay before giving
+            # up — a review without a SHA permanently loses its follow-up signal.
+            pr_state_at_review, head_commit_sha = fetch_pr_state_and_sha(owner, repo, pr_number)
             if not head_commit_sha:
                 for delay in (2, 5):
                     time.sleep(delay)
-                    head_commit_sha = fetch_pr_head_sha(owner, repo, pr_number)
+                    state, head_commit_sha = fetch_pr_state_and_sha(owner, repo, pr_number)
+                    pr_state_at_review = pr_state_at_review or state
                     if head_commit_sha:
                         break
                 if not head_commit_sha:
@@ -146,7 +160,6 @@ def save_review_to_db(key, review, status, reviews_db):
                         f"Could not capture head SHA for {key} after retries — the "
                         f"'new commits' badge will not work until the PR is re-reviewed."
                     )
-            pr_state_at_review = fetch_pr_state(owner, repo, pr_number)
 
             reviews_db.save_review(
                 pr_number=pr_number,
@@ -168,40 +181,165 @@ def save_review_to_db(key, review, status, reviews_db):
 
 
 def check_review_status(key, active_reviews, reviews_lock, reviews_db):
-    """Check and update the status of a review process."""
+    """Check and update the status of a review process.
+
+    Only the non-blocking poll() runs under reviews_lock. When the process
+    has exited, the review is flagged "saving" (so exactly one caller
+    claims it) and _finish_review runs on review_executor: it collects the
+    process output and saves the review to the database outside the lock.
+    The review keeps reporting "running" until the save finishes, so a
+    "completed" review is always in the database.
+
+    A still-running process whose shared row another worker has marked
+    cancelled (without signalling it, see _cancel_remote_review) is
+    terminated here; the next poll finishes it without saving.
+    """
     with reviews_lock:
-        if key not in active_reviews:
+        review = active_reviews.get(key)
+        if review is None:
             return None
-        review = active_reviews[key]
         process = review.get("process")
-        if process and review["status"] == "running":
+        still_running = False
+        if process and review["status"] == "running" and not review.get("saving"):
             exit_code = process.poll()
             if exit_code is not None:
-                try:
-                    stdout, stderr = process.communicate(timeout=1)
-                    if stderr:
-                        review["error_output"] = stderr.strip()[-2000:]
-                    if stdout:
-                        review["stdout"] = stdout.strip()[-500:]
-                except subprocess.TimeoutExpired:
-                    pass
-                except Exception as e:
-                    logger.error(f"Error reading process output for {key}: {e}")
-
-                status = "completed" if exit_code == 0 else "failed"
-                review["status"] = status
                 review["exit_code"] = exit_code
-                review["completed_at"] = datetime.now(timezone.utc).isoformat()
+                review["saving"] = True
+                review_executor.submit(
+                    _finish_review, key, review, exit_code, reviews_lock, reviews_db
+                )
+            else:
+                still_running = True
+    if still_running:
+        _terminate_if_cancelled_remotely(key, process)
+    return review
+
+
+def _terminate_if_cancelled_remotely(key, process):
+    try:
+        row = get_active_reviews_db().get(key)
+    except Exception as e:
+        logger.error(f"Failed to read shared review status for {key}: {e}")
+        return
+    if row and row["status"] == "cancelled":
+        logger.info(f"Review cancelled by another worker, terminating PID {process.pid}: {key}")
+        try:
+            process.terminate()
+        except OSError as e:
+            logger.error(f"Failed to terminate review process for {key}: {e}")
+
+
+def _finish_review(key, review, exit_code, reviews_lock, reviews_db):
+    """Collect a finished process's output, save the review, then publish its status.
+
+    Always clears "saving" and publishes a final status, so an error while
+    saving marks the review failed instead of leaving it "running".
+    """
+    status = "failed"
+    error_output = None
+    try:
+        status, error_output = _save_finished_review(key, review, exit_code, reviews_lock, reviews_db)
+    except Exception as e:
+        logger.exception(f"Failed to finish review {key}: {e}")
+    finally:
+        completed_at = datetime.now(timezone.utc).isoformat()
+        with reviews_lock:
+            cancelled = review["status"] == "cancelled"
+            if not cancelled:
+                review["status"] = status
+                review["completed_at"] = completed_at
+            review.pop("saving", None)
+    if cancelled:
+        return
+    try:
+        get_active_reviews_db().finish(key, status, completed_at, exit_code, error_output)
+    except Exception as e:
+        logger.error(f"Failed to publish review status for {key}: {e}")
+
+
+def _save_finished_review(key, review, exit_code, reviews_lock, reviews_db):
+    """Gather the buffered output and save the review. Returns (status, error_output)."""
+    # The readers hit EOF once the process exits; give them a moment to
+    # drain whatever was still buffered in the pipes.
+    for reader in review.get("output_readers", ()):
+        reader.join(timeout=1)
+    stdout = "".join(review.get("stdout_buf", ()))
+    stderr = "".join(review.get("stderr_buf", ()))
 
-                if exit_code == 0:
-                    logger.info(f"Review completed successfully: {key}")
-                else:
-                    error_msg = review.get("error_output", "Unknown error")
-                    logger.error(f"Review failed: {key} (exit code: {exit_code})\nError: {error_msg}")
+    status = "completed" if exit_code == 0 else "failed"
+    with reviews_lock:
+        if review["status"] == "cancelled":
+            logger.info(f"Review was cancelled while finishing, not saving: {key}")
+            return "cancelled", None
+        if stderr:
+            review["error_output"] = stderr.strip()[-2000:]
+        if stdout:
+            review["stdout"] = stdout.strip()[-500:]
+        snapshot = dict(review)
+
+    if exit_code == 0:
+        logger.info(f"Review completed successfully: {key}")
+    else:
+        error_msg = snapshot.get("error_output", "Unknown error")
+        logger.error(f"Review failed: {key} (exit code: {exit_code})\nError: {error_msg}")
+
+    # Another worker may have cancelled it through the shared row
+    row = get_active_reviews_db().get(key)
+    if row and row["status"] == "cancelled":
+        logger.info(f"Review was cancelled by another worker, not saving: {key}")
+        return "cancelled", snapshot.get("error_output")
+    with reviews_lock:
+        if review["status"] == "cancelled":
+            logger.info(f"Review was cancelled while finishing, not saving: {key}")
+            return "cancelled", None
+    save_review_to_db(key, snapshot, status, reviews_db)
+    return status, snapshot.get("error_output")
+
+
+def _drain_pipe(pipe, buf):
+    try:
+        for line in pipe:
+            buf.append(line)
+    except (OSError, ValueError):
+        pass  # Pipe closed underneath us (e.g. process killed)
+    finally:
+        pipe.close()
 
-                save_review_to_db(key, review, status, reviews_db)
 
-        return review
+def start_output_readers(process, max_lines=2000):
+    """Drain a review process's stdout/stderr on daemon threads.
+
+    Without a reader, a chatty process can fill the OS pipe buffer and stall
+    before it ever exits. The returned fields belong in the active_reviews
+    entry: the last max_lines lines of each stream are kept in deques that
+    _finish_review reads once the process has exited.
+    """
+    output = {"stdout_buf": deque(maxlen=max_lines), "stderr_buf": deque(maxlen=max_lines)}
+    readers = []
+    for pipe, buf in ((process.stdout, output["stdout_buf"]), (process.stderr, output["stderr_buf"])):
+        reader = threading.Thread(target=_drain_pipe, args=(pipe, buf), daemon=True)
+        reader.start()
+        readers.append(reader)
+    output["output_readers"] = readers
+    return output
+
+
+_claude_path = None
+
+
+def _claude_executable():
+    """Absolute path of the claude CLI, looked up on PATH once.
+
+    Each review runs its own `claude -p <prompt>` process (the prompt is an
+    argv flag, and process exit marks the review done), so processes can't
+    be pre-spawned; resolving the executable once at least spares every
+    spawn the PATH walk. A miss isn't cached, so installing the CLI while
+    the app runs still works.
+    """
+    global _claude_path
+    if _claude_path is None:
+        _claude_path = shutil.which("claude")
+    return _claude_path or "claude"
 
 
 VALID_REVIEWER_TYPES = ("default", "pb", "ed")
@@ -265,9 +403,9 @@ def start_review_process(pr_url, owner, repo, pr_number, is_followup=False, prev
         # Convert raw JSON to readable markdown for the prompt
         previous_review_markdown = previous_review_content
         try:
-            parsed_prev = json.loads(previous_review_content)
+            parsed_prev = orjson.loads(previous_review_content)
             previous_review_markdown = json_to_markdown(parsed_prev)
-        except (json.JSONDecodeError, TypeError, Exception):
+        except (orjson.JSONDecodeError, TypeError, Exception):
             pass  # Fall back to raw string if conversion fails
 
         prompt = (
@@ -303,7 +441,7 @@ def start_review_process(pr_url, owner, repo, pr_number, is_followup=False, prev
     # This app is single-user/local-only; the flag does not expose a network attack surface.
     # allowedTools is restricted to read-only git/gh commands + file tools.
     cmd = [
-        "claude",
+        _claude_executable(),
         "-p", prompt,
         "--allowedTools", (
             "Bash(git status*),Bash(git log*),Bash(git show*),"
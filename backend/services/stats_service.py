@@ -1,260 +1,211 @@
 """Developer stats aggregation from 3 sources (contributors, PRs, reviews)."""
 
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from backend.config import get_config
+from backend.extensions import gh_executor
 from backend.services.github_service import (
-    run_gh_command, parse_json_output, fetch_github_stats_api,
+    fetch_github_stats_api, iter_pr_authors, iter_recent_reviews,
 )
 
 logger = logging.getLogger(__name__)
 
+REVIEW_SAMPLE_LIMIT = get_config().get("review_sample_limit", 250)
+PR_STATS_LIMIT = 500
+
+
+def _project_contributors(raw):
+    """Reduce the stats/contributors payload to per-author commit/line totals."""
+    return [
+        {
+            "login": c["author"].get("login"),
+            "avatar_url": c["author"].get("avatar_url"),
+            "commits": c.get("total"),
+            "lines_added": sum(w.get("a", 0) for w in c.get("weeks", [])),
+            "lines_deleted": sum(w.get("d", 0) for w in c.get("weeks", [])),
+        }
+        for c in raw
+        if c.get("author")
+    ]
+
 
 def fetch_contributor_stats(owner, repo):
     """Fetch contributor commit statistics from GitHub API."""
     return fetch_github_stats_api(
         owner, repo,
         "stats/contributors",
-        jq_query=(
-            "[.[] | select(.author) | "
-            "{login: .author.login, avatar_url: .author.avatar_url, "
-            "commits: .total, "
-            "lines_added: ([.weeks[].a] | add), "
-            "lines_deleted: ([.weeks[].d] | add)}]"
-        ),
+        transform=_project_contributors,
         max_retries=5,
         retry_delay=3,
     )
 
 
+# PR states counted per author by fetch_pr_stats()
+_PR_STATE_COUNTERS = {"MERGED": "merged", "CLOSED": "closed", "OPEN": "open"}
+
+
 def fetch_pr_stats(owner, repo):
-    """Fetch all PRs and aggregate statistics by author."""
-    try:
-        output = run_gh_command([
-            "pr", "list", "-R", f"{owner}/{repo}",
-            "--state", "all",
-            "--limit", "500",
-            "--json", "author,state,mergedAt",
-        ])
-        prs = parse_json_output(output)
+    """Fetch the most recent PRs and aggregate statistics by author.
 
+    PRs are streamed one GraphQL page at a time and folded into the
+    per-author counts as they arrive, so the full PR list is never held.
+    """
+    try:
         stats = {}
-        for pr in prs:
-            author = pr.get("author", {})
-            if not author:
-                continue
-            login = author.get("login", "")
-            if not login:
-                continue
-
-            if login not in stats:
-                stats[login] = {
-                    "avatar_url": author.get("avatarUrl", ""),
+        for login, avatar_url, state in iter_pr_authors(owner, repo, PR_STATS_LIMIT):
+            entry = stats.get(login)
+            if entry is None:
+                entry = stats[login] = {
+                    "avatar_url": avatar_url,
                     "authored": 0,
                     "merged": 0,
                     "closed": 0,
                     "open": 0,
                 }
-
-            stats[login]["authored"] += 1
-            state = pr.get("state", "").upper()
-            if state == "MERGED":
-                stats[login]["merged"] += 1
-            elif state == "CLOSED":
-                stats[login]["closed"] += 1
-            elif state == "OPEN":
-                stats[login]["open"] += 1
-
+            entry["authored"] += 1
+            counter = _PR_STATE_COUNTERS.get(state)
+            if counter:
+                entry[counter] += 1
         return stats
-    except RuntimeError:
+    except (RuntimeError, ValueError) as e:
+        logger.warning(f"Failed to fetch PR stats for {owner}/{repo}: {e}")
         return {}
 
 
+# Review states counted per reviewer by fetch_review_stats()
+_REVIEW_STATE_COUNTERS = {
+    "APPROVED": "approved",
+    "CHANGES_REQUESTED": "changes_requested",
+    "COMMENTED": "commented",
+}
+
+
 def fetch_review_stats(owner, repo):
-    """Fetch review statistics by reviewer using parallel API calls."""
-    try:
-        config = get_config()
-        review_limit = config.get("review_sample_limit", 250)
-        output = run_gh_command([
-            "pr", "list", "-R", f"{owner}/{repo}",
-            "--state", "all",
-            "--limit", str(review_limit),
-            "--json", "number",
-        ])
-        prs = parse_json_output(output)
-        pr_numbers = [pr["number"] for pr in prs[:review_limit] if pr.get("number")]
-
-        def fetch_pr_reviews(pr_number):
-            try:
-                reviews_output = run_gh_command([
-                    "api",
-                    f"repos/{owner}/{repo}/pulls/{pr_number}/reviews",
-                    "--jq", "[.[] | {login: .user.login, avatar_url: .user.avatar_url, state: .state}]",
-                ])
-                return parse_json_output(reviews_output)
-            except RuntimeError:
-                return []
+    """Fetch review statistics by reviewer from the most recent PRs' reviews.
 
+    Reviews are folded into the per-reviewer counts one GraphQL page at a
+    time, as fetch_pr_stats() does for PRs.
+    """
+    try:
         stats = {}
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(fetch_pr_reviews, pr_numbers))
-
-        for reviews in results:
-            for review in reviews:
-                login = review.get("login", "")
-                if not login:
-                    continue
-
-                if login not in stats:
-                    stats[login] = {
-                        "avatar_url": review.get("avatar_url", ""),
-                        "total": 0,
-                        "approved": 0,
-                        "changes_requested": 0,
-                        "commented": 0,
-                    }
-
-                stats[login]["total"] += 1
-                state = review.get("state", "").upper()
-                if state == "APPROVED":
-                    stats[login]["approved"] += 1
-                elif state == "CHANGES_REQUESTED":
-                    stats[login]["changes_requested"] += 1
-                elif state == "COMMENTED":
-                    stats[login]["commented"] += 1
-
+        for login, avatar_url, state in iter_recent_reviews(owner, repo, REVIEW_SAMPLE_LIMIT):
+            entry = stats.get(login)
+            if entry is None:
+                entry = stats[login] = {
+                    "avatar_url": avatar_url,
+                    "total": 0,
+                    "approved": 0,
+                    "changes_requested": 0,
+                    "commented": 0,
+                }
+            entry["total"] += 1
+            counter = _REVIEW_STATE_COUNTERS.get(state)
+            if counter:
+                entry[counter] += 1
         return stats
-    except RuntimeError:
+    except (RuntimeError, ValueError) as e:
+        logger.warning(f"Failed to fetch review stats for {owner}/{repo}: {e}")
         return {}
 
 
+_DEV_TEMPLATE = {
+    "commits": 0,
+    "lines_added": 0,
+    "lines_deleted": 0,
+    "prs_authored": 0,
+    "prs_merged": 0,
+    "prs_closed": 0,
+    "prs_open": 0,
+    "reviews_given": 0,
+    "approvals": 0,
+    "changes_requested": 0,
+    "comments": 0,
+}
+
+
+def _new_dev_record(login, avatar_url=""):
+    return {"login": login, "avatar_url": avatar_url, **_DEV_TEMPLATE}
+
+
+def _dev_record(developers, login, stats):
+    """Return login's record, creating it on first sight; fills a missing avatar from stats."""
+    dev = developers.get(login)
+    if dev is None:
+        dev = developers[login] = _new_dev_record(login, stats.get("avatar_url", ""))
+    elif not dev["avatar_url"]:
+        dev["avatar_url"] = stats.get("avatar_url", "")
+    return dev
+
+
 def fetch_and_compute_stats(owner, repo):
     """Fetch fresh stats from GitHub and compute aggregated developer stats."""
+    # The three sources are independent: the two GraphQL folds run on the
+    # shared pool while this thread fetches stats/contributors (the slowest,
+    # as it polls through 202s) instead of idling on three futures
+    pr_future = gh_executor.submit(fetch_pr_stats, owner, repo)
+    review_future = gh_executor.submit(fetch_review_stats, owner, repo)
     contributor_stats = fetch_contributor_stats(owner, repo)
-    pr_stats = fetch_pr_stats(owner, repo)
-    review_stats = fetch_review_stats(owner, repo)
+    pr_stats = pr_future.result()
+    review_stats = review_future.result()
 
     developers = {}
 
-    _dev_template = lambda login, avatar_url="": {
-        "login": login,
-        "avatar_url": avatar_url,
-        "commits": 0,
-        "lines_added": 0,
-        "lines_deleted": 0,
-        "prs_authored": 0,
-        "prs_merged": 0,
-        "prs_closed": 0,
-        "prs_open": 0,
-        "reviews_given": 0,
-        "approvals": 0,
-        "changes_requested": 0,
-        "comments": 0,
-    }
-
     for contrib in contributor_stats:
         login = contrib.get("login", "")
         if not login:
             continue
-        developers[login] = _dev_template(login, contrib.get("avatar_url", ""))
-        developers[login]["commits"] = contrib.get("commits", 0)
-        developers[login]["lines_added"] = contrib.get("lines_added", 0)
-        developers[login]["lines_deleted"] = contrib.get("lines_deleted", 0)
+        dev = developers[login] = _new_dev_record(login, contrib.get("avatar_url", ""))
+        dev["commits"] = contrib.get("commits", 0)
+        dev["lines_added"] = contrib.get("lines_added", 0)
+        dev["lines_deleted"] = contrib.get("lines_deleted", 0)
 
     for login, stats in pr_stats.items():
-        if login not in developers:
-            developers[login] = _dev_template(login, stats.get("avatar_url", ""))
-        developers[login]["prs_authored"] = stats.get("authored", 0)
-        developers[login]["prs_merged"] = stats.get("merged", 0)
-        developers[login]["prs_closed"] = stats.get("closed", 0)
-        developers[login]["prs_open"] = stats.get("open", 0)
-        if not developers[login]["avatar_url"]:
-            developers[login]["avatar_url"] = stats.get("avatar_url", "")
+        dev = _dev_record(developers, login, stats)
+        dev["prs_authored"] = stats.get("authored", 0)
+        dev["prs_merged"] = stats.get("merged", 0)
+        dev["prs_closed"] = stats.get("closed", 0)
+        dev["prs_open"] = stats.get("open", 0)
 
     for login, stats in review_stats.items():
-        if login not in developers:
-            developers[login] = _dev_template(login, stats.get("avatar_url", ""))
-        developers[login]["reviews_given"] = stats.get("total", 0)
-        developers[login]["approvals"] = stats.get("approved", 0)
-        developers[login]["changes_requested"] = stats.get("changes_requested", 0)
-        developers[login]["comments"] = stats.get("commented", 0)
-        if not developers[login]["avatar_url"]:
-            developers[login]["avatar_url"] = stats.get("avatar_url", "")
+        dev = _dev_record(developers, login, stats)
+        dev["reviews_given"] = stats.get("total", 0)
+        dev["approvals"] = stats.get("approved", 0)
+        dev["changes_requested"] = stats.get("changes_requested", 0)
+        dev["comments"] = stats.get("commented", 0)
 
     stats_list = list(developers.values())
-    stats_list.sort(key=lambda x: x.get("commits", 0), reverse=True)
+    # Every record starts from _DEV_TEMPLATE, so "commits" is always present
+    stats_list.sort(key=itemgetter("commits"), reverse=True)
 
     return stats_list
 
 
+# Stay well under SQLite's bound-parameter limit (999 on older builds)
+_SCORE_QUERY_BATCH = 500
+
+
 def add_avg_pr_scores(stats_list, full_repo, reviews_db):
     """Add average PR scores from reviews database to stats list."""
-    with reviews_db.db.connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
+    logins = list({stat["login"] for stat in stats_list if stat.get("login")})
+
+    # Only the listed authors are aggregated (index-covered), on the thread's
+    # persistent connection rather than one opened per request
+    score_data = {}
+    conn = reviews_db.db._get_thread_conn()
+    for i in range(0, len(logins), _SCORE_QUERY_BATCH):
+        batch = logins[i:i + _SCORE_QUERY_BATCH]
+        placeholders = ",".join("?" * len(batch))
+        cursor = conn.execute(f"""
             SELECT pr_author, AVG(score) as avg_score, COUNT(*) as review_count
             FROM reviews
-            WHERE repo = ? AND score IS NOT NULL AND pr_author IS NOT NULL
+            WHERE repo = ? AND score IS NOT NULL AND pr_author IN ({placeholders})
             GROUP BY pr_author
-        """, (full_repo,))
-
-        score_data = {row["pr_author"]: {
-            "avg_score": round(row["avg_score"], 1) if row["avg_score"] else None,
-            "review_count": row["review_count"]
-        } for row in cursor.fetchall()}
+        """, (full_repo, *batch))
+        for author, avg_score, review_count in cursor.fetchall():
+            score_data[author] = (round(avg_score, 1) if avg_score else None, review_count)
 
     for stat in stats_list:
-        login = stat.get("login") or stat.get("username")
-        if login and login in score_data:
-            stat["avg_pr_score"] = score_data[login]["avg_score"]
-            stat["reviewed_pr_count"] = score_data[login]["review_count"]
-        else:
-            stat["avg_pr_score"] = None
-            stat["reviewed_pr_count"] = 0
+        stat["avg_pr_score"], stat["reviewed_pr_count"] = score_data.get(stat.get("login"), (None, 0))
 
     return stats_list
-
-
-def stats_to_cache_format(stats_list):
-    """Convert API-format stats list to database cache format."""
-    cache_data = []
-    for stat in stats_list:
-        cache_data.append({
-            "username": stat.get("login", ""),
-            "total_prs": stat.get("prs_authored", 0),
-            "open_prs": stat.get("prs_open", 0),
-            "merged_prs": stat.get("prs_merged", 0),
-            "closed_prs": stat.get("prs_closed", 0),
-            "total_additions": stat.get("lines_added", 0),
-            "total_deletions": stat.get("lines_deleted", 0),
-            "commits": stat.get("commits", 0),
-            "avatar_url": stat.get("avatar_url"),
-            "reviews_given": stat.get("reviews_given", 0),
-            "approvals": stat.get("approvals", 0),
-            "changes_requested": stat.get("changes_requested", 0),
-        })
-    return cache_data
-
-
-def cached_stats_to_api_format(cached_stats):
-    """Convert database cache format to API response format."""
-    transformed = []
-    for stat in cached_stats:
-        transformed.append({
-            "login": stat.get("username", ""),
-            "avatar_url": stat.get("avatar_url"),
-            "commits": stat.get("commits", 0),
-            "prs_authored": stat.get("total_prs", 0),
-            "prs_open": stat.get("open_prs", 0),
-            "prs_merged": stat.get("merged_prs", 0),
-            "prs_closed": stat.get("closed_prs", 0),
-            "lines_added": stat.get("total_additions", 0),
-            "lines_deleted": stat.get("total_deletions", 0),
-            "reviews_given": stat.get("reviews_given", 0),
-            "approvals": stat.get("approvals", 0),
-            "changes_requested": stat.get("changes_requested", 0),
-            "avg_pr_score": stat.get("avg_pr_score"),
-            "reviewed_pr_count": stat.get("reviewed_pr_count", 0),
-        })
-    return transformed
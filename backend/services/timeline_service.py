@@ -1,15 +1,13 @@
 """PR timeline service: fetch, normalize, and cache GitHub issue timeline events."""
 
 import logging
-import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from backend.services.github_service import (
-    run_gh_command,
-    parse_json_output,
-    fetch_pr_state,
-)
+from backend.cache.inflight_tracker import InFlightTracker
+from backend.extensions import refresh_executor
+from backend.services.github_http import gh_get, gh_get_all, has_token
+from backend.services.github_service import run_gh_command, parse_json_output
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +28,7 @@ _SUPPORTED_EVENT_TYPES = {
 _OPEN_TTL_MINUTES = 5
 
 # Tracks which (repo, pr_number) keys have an in-flight background refresh.
-_refresh_lock = threading.Lock()
-_refreshing: set = set()
+_refreshing = InFlightTracker()
 
 
 def _actor_from(raw: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
@@ -201,37 +198,50 @@ def normalize_timeline_events(
     return result
 
 
-def fetch_pr_timeline_from_api(owner: str, repo: str, pr_number: int) -> List[Dict[str, Any]]:
+def _pr_state_from_rest(pr: Dict[str, Any]) -> Optional[str]:
+    """OPEN / CLOSED / MERGED from a REST pulls/{n} object (None if unknown)."""
+    if pr.get("merged_at"):
+        return "MERGED"
+    return (pr.get("state") or "").upper() or None
+
+
+def fetch_pr_timeline_from_api(owner: str, repo: str, pr_number: int) -> Tuple[Optional[str], List[Dict[str, Any]]]:
     """Fetch and normalize the full issue timeline for a PR.
 
-    Also fetches PR metadata (createdAt, user) to synthesize the 'opened' event.
+    Also fetches PR metadata (createdAt, user) to synthesize the 'opened'
+    event; the same pulls/{n} response supplies the PR state, so no separate
+    state lookup is needed.
+
+    Returns:
+        tuple: (pr_state or None, events)
     """
+    timeline_path = f"repos/{owner}/{repo}/issues/{pr_number}/timeline"
     try:
-        raw_output = run_gh_command([
-            "api",
-            f"repos/{owner}/{repo}/issues/{pr_number}/timeline",
-            "--paginate",
-        ])
+        # Over the pooled session when possible; without a token, one
+        # `gh api --paginate` beats forking gh for every page
+        if has_token():
+            raw_events = gh_get_all(timeline_path)
+        else:
+            raw_events = parse_json_output(run_gh_command(["api", timeline_path, "--paginate"], raw=True)) or []
     except RuntimeError as e:
         logger.warning(f"Failed to fetch timeline for {owner}/{repo}#{pr_number}: {e}")
         raise
 
-    raw_events = parse_json_output(raw_output) or []
-
     # Fetch minimal PR metadata for the synthesized opened event.
+    pr_state = None
     try:
-        pr_output = run_gh_command([
-            "api",
-            f"repos/{owner}/{repo}/pulls/{pr_number}",
-            "--jq",
-            '{created_at: .created_at, user: {login: .user.login, avatar_url: .user.avatar_url}}',
-        ])
-        pr_info = parse_json_output(pr_output) or {}
-    except RuntimeError as e:
+        pr = gh_get(f"repos/{owner}/{repo}/pulls/{pr_number}") or {}
+        user = pr.get("user") or {}
+        pr_info = {
+            "created_at": pr.get("created_at"),
+            "user": {"login": user.get("login"), "avatar_url": user.get("avatar_url")},
+        }
+        pr_state = _pr_state_from_rest(pr)
+    except (RuntimeError, ValueError) as e:
         logger.warning(f"Failed to fetch PR info for {owner}/{repo}#{pr_number}: {e}")
         pr_info = {}
 
-    return normalize_timeline_events(raw_events, pr_info)
+    return pr_state, normalize_timeline_events(raw_events, pr_info)
 
 
 def _now_iso_z() -> str:
@@ -267,8 +277,8 @@ def _background_refresh(owner: str, repo: str, pr_number: int, cache_db) -> None
     """Worker function: refetch from the API and update the cache."""
     key = (repo, pr_number)
     try:
-        current_state = fetch_pr_state(owner, repo, pr_number) or "OPEN"
-        events = fetch_pr_timeline_from_api(owner, repo, pr_number)
+        current_state, events = fetch_pr_timeline_from_api(owner, repo, pr_number)
+        current_state = current_state or "OPEN"
         cache_db.save_cache(f"{owner}/{repo}", pr_number, current_state, events)
         logger.info(f"Background timeline refresh complete for {owner}/{repo}#{pr_number}")
     except Exception as e:
@@ -276,8 +286,7 @@ def _background_refresh(owner: str, repo: str, pr_number: int, cache_db) -> None
             f"Background timeline refresh failed for {owner}/{repo}#{pr_number}: {e}"
         )
     finally:
-        with _refresh_lock:
-            _refreshing.discard(key)
+        _refreshing.release(key)
 
 
 def get_timeline(
@@ -318,17 +327,8 @@ def get_timeline(
             }
 
         # Stale: return immediately, trigger background refresh.
-        with _refresh_lock:
-            already_refreshing = key in _refreshing
-            if not already_refreshing:
-                _refreshing.add(key)
-        if not already_refreshing:
-            t = threading.Thread(
-                target=_background_refresh,
-                args=(owner, repo, pr_number, cache_db),
-                daemon=True,
-            )
-            t.start()
+        if _refreshing.acquire(key):
+            refresh_executor.submit(_background_refresh, owner, repo, pr_number, cache_db)
 
         return {
             "events": _strip_empty_body_events(cached["data"]),
@@ -340,8 +340,8 @@ def get_timeline(
         }
 
     # Cache miss or force refresh: fetch synchronously.
-    current_state = fetch_pr_state(owner, repo, pr_number) or "OPEN"
-    events = fetch_pr_timeline_from_api(owner, repo, pr_number)
+    current_state, events = fetch_pr_timeline_from_api(owner, repo, pr_number)
+    current_state = current_state or "OPEN"
     cache_db.save_cache(repo_key, pr_number, current_state, events)
 
     return {
@@ -1,9 +1,10 @@
 """Post a formal PR review verdict (Approve, Request Changes, Comment) to GitHub."""
 
-import json
 import logging
-import subprocess
 
+import orjson
+
+from backend.services.github_http import gh_post
 from backend.services.github_service import fetch_pr_head_sha
 
 logger = logging.getLogger(__name__)
@@ -66,18 +67,7 @@ def _post_file_comment(owner, repo, pr_number, commit_sha, comment):
         "body": comment["body"],
         "subject_type": "file",
     }
-    subprocess.run(
-        [
-            "gh", "api",
-            f"repos/{owner}/{repo}/pulls/{pr_number}/comments",
-            "--method", "POST",
-            "--input", "-",
-        ],
-        input=json.dumps(comment_body),
-        capture_output=True,
-        text=True,
-        check=True,
-    )
+    gh_post(f"repos/{owner}/{repo}/pulls/{pr_number}/comments", comment_body)
 
 
 def _try_post_individual_comment(owner, repo, pr_number, current_sha, c):
@@ -97,28 +87,17 @@ def _try_post_individual_comment(owner, repo, pr_number, current_sha, c):
         comment_payload["line"] = c["end_line"]
 
     try:
-        subprocess.run(
-            [
-                "gh", "api",
-                f"repos/{owner}/{repo}/pulls/{pr_number}/comments",
-                "--method", "POST",
-                "--input", "-",
-            ],
-            input=json.dumps(comment_payload),
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        gh_post(f"repos/{owner}/{repo}/pulls/{pr_number}/comments", comment_payload)
         logger.info(f"Posted individual line comment on {c['path']}:{c.get('start_line', '?')}-{c.get('end_line', '?')}")
         return True
-    except subprocess.CalledProcessError:
+    except RuntimeError:
         # Line-level failed — fall back to file-level comment
         try:
             _post_file_comment(owner, repo, pr_number, current_sha, c)
             logger.info(f"Posted file-level fallback comment on {c['path']}")
             return True
-        except subprocess.CalledProcessError as e3:
-            logger.warning(f"Failed to post comment on {c['path']} (both line and file): {e3.stderr[:200]}")
+        except RuntimeError as e3:
+            logger.warning(f"Failed to post comment on {c['path']} (both line and file): {str(e3)[:200]}")
             return False
 
 
@@ -185,7 +164,7 @@ def post_verdict(owner, repo, pr_number, event, body, inline_comments=None, revi
             comments.append(comment)
         review_body["comments"] = comments
 
-    payload_json = json.dumps(review_body)
+    payload_json = orjson.dumps(review_body).decode()
     logger.info(f"Posting verdict on {owner}/{repo}#{pr_number}: event={event}, "
                 f"body_len={len(review_body.get('body', ''))}, "
                 f"comments={len(review_body.get('comments', []))}")
@@ -197,26 +176,15 @@ def post_verdict(owner, repo, pr_number, event, body, inline_comments=None, revi
     file_comment_success = [False] * len(validated_file_comments)
 
     try:
-        subprocess.run(
-            [
-                "gh", "api",
-                f"repos/{owner}/{repo}/pulls/{pr_number}/reviews",
-                "--method", "POST",
-                "--input", "-",
-            ],
-            input=payload_json,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
+        gh_post(f"repos/{owner}/{repo}/pulls/{pr_number}/reviews", review_body)
         # All line comments succeeded as part of the batch
         line_comment_success = [True] * len(validated_line_comments)
         logger.info(f"Posted {event} verdict on {owner}/{repo}#{pr_number} with {len(validated_line_comments)} line comments")
-    except subprocess.CalledProcessError as e:
-        stderr = e.stderr or ""
+    except RuntimeError as e:
+        error_text = str(e)
         # If 422 and we had inline comments, the line numbers likely don't match the diff.
         # Fall back: post the review body without inline comments, then try each comment individually.
-        if "422" in stderr and validated_line_comments:
+        if "422" in error_text and validated_line_comments:
             logger.warning(f"Review with inline comments got 422 on {owner}/{repo}#{pr_number}, "
                            f"falling back to body-only + individual comments")
             inline_fallback_used = True
@@ -224,22 +192,11 @@ def post_verdict(owner, repo, pr_number, event, body, inline_comments=None, revi
             # Post the review body without inline comments
             body_only = {k: v for k, v in review_body.items() if k != "comments"}
             try:
-                subprocess.run(
-                    [
-                        "gh", "api",
-                        f"repos/{owner}/{repo}/pulls/{pr_number}/reviews",
-                        "--method", "POST",
-                        "--input", "-",
-                    ],
-                    input=json.dumps(body_only),
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
+                gh_post(f"repos/{owner}/{repo}/pulls/{pr_number}/reviews", body_only)
                 logger.info(f"Posted {event} verdict (body-only) on {owner}/{repo}#{pr_number}")
-            except subprocess.CalledProcessError as e2:
-                logger.error(f"Failed to post body-only verdict on {owner}/{repo}#{pr_number}: {e2.stderr[:500]}")
-                return {"error": f"Failed to post review to GitHub: {e2.stderr[:300]}"}, 500
+            except RuntimeError as e2:
+                logger.error(f"Failed to post body-only verdict on {owner}/{repo}#{pr_number}: {str(e2)[:500]}")
+                return {"error": f"Failed to post review to GitHub: {str(e2)[:300]}"}, 500
 
             # Now try each inline comment individually
             for i, c in enumerate(validated_line_comments):
@@ -247,9 +204,9 @@ def post_verdict(owner, repo, pr_number, event, body, inline_comments=None, revi
                     owner, repo, pr_number, current_sha, c
                 )
         else:
-            logger.error(f"Failed to post verdict on {owner}/{repo}#{pr_number}: {stderr[:500]}")
+            logger.error(f"Failed to post verdict on {owner}/{repo}#{pr_number}: {error_text[:500]}")
             logger.error(f"Verdict payload that failed: {payload_json[:1000]}")
-            return {"error": f"Failed to post review to GitHub: {stderr[:300]}"}, 500
+            return {"error": f"Failed to post review to GitHub: {error_text[:300]}"}, 500
 
     # Post file-level comments individually (no line numbers)
     for i, fc in enumerate(validated_file_comments):
@@ -257,8 +214,8 @@ def post_verdict(owner, repo, pr_number, event, body, inline_comments=None, revi
             _post_file_comment(owner, repo, pr_number, current_sha, fc)
             file_comment_success[i] = True
             logger.info(f"Posted file-level comment on {fc['path']} for {owner}/{repo}#{pr_number}")
-        except subprocess.CalledProcessError as e:
-            logger.warning(f"Failed to post file comment on {fc['path']}: {e.stderr[:200]}")
+        except RuntimeError as e:
+            logger.warning(f"Failed to post file comment on {fc['path']}: {str(e)[:200]}")
 
     # Build per-section breakdown
     all_comments = validated_line_comments + validated_file_comments
@@ -0,0 +1,51 @@
+"""Tests for code activity participation processing."""
+import pytest
+
+from backend.services import activity_service
+from backend.visualizers.activity_visualizer import slice_and_summarize
+
+
+@pytest.fixture(params=["numpy", "python"])
+def community(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(activity_service, "np", None)
+    return activity_service._community_commits
+
+
+@pytest.mark.parametrize("all_p, owner_p, expected", [
+    ([5, 3, 8], [1, 0, 2], [4, 3, 6]),
+    ([5, 3, 8], [1], [4, 3, 8]),
+    ([5, 3], [1, 1, 9], [4, 2]),
+    ([], [1, 2], []),
+])
+def test_community_commits(community, all_p, owner_p, expected):
+    result = community(all_p, owner_p)
+    assert result == expected
+    assert all(type(v) is int for v in result)
+
+
+def test_fetch_code_activity_data_combines_stats_endpoints(monkeypatch):
+    payloads = {
+        "stats/code_frequency": [[1704585600, 10, -4]],
+        "stats/commit_activity": [{"week": 1704585600, "total": 3, "days": [0, 1, 2, 0, 0, 0, 0]}],
+        "stats/participation": {"all": [5, 3], "owner": [1, 1]},
+    }
+    monkeypatch.setattr(activity_service, "fetch_github_stats_api",
+                        lambda owner, repo, endpoint: payloads[endpoint])
+
+    data = activity_service.fetch_code_activity_data("o", "r")
+
+    summary = data.pop("default_summary")
+    assert data == {
+        "weekly_commits": [{"week": "2024-01-07", "total": 3, "days": [0, 1, 2, 0, 0, 0, 0]}],
+        "code_changes": [{"week": "2024-01-07", "additions": 10, "deletions": 4}],
+        "owner_commits": [1, 1],
+        "community_commits": [4, 2],
+    }
+    assert summary == slice_and_summarize(data, 52)["summary"]
+    assert summary["total_commits"] == 3
+
+
+def test_fetch_code_activity_data_empty(monkeypatch):
+    monkeypatch.setattr(activity_service, "fetch_github_stats_api", lambda owner, repo, endpoint: [])
+    assert activity_service.fetch_code_activity_data("o", "r") is None
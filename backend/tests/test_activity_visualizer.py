@@ -0,0 +1,53 @@
+"""Tests for code activity summary stats."""
+import pytest
+
+from backend.visualizers import activity_visualizer
+
+WEEKLY = [{"week": "2024-01-01", "total": 3}, {"week": "2024-01-08", "total": 7},
+          {"week": "2024-01-15", "total": 7}]
+CHANGES = [{"week": "2024-01-01", "additions": 10, "deletions": 4},
+           {"week": "2024-01-08", "additions": 5, "deletions": 1}]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def summarize(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(activity_visualizer, "np", None)
+    return activity_visualizer.compute_activity_summary
+
+
+def test_summary(summarize):
+    summary = summarize(WEEKLY, CHANGES, [1, 2], [3, 4])
+    assert summary == {
+        "total_commits": 17,
+        "avg_weekly_commits": 5.7,
+        "total_additions": 15,
+        "total_deletions": 5,
+        "peak_week": "2024-01-08",
+        "peak_commits": 7,
+        "owner_percentage": 30.0,
+    }
+
+
+def test_empty_and_zero_weeks(summarize):
+    summary = summarize([{"week": "w", "total": 0}], [], [], [])
+    assert summary["peak_week"] is None
+    assert summary["peak_commits"] == 0
+    assert summary["owner_percentage"] == 0
+    assert summarize([], [], [], [])["avg_weekly_commits"] == 0
+
+
+def test_default_timeframe_uses_precomputed_summary(monkeypatch):
+    data = activity_visualizer.add_default_summary({
+        "weekly_commits": WEEKLY, "code_changes": CHANGES,
+        "owner_commits": [1, 2], "community_commits": [3, 4],
+    })
+    expected = activity_visualizer.slice_and_summarize(data, 52)["summary"]
+
+    def fail(*args):
+        raise AssertionError("summary should not be recomputed")
+
+    monkeypatch.setattr(activity_visualizer, "compute_activity_summary", fail)
+    assert activity_visualizer.slice_and_summarize(data, 52)["summary"] == expected
+    with pytest.raises(AssertionError):
+        activity_visualizer.slice_and_summarize(data, 4)
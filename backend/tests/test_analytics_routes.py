@@ -0,0 +1,197 @@
+"""Tests for the developer stats route's response cache and refresh coalescing."""
+import threading
+
+import pytest
+from flask import Flask
+
+from backend.extensions import stats_refresh_in_progress, stats_response_cache
+from backend.routes import analytics_routes
+
+
+class _DevStatsDB:
+    def __init__(self):
+        self.saved = []
+        self.reads = 0
+        self.stale = False
+
+    def get_stats(self, repo):
+        self.reads += 1
+        return [{"login": "a", "prs_authored": 2}]
+
+    def is_stale(self, repo):
+        return self.stale
+
+    def get_last_updated(self, repo):
+        return None
+
+    def save_stats(self, repo, rows):
+        self.saved.append(repo)
+
+
+class _RefreshLockDB:
+    """Leases held by "other workers" are listed in held_elsewhere."""
+
+    def __init__(self):
+        self.held_elsewhere = set()
+        self.held = set()
+
+    def acquire(self, key):
+        if key in self.held_elsewhere or key in self.held:
+            return False
+        self.held.add(key)
+        return True
+
+    def release(self, key):
+        self.held.discard(key)
+
+    def is_held(self, key):
+        return key in self.held_elsewhere or key in self.held
+
+
+@pytest.fixture
+def lock_db(monkeypatch):
+    lock_db = _RefreshLockDB()
+    monkeypatch.setattr(analytics_routes, "get_refresh_lock_db", lambda: lock_db)
+    return lock_db
+
+
+@pytest.fixture
+def client(monkeypatch, lock_db):
+    scored = []
+
+    def fake_scores(stats, full_repo, reviews_db):
+        scored.append(full_repo)
+        for stat in stats:
+            stat["avg_pr_score"] = len(scored)
+        return stats
+
+    dev_stats_db = _DevStatsDB()
+    monkeypatch.setattr(analytics_routes, "get_dev_stats_db", lambda: dev_stats_db)
+    monkeypatch.setattr(analytics_routes, "get_reviews_db", lambda: None)
+    monkeypatch.setattr(analytics_routes, "add_avg_pr_scores", fake_scores)
+    monkeypatch.setattr(analytics_routes, "fetch_and_compute_stats",
+                        lambda owner, repo: [{"login": "a", "prs_authored": 3}])
+    stats_response_cache.clear()
+
+    app = Flask(__name__)
+    app.register_blueprint(analytics_routes.analytics_bp)
+    app.dev_stats_db = dev_stats_db
+    yield app.test_client(), scored
+    stats_response_cache.clear()
+
+
+def test_repeated_polls_reuse_stored_rows(client):
+    http, scored = client
+    first = http.get("/api/repos/o/r/stats").get_json()
+    second = http.get("/api/repos/o/r/stats").get_json()
+
+    assert first["cached"] is True
+    assert first["stats"][0]["prs_authored"] == second["stats"][0]["prs_authored"] == 2
+    assert http.application.dev_stats_db.reads == 1
+    # Review scores are aggregated per request, never served from the cache
+    assert scored == ["o/r", "o/r"]
+    assert [first["stats"][0]["avg_pr_score"], second["stats"][0]["avg_pr_score"]] == [1, 2]
+
+
+def test_cached_response_reports_current_refreshing_flag(client):
+    http, _ = client
+    assert http.get("/api/repos/o/r/stats").get_json()["refreshing"] is False
+
+    assert stats_refresh_in_progress.acquire("o/r")
+    try:
+        assert http.get("/api/repos/o/r/stats").get_json()["refreshing"] is True
+    finally:
+        stats_refresh_in_progress.release("o/r")
+    assert http.get("/api/repos/o/r/stats").get_json()["refreshing"] is False
+
+
+def test_stale_response_reports_refreshing_only_when_one_runs(client, lock_db, monkeypatch):
+    http, _ = client
+    http.application.dev_stats_db.stale = True
+    # The lease is held, but released again before it can be re-checked
+    monkeypatch.setattr(lock_db, "acquire", lambda key: False)
+
+    assert http.get("/api/repos/o/r/stats").get_json()["refreshing"] is False
+
+    lock_db.held_elsewhere.add("stats:o/r")
+    assert http.get("/api/repos/o/r/stats").get_json()["refreshing"] is True
+
+
+def test_refresh_drops_cached_response(client):
+    http, scored = client
+    http.get("/api/repos/o/r/stats")
+    forced = http.get("/api/repos/o/r/stats?refresh=true").get_json()
+    http.get("/api/repos/o/r/stats")
+
+    assert forced["cached"] is False
+    assert scored == ["o/r"] * 3
+
+
+def test_concurrent_forced_refreshes_share_one_fetch(client, lock_db, monkeypatch):
+    http, _ = client
+    calls = []
+    joined = threading.Semaphore(0)
+    claim = stats_refresh_in_progress.claim
+
+    def counting_claim(*args):
+        result = claim(*args)
+        joined.release()
+        return result
+
+    def slow_fetch(owner, repo):
+        calls.append(repo)
+        # Finish only once every request has attached to this job
+        for _ in range(3):
+            joined.acquire(timeout=5)
+        return [{"login": "a", "prs_authored": 4}]
+
+    monkeypatch.setattr(stats_refresh_in_progress, "claim", counting_claim)
+    monkeypatch.setattr(analytics_routes, "fetch_and_compute_stats", slow_fetch)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(http.get("/api/repos/o/r/stats?refresh=true").get_json()))
+        for _ in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert calls == ["r"]
+    assert [r["stats"][0]["prs_authored"] for r in results] == [4, 4, 4]
+    assert "o/r" not in stats_refresh_in_progress
+    assert not lock_db.held
+
+
+def test_forced_refresh_waits_out_another_workers_lease(client, lock_db, monkeypatch):
+    http, _ = client
+    calls = []
+    monkeypatch.setattr(analytics_routes, "_LEASE_POLL_SECONDS", 0.01)
+    monkeypatch.setattr(analytics_routes, "fetch_and_compute_stats",
+                        lambda owner, repo: calls.append(repo))
+    lock_db.held_elsewhere.add("stats:o/r")
+    threading.Timer(0.05, lock_db.held_elsewhere.clear).start()
+
+    forced = http.get("/api/repos/o/r/stats?refresh=true").get_json()
+
+    # The other worker's saved result is served instead of a second fetch
+    assert calls == []
+    assert [stat["prs_authored"] for stat in forced["stats"]] == [2]
+
+
+def test_forced_refresh_stops_waiting_on_a_long_held_lease(client, lock_db, monkeypatch):
+    http, _ = client
+    monkeypatch.setattr(analytics_routes, "_LEASE_POLL_SECONDS", 0.01)
+    monkeypatch.setattr(analytics_routes, "_LEASE_WAIT_SECONDS", 0.05)
+    lock_db.held_elsewhere.add("stats:o/r")
+
+    forced = http.get("/api/repos/o/r/stats?refresh=true").get_json()
+    assert [stat["prs_authored"] for stat in forced["stats"]] == [2]
+    assert forced["cached"] is True and forced["refreshing"] is True
+
+    # Nothing stored yet: answer instead of blocking until the lease expires
+    monkeypatch.setattr(http.application.dev_stats_db, "get_stats", lambda repo: [])
+    cold = http.get("/api/repos/o/r/stats")
+    assert cold.status_code == 503
+    assert cold.get_json()["refreshing"] is True
+    assert "o/r" not in stats_refresh_in_progress
@@ -0,0 +1,38 @@
+"""Tests for ContributorTimeSeriesCacheDB."""
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from backend.database.base import Database
+from backend.database.cache_stores import ContributorTimeSeriesCacheDB
+
+DATA = [{"login": "alice", "total": 3, "weeks": [{"week": "2024-01-07", "commits": 3}]}]
+
+
+@pytest.fixture
+def cache_db():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield ContributorTimeSeriesCacheDB(Database(db_path=Path(tmp) / "test.db"))
+
+
+def test_cached_json_round_trips(cache_db):
+    cache_db.save_cache("o/r", DATA)
+
+    raw = cache_db.get_cached_json("o/r")
+
+    assert json.loads(raw["data_json"]) == DATA == cache_db.get_cached("o/r")["data"]
+    assert raw["updated_at"] == cache_db.get_cached("o/r")["updated_at"]
+
+
+def test_cached_json_treats_corrupt_row_as_miss(cache_db):
+    assert cache_db.get_cached_json("o/r") is None
+    with cache_db.db.connection() as conn:
+        conn.execute(
+            "INSERT INTO contributor_timeseries_cache (repo, data) VALUES (?, ?)",
+            ("o/r", "{not json"),
+        )
+
+    assert cache_db.get_cached_json("o/r") is None
+    assert cache_db.get_cached("o/r") is None
@@ -0,0 +1,94 @@
+"""Tests for Database connection setup and refresh leases."""
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from backend.database import refresh_locks
+from backend.database.base import Database
+from backend.database.refresh_locks import RefreshLockDB
+
+
+def test_connections_use_wal_and_tuned_pragmas():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "test.db")
+        with db.connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+
+def test_latest_review_lookup_uses_ordered_index():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "test.db")
+        with db.connection() as conn:
+            plan = " ".join(row["detail"] for row in conn.execute("""
+                EXPLAIN QUERY PLAN SELECT * FROM reviews
+                WHERE repo = ? AND pr_number = ?
+                ORDER BY review_timestamp DESC, id DESC LIMIT 1
+            """, ("o/r", 1)))
+        assert "idx_reviews_repo_pr_ts" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_thread_conn_is_reused_per_thread():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "test.db")
+        conn = db._get_thread_conn()
+        assert db._get_thread_conn() is conn
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+        other = []
+        t = threading.Thread(target=lambda: other.append(db._get_thread_conn()))
+        t.start()
+        t.join()
+        assert other[0] is not conn
+        conn.close()
+
+
+def test_refresh_lease_is_exclusive_until_released_or_expired(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "test.db")
+        worker_a, worker_b = RefreshLockDB(db), RefreshLockDB(db)
+
+        assert worker_a.acquire("stats:o/r")
+        assert not worker_b.acquire("stats:o/r")
+        assert worker_b.is_held("stats:o/r")
+        assert worker_b.acquire("stats:o/other")
+
+        worker_a.release("stats:o/r")
+        assert worker_b.acquire("stats:o/r")
+
+        later = time.time() + RefreshLockDB.LEASE_SECONDS + 1
+        monkeypatch.setattr(refresh_locks.time, "time", lambda: later)
+        assert not worker_a.is_held("stats:o/r")
+        assert worker_a.acquire("stats:o/r")
+
+
+def test_refresh_lease_of_an_exited_holder_is_free():
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "test.db")
+        locks = RefreshLockDB(db)
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        with db.connection() as conn:
+            # A worker that died mid-refresh, and one whose pid was since reused
+            conn.executemany(
+                "INSERT INTO refresh_locks (key, started_at, holder_pid, holder_start_time) VALUES (?, ?, ?, ?)",
+                [
+                    ("stats:o/dead", time.time(), process.pid, None),
+                    ("stats:o/reused", time.time(), os.getpid(), -1),
+                ],
+            )
+
+        for key in ("stats:o/dead", "stats:o/reused"):
+            assert not locks.is_held(key)
+            assert locks.acquire(key)
+            # Now held by this live process
+            assert locks.is_held(key)
+            assert not RefreshLockDB(db).acquire(key)
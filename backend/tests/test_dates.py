@@ -0,0 +1,28 @@
+"""Tests for the shared date helpers."""
+from datetime import datetime, timezone
+
+from backend.utils import dates
+
+
+def test_durations_seconds_vectorized():
+    starts = ["2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z", None, "2024-01-01T00:05:00Z"]
+    ends = ["2024-01-01T00:01:30Z", None, "2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z"]
+    assert dates.durations_seconds(starts, ends) == [90, None, None, 0]
+
+
+def test_durations_seconds_falls_back_for_offsets_and_garbage():
+    starts = ["2024-01-01T00:00:00+00:00", "garbage", ""]
+    ends = ["2024-01-01T01:00:00+01:00", "2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z"]
+    assert dates.durations_seconds(starts, ends) == [0, None, None]
+
+
+def test_durations_seconds_without_numpy(monkeypatch):
+    monkeypatch.setattr(dates, "np", None)
+    assert dates.durations_seconds(["2024-01-01T00:00:00Z"], ["2024-01-01T00:00:10Z"]) == [10]
+    assert dates.durations_seconds([], []) == []
+
+
+def test_week_str_matches_datetime_formatting():
+    for ts in (0, 1704067200, 1704585600, 1719791999):
+        expected = datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d")
+        assert dates.week_str(ts) == expected
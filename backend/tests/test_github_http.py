@@ -0,0 +1,179 @@
+"""Tests for the pooled GitHub HTTP client: ETag revalidation, paging, POSTs and rate limiting."""
+import pytest
+
+from backend.services import github_http, github_service
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", etag=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {"ETag": etag} if etag else {}
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    sent = []
+    responses = []
+
+    def fake_request(method, path, params=None, json_body=None, headers=None):
+        sent.append(headers)
+        return responses.pop(0)
+
+    monkeypatch.setattr(github_http, "get_token", lambda: "tok")
+    monkeypatch.setattr(github_http, "api_request", fake_request)
+    monkeypatch.setattr(github_http, "_etag_store", github_http.LRUCache(maxsize=8))
+    return sent, responses
+
+
+def test_304_returns_stored_body(fake_api):
+    sent, responses = fake_api
+    responses.append(FakeResponse(200, b'{"total_count": 3}', etag='"abc"'))
+    responses.append(FakeResponse(304))
+
+    assert github_http.gh_get("repos/o/r/actions/runs", {"page": 1}) == {"total_count": 3}
+    assert github_http.gh_get("repos/o/r/actions/runs", {"page": 1}) == {"total_count": 3}
+    assert sent == [None, {"If-None-Match": '"abc"'}]
+
+
+def test_etag_is_keyed_by_params(fake_api):
+    sent, responses = fake_api
+    responses.append(FakeResponse(200, b"[1]", etag='"p1"'))
+    responses.append(FakeResponse(200, b"[2]", etag='"p2"'))
+
+    assert github_http.gh_get("repos/o/r/actions/runs", {"page": 1}) == [1]
+    assert github_http.gh_get("repos/o/r/actions/runs", {"page": 2}) == [2]
+    assert sent == [None, None]
+
+
+def test_stats_endpoint_revalidates_with_etag(fake_api, monkeypatch):
+    sent, responses = fake_api
+    monkeypatch.setattr(github_service.time, "sleep", lambda s: None)
+    responses.append(FakeResponse(202))
+    responses.append(FakeResponse(200, b'[{"total": 4}]', etag='"s1"'))
+    responses.append(FakeResponse(304))
+
+    for _ in range(2):
+        assert github_service.fetch_github_stats_api("o", "r", "stats/contributors") == [{"total": 4}]
+    assert sent == [None, None, {"If-None-Match": '"s1"'}]
+
+
+def test_project_fields_list_and_dotted_paths():
+    data = [
+        {"user": {"login": "a", "avatar_url": "u"}, "state": "APPROVED", "body": "x"},
+        {"user": None, "state": "COMMENTED"},
+    ]
+    assert github_http.project_fields(data, {"login": "user.login", "state": "state"}) == [
+        {"login": "a", "state": "APPROVED"},
+        {"login": None, "state": "COMMENTED"},
+    ]
+    assert github_http.project_fields({"id": 1, "name": "ci", "x": 2}, ["id", "name"]) == {"id": 1, "name": "ci"}
+    assert github_http.project_fields(None, ["id"]) is None
+
+
+def test_get_all_walks_pages_until_short_page(fake_api):
+    sent, responses = fake_api
+    responses.append(FakeResponse(200, b'[{"name": "a"}, {"name": "b"}]'))
+    responses.append(FakeResponse(200, b'[{"name": "c"}]'))
+
+    assert github_http.gh_get_all("repos/o/r/branches", per_page=2, project=["name"]) == [
+        {"name": "a"}, {"name": "b"}, {"name": "c"},
+    ]
+    assert len(sent) == 2
+
+
+def test_iter_all_fetches_the_next_page_only_when_needed(fake_api):
+    sent, responses = fake_api
+    responses.append(FakeResponse(200, b'[{"name": "a"}, {"name": "b"}]'))
+    responses.append(FakeResponse(200, b"[]"))
+
+    items = github_http.gh_iter_all("repos/o/r/branches", per_page=2)
+    assert [next(items)["name"], next(items)["name"]] == ["a", "b"]
+    assert len(sent) == 1
+    assert list(items) == []
+    assert len(sent) == 2
+
+
+def test_post_sends_json_over_session(fake_api):
+    sent, responses = fake_api
+    responses.append(FakeResponse(200, b'{"id": 9}'))
+
+    assert github_http.gh_post("repos/o/r/pulls/1/reviews", {"event": "COMMENT"}) == {"id": 9}
+    assert sent == [None]
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def _limited(status, remaining, reset, **headers):
+    resp = FakeResponse(status, b"{}")
+    resp.headers = {"X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset),
+                    "X-RateLimit-Limit": "5000", **headers}
+    resp.text = ""
+    return resp
+
+
+@pytest.fixture
+def rate_limited(monkeypatch):
+    now = [1000.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(github_http, "_rate_limits", {})
+    monkeypatch.setattr(github_http.time, "time", lambda: now[0])
+    monkeypatch.setattr(github_http.time, "sleep", sleep)
+    return slept
+
+
+def test_low_bucket_waits_for_reset_before_next_call(monkeypatch, rate_limited):
+    session = FakeSession([_limited(200, 10, 1030), _limited(200, 4999, 4600)])
+    monkeypatch.setattr(github_http, "get_session", lambda: session)
+
+    github_http.api_request("GET", "repos/o/r")
+    assert rate_limited == []
+    github_http.api_request("GET", "repos/o/r")
+    assert rate_limited == [30]
+    # Other buckets are tracked separately
+    assert set(github_http._rate_limits) == {"core"}
+
+
+def test_long_wait_is_skipped_until_bucket_is_empty(monkeypatch, rate_limited):
+    session = FakeSession([_limited(200, 1, 5000), _limited(200, 0, 5000)])
+    monkeypatch.setattr(github_http, "get_session", lambda: session)
+
+    github_http.api_request("GET", "repos/o/r")
+    github_http.api_request("GET", "repos/o/r")
+    with pytest.raises(github_service.TransientGitHubError):
+        github_http.api_request("GET", "repos/o/r")
+    assert session.calls == 2 and rate_limited == []
+
+
+def test_secondary_limit_is_retried_after_retry_after(monkeypatch, rate_limited):
+    session = FakeSession([
+        _limited(403, 4000, 4600, **{"Retry-After": "5"}),
+        _limited(200, 3999, 4600),
+    ])
+    monkeypatch.setattr(github_http, "get_session", lambda: session)
+
+    assert github_http.api_request("GET", "search/issues").status_code == 200
+    assert rate_limited == [5.0]
+
+
+def test_plain_403_is_not_retried(monkeypatch, rate_limited):
+    session = FakeSession([_limited(403, 4000, 4600)])
+    monkeypatch.setattr(github_http, "get_session", lambda: session)
+
+    with pytest.raises(RuntimeError) as e:
+        github_http.api_request("GET", "repos/o/r")
+    assert not isinstance(e.value, github_service.TransientGitHubError)
+    assert session.calls == 1
@@ -0,0 +1,221 @@
+"""Tests for github_service: batched PR state/SHA/queue lookups, PR and repo GraphQL lookups, stats status parsing."""
+import pytest
+
+from backend.services import github_http, github_service
+
+
+@pytest.fixture
+def fake_graphql(monkeypatch):
+    calls = []
+
+    def fake(query, variables=None):
+        calls.append((query, variables))
+        repository = {}
+        for token in query.split():
+            if token.startswith("pr") and token.endswith(":"):
+                number = int(token[2:-1])
+                if number != 404:
+                    repository[f"pr{number}"] = {"state": "open", "headRefOid": f"sha{number}"}
+        return {"repository": repository}
+
+    monkeypatch.setattr(github_http, "gh_graphql", fake)
+    return calls
+
+
+def test_batches_by_batch_size(fake_graphql):
+    numbers = list(range(1, github_service.PR_STATE_BATCH_SIZE + 3))
+    result = github_service.fetch_pr_states_and_shas("o", "r", numbers)
+    assert len(fake_graphql) == 2
+    assert fake_graphql[0][1] == {"o": "o", "r": "r"}
+    assert result[1] == ("OPEN", "sha1")
+    assert len(result) == len(numbers)
+
+
+def test_missing_pr_is_omitted(fake_graphql):
+    result = github_service.fetch_pr_states_and_shas("o", "r", [7, 404])
+    assert result == {7: ("OPEN", "sha7")}
+
+
+def test_single_pr_shims(fake_graphql):
+    assert github_service.fetch_pr_state_and_sha("o", "r", 404) == (None, None)
+    assert github_service.fetch_pr_state_and_sha("o", "r", 3) == ("OPEN", "sha3")
+    assert github_service.fetch_pr_head_sha("o", "r", 3) == "sha3"
+
+
+def test_queue_data_normalizes_rollup_and_reviews(monkeypatch):
+    node = {
+        "state": "open", "headRefOid": "abc", "reviewDecision": "APPROVED", "isDraft": False,
+        "reviews": {"nodes": [{"author": {"login": "a"}, "state": "APPROVED"}]},
+        "commits": {"nodes": [{"commit": {"statusCheckRollup": {"contexts": {"nodes": [
+            {"__typename": "CheckRun", "name": "ci", "conclusion": "SUCCESS",
+             "checkSuite": {"workflowRun": {"workflow": {"name": "Build"}}}},
+            {"__typename": "StatusContext", "context": "lint", "state": "SUCCESS", "createdAt": "t"},
+        ]}}}}]},
+    }
+    queries = []
+
+    def fake(query, variables=None):
+        queries.append(query)
+        return {"repository": {"pr5": node, "pr6": None}}
+
+    monkeypatch.setattr(github_http, "gh_graphql", fake)
+    result = github_service.fetch_prs_queue_data("o", "r", [6, 5])
+
+    assert len(queries) == 1
+    assert result == {5: {
+        "state": "OPEN", "headRefOid": "abc", "reviewDecision": "APPROVED", "isDraft": False,
+        "reviews": [{"author": {"login": "a"}, "state": "APPROVED"}],
+        "statusCheckRollup": [
+            {"__typename": "CheckRun", "name": "ci", "conclusion": "SUCCESS", "workflowName": "Build"},
+            {"__typename": "StatusContext", "context": "lint", "state": "SUCCESS", "startedAt": "t"},
+        ],
+    }}
+
+
+def test_iter_pr_authors_pages_and_skips_ghosts(monkeypatch):
+    pages = [
+        {"repository": {"pullRequests": {
+            "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            "nodes": [{"state": "merged", "author": {"login": "a", "avatarUrl": "u"}}, {"state": "OPEN", "author": None}],
+        }}},
+        {"repository": {"pullRequests": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [{"state": "CLOSED", "author": {"login": "b", "avatarUrl": None}}],
+        }}},
+    ]
+    seen = []
+
+    def fake(query, variables=None):
+        seen.append(variables.get("after"))
+        return pages.pop(0)
+
+    monkeypatch.setattr(github_http, "gh_graphql", fake)
+    assert list(github_service.iter_pr_authors("o", "r", 10)) == [("a", "u", "MERGED"), ("b", "", "CLOSED")]
+    assert seen == [None, "c1"]
+
+
+class _Completed:
+    def __init__(self, stdout, stderr=b""):
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+def test_gh_api_with_status_reads_status_line(monkeypatch):
+    out = b"HTTP/2.0 202 Accepted\r\nContent-Type: application/json\r\n\r\n{}"
+    monkeypatch.setattr(github_service.subprocess, "run", lambda *a, **k: _Completed(out))
+    assert github_service._gh_api_with_status("repos/o/r/stats/contributors") == (202, b"{}")
+
+
+def test_gh_api_with_status_ignores_status_text_in_body(monkeypatch):
+    body = b'[{"note": "\\nHTTP/2.0 202 Accepted"}]'
+    out = b"HTTP/2.0 200 OK\r\n\r\n" + body
+    monkeypatch.setattr(github_service.subprocess, "run", lambda *a, **k: _Completed(out))
+    assert github_service._gh_api_with_status("repos/o/r/stats/contributors") == (200, body)
+
+
+def test_gh_api_with_status_raises_on_error(monkeypatch):
+    out = b"HTTP/2.0 404 Not Found\r\n\r\n{}"
+    monkeypatch.setattr(github_service.subprocess, "run", lambda *a, **k: _Completed(out, b"Not Found"))
+    with pytest.raises(RuntimeError):
+        github_service._gh_api_with_status("repos/o/r/stats/contributors")
+
+
+def test_fetch_prs_with_reviews_paginates_and_flattens(monkeypatch):
+    pages = [
+        {"repository": {"pullRequests": {
+            "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            "nodes": [{"number": 2, "state": "OPEN", "author": None,
+                       "reviews": {"nodes": [
+                           {"author": {"login": "rev"}, "submittedAt": "2024-01-02T00:00:00Z", "state": "APPROVED"},
+                       ]}}],
+        }}},
+        {"repository": {"pullRequests": {
+            "pageInfo": {"hasNextPage": False},
+            "nodes": [{"number": 1, "state": "MERGED", "author": {"login": "a"}, "reviews": {"nodes": []}}],
+        }}},
+    ]
+    calls = []
+
+    def fake(query, variables=None):
+        calls.append(variables)
+        return pages[len(calls) - 1]
+
+    monkeypatch.setattr(github_http, "gh_graphql", fake)
+    prs = github_service.fetch_prs_with_reviews("o", "r", 5)
+
+    assert [c.get("after") for c in calls] == [None, "c1"]
+    assert prs[0]["author"] == {}
+    assert prs[0]["first_reviewer"] == "rev"
+    assert prs[0]["all_reviews"] == [{"login": "rev", "submitted_at": "2024-01-02T00:00:00Z", "state": "APPROVED"}]
+    assert "reviews" not in prs[0]
+    assert prs[1]["first_review_at"] is None
+
+
+def test_iter_recent_reviews_flattens_and_stops_at_limit(monkeypatch):
+    page = {"repository": {"pullRequests": {
+        "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+        "nodes": [
+            {"reviews": {"nodes": [
+                {"author": {"login": "a", "avatarUrl": "https://x/a"}, "state": "APPROVED"},
+                {"author": None, "state": "COMMENTED"},
+            ]}},
+            {"reviews": {"nodes": [{"author": {"login": "b", "avatarUrl": None}, "state": "CHANGES_REQUESTED"}]}},
+        ],
+    }}}
+    calls = []
+
+    def fake(query, variables=None):
+        calls.append(variables)
+        return page
+
+    monkeypatch.setattr(github_http, "gh_graphql", fake)
+    reviews = list(github_service.iter_recent_reviews("o", "r", 2))
+
+    assert len(calls) == 1 and calls[0]["first"] == 2
+    assert reviews == [("a", "https://x/a", "APPROVED"), ("b", "", "CHANGES_REQUESTED")]
+
+
+def test_fetch_pr_matches_search_shape(monkeypatch):
+    node = {
+        "number": 7, "state": "OPEN", "isDraft": False,
+        "labels": {"nodes": [{"name": "bug"}]},
+        "assignees": {"nodes": []},
+        "reviewRequests": {"nodes": [{"requestedReviewer": {"__typename": "User", "login": "r"}}]},
+        "reviews": {"nodes": [{"state": "APPROVED", "author": {"login": "r"}}]},
+        "commits": {"nodes": []},
+    }
+    calls = []
+
+    def fake(query, variables=None):
+        calls.append(variables)
+        return {"repository": {"pullRequest": node if variables["n"] == 7 else None}}
+
+    monkeypatch.setattr(github_http, "gh_graphql", fake)
+
+    assert github_service.fetch_pr("o", "r", "7") == github_service._normalize_search_pr(node)
+    assert github_service.fetch_pr("o", "r", 8) is None
+    assert calls[0] == {"o": "o", "r": "r", "n": 7}
+
+
+def test_list_repos_pages_owner_or_viewer(monkeypatch):
+    repo = {"name": "x", "owner": {"id": "1", "login": "o"}, "description": None,
+            "isPrivate": False, "updatedAt": "2024-01-01T00:00:00Z"}
+    calls = []
+
+    def fake(query, variables=None):
+        calls.append((query, variables))
+        root = "repositoryOwner" if "repositoryOwner" in query else "viewer"
+        has_next = variables.get("after") is None
+        return {root: {"repositories": {
+            "pageInfo": {"hasNextPage": has_next, "endCursor": "c1"},
+            "nodes": [repo] * variables["first"],
+        }}}
+
+    monkeypatch.setattr(github_http, "gh_graphql", fake)
+
+    assert github_service.list_repos("o", 150) == [repo] * 150
+    assert [v for _, v in calls] == [{"first": 100, "owner": "o"}, {"first": 50, "owner": "o", "after": "c1"}]
+
+    calls.clear()
+    assert github_service.list_repos(None, 3) == [repo] * 3
+    assert "viewer" in calls[0][0] and calls[0][1] == {"first": 3}
@@ -0,0 +1,103 @@
+"""Tests for the review history routes."""
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from backend.database.base import Database
+from backend.database.reviews import ReviewsDB
+from backend.routes import history_routes
+from backend.services.review_schema import json_to_markdown
+
+CONTENT = {
+    "schema_version": "1.0.0",
+    "metadata": {"pr_number": 3, "repository": "o/r"},
+    "summary": "Looks fine",
+    "sections": [],
+    "highlights": [],
+    "recommendations": [],
+    "score": {"overall": 8},
+}
+
+
+@pytest.fixture
+def setup(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        reviews_db = ReviewsDB(Database(db_path=Path(tmp) / "test.db"))
+        monkeypatch.setattr(history_routes, "get_reviews_db", lambda: reviews_db)
+
+        app = Flask(__name__)
+        app.register_blueprint(history_routes.history_bp)
+        yield app.test_client(), reviews_db, Path(tmp)
+
+
+def test_pr_reviews_link_content_instead_of_embedding_it(setup):
+    client, reviews_db, tmp = setup
+    md_path = tmp / "o-r-pr-3.md"
+    md_path.write_text("# Code Review: PR #3\n\nFrom disk — ünïcode.\n", encoding="utf-8")
+    on_disk = reviews_db.save_review(3, "o/r", review_file_path=str(md_path), content_json=json.dumps(CONTENT))
+    missing = reviews_db.save_review(3, "o/r", review_file_path=str(tmp / "gone.md"), content_json=json.dumps(CONTENT))
+
+    reviews = client.get("/api/review-history/pr/o/r/3").get_json()["reviews"]
+    with_content = client.get("/api/review-history/pr/o/r/3?include_content=true").get_json()["reviews"]
+
+    assert {r["id"] for r in reviews} == {on_disk, missing}
+    for review, full in zip(reviews, with_content):
+        assert "content" not in review and "content_json" not in review
+        assert review["content_url"] == f"/api/review-history/{review['id']}/content"
+        assert full == {**review, "content_json": CONTENT}
+
+    served = client.get(f"/api/review-history/{on_disk}/content")
+    assert served.mimetype == "text/markdown"
+    assert served.get_data(as_text=True) == md_path.read_text(encoding="utf-8")
+    served.close()
+
+    generated = client.get(f"/api/review-history/{missing}/content")
+    assert generated.mimetype == "text/markdown"
+    assert generated.get_data(as_text=True) == json_to_markdown(CONTENT)
+
+    assert client.get("/api/review-history/999/content").status_code == 404
+
+
+def test_pr_reviews_stream_as_ndjson(setup):
+    client, reviews_db, _ = setup
+    for day in (1, 2, 3):
+        reviews_db.save_review(
+            3, "o/r", content_json=json.dumps(CONTENT), review_timestamp=datetime(2024, 1, day),
+        )
+    reviews_db.save_review(4, "o/r", content_json=json.dumps(CONTENT))
+
+    expected = client.get("/api/review-history/pr/o/r/3?include_content=true").get_json()["reviews"]
+    streamed = client.get("/api/review-history/pr/o/r/3?stream=true&include_content=true")
+
+    assert streamed.mimetype == "application/x-ndjson"
+    lines = streamed.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == expected
+    assert len(lines) == 3
+
+
+def test_pr_reviews_stream_reports_errors(setup, monkeypatch):
+    client, reviews_db, _ = setup
+    reviews_db.save_review(3, "o/r", content_json=json.dumps(CONTENT))
+    stored = reviews_db.get_reviews_for_pr("o/r", 3, summary=True)
+
+    def failing_rows(after):
+        def rows(*args, **kwargs):
+            yield from stored[:after]
+            raise RuntimeError("disk I/O error")
+        return rows
+
+    # Before the first row: a plain 500, not an empty 200 stream
+    monkeypatch.setattr(reviews_db, "iter_reviews_for_pr", failing_rows(0))
+    assert client.get("/api/review-history/pr/o/r/3?stream=true").status_code == 500
+
+    # Mid-stream: the stream ends with an error line instead of just stopping
+    monkeypatch.setattr(reviews_db, "iter_reviews_for_pr", failing_rows(1))
+    streamed = client.get("/api/review-history/pr/o/r/3?stream=true")
+    lines = [json.loads(line) for line in streamed.get_data(as_text=True).splitlines()]
+    assert streamed.status_code == 200
+    assert lines[0]["pr_number"] == 3
+    assert lines[-1] == {"error": "Internal server error"}
@@ -0,0 +1,101 @@
+"""Tests for the lock-striped InFlightTracker."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.cache.inflight_tracker import InFlightTracker
+
+
+def test_acquire_is_set_if_absent():
+    tracker = InFlightTracker(shards=4)
+    assert tracker.acquire("o/r")
+    assert not tracker.acquire("o/r")
+    assert "o/r" in tracker
+    tracker.release("o/r")
+    assert "o/r" not in tracker
+    assert tracker.acquire("o/r")
+
+
+def test_release_unknown_key_is_noop():
+    tracker = InFlightTracker()
+    tracker.release("missing")
+    assert len(tracker) == 0
+
+
+def test_len_counts_all_shards():
+    tracker = InFlightTracker(shards=2)
+    for i in range(10):
+        tracker.acquire(f"o/r{i}")
+    assert len(tracker) == 10
+
+
+def test_shard_count_must_be_power_of_two():
+    with pytest.raises(ValueError):
+        InFlightTracker(shards=6)
+
+
+def test_submit_coalesces_onto_running_future():
+    tracker = InFlightTracker()
+    gate = threading.Event()
+    calls = []
+
+    def job(value):
+        calls.append(value)
+        gate.wait(5)
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first, started = tracker.submit("o/r", pool, job, 21)
+        assert started
+        second, started_again = tracker.submit("o/r", pool, job, 99)
+        assert not started_again
+        assert second is first is tracker.get("o/r")
+
+        gate.set()
+        assert second.result(timeout=5) == 42
+
+    assert calls == [21]
+    assert "o/r" not in tracker
+    assert tracker.get("o/r") is None
+
+
+def test_submit_defers_to_acquired_key():
+    tracker = InFlightTracker()
+    assert tracker.acquire("o/r")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future, started = tracker.submit("o/r", pool, lambda: None)
+    assert future is None and not started
+    assert "o/r" in tracker
+
+
+def test_submit_releases_key_when_executor_rejects():
+    tracker = InFlightTracker()
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        tracker.submit("o/r", pool, lambda: None)
+    assert "o/r" not in tracker
+
+
+def test_claim_single_flights_until_released():
+    tracker = InFlightTracker()
+    future, owner = tracker.claim("k")
+    assert owner and not future.done()
+
+    again, second_owner = tracker.claim("k")
+    assert again is future and not second_owner
+    assert len(tracker) == 1
+
+    future.set_result(1)
+    tracker.release("k")
+    fresh, owner = tracker.claim("k")
+    assert owner and fresh is not future
+
+
+def test_claim_leaves_acquired_key_to_its_holder():
+    tracker = InFlightTracker()
+    tracker.acquire("k")
+    future, owner = tracker.claim("k")
+    assert future is None and not owner
+    assert "k" in tracker
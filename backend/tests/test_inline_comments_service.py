@@ -0,0 +1,59 @@
+"""Tests for posting review sections as inline PR comments."""
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from backend.database.base import Database
+from backend.database.reviews import ReviewsDB
+from backend.services import inline_comments_service
+
+CONTENT = {
+    "sections": [{
+        "type": "critical",
+        "issues": [
+            {"title": "Leak", "location": {"file": "a.py", "start_line": 3, "end_line": 5}, "problem": "p"},
+            {"title": "Naming", "location": {"file": "b.py"}, "problem": "q"},
+        ],
+    }],
+}
+
+
+@pytest.fixture
+def reviews_db():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield ReviewsDB(Database(db_path=Path(tmp) / "test.db"))
+
+
+@pytest.fixture
+def posts(monkeypatch):
+    sent = []
+
+    def fake_post(path, body):
+        sent.append((path, body))
+        if path.endswith("/reviews") and body.get("comments"):
+            raise RuntimeError("GitHub API request failed: HTTP 422")
+        return {}
+
+    monkeypatch.setattr(inline_comments_service, "fetch_pr_head_sha", lambda owner, repo, number: "sha1")
+    monkeypatch.setattr(inline_comments_service, "gh_post", fake_post)
+    return sent
+
+
+def test_failed_batch_review_falls_back_to_file_comments(reviews_db, posts):
+    review_id = reviews_db.save_review(7, "o/r", content_json=json.dumps(CONTENT))
+
+    result, status = inline_comments_service.post_inline_comments(reviews_db, review_id)
+
+    assert status == 200
+    assert result["issues_posted"] == 2
+    assert [path for path, _ in posts] == [
+        "repos/o/r/pulls/7/reviews",
+        "repos/o/r/pulls/7/reviews",
+        "repos/o/r/pulls/7/comments",
+        "repos/o/r/pulls/7/comments",
+    ]
+    assert [body["path"] for _, body in posts[2:]] == ["b.py", "a.py"]
+    assert "*(Lines ~3-5)*" in posts[3][1]["body"]
+    assert reviews_db.get_review(review_id)["inline_comments_posted"]
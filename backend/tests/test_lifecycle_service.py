@@ -0,0 +1,105 @@
+"""Tests for the precomputed lifecycle/responsiveness bundles."""
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from backend.database.base import Database
+from backend.database.cache_stores import LifecycleCacheDB
+from backend.services import lifecycle_service
+from backend.services.lifecycle_service import fetch_lifecycle_bundle, save_lifecycle_cache
+from backend.visualizers.lifecycle_visualizer import compute_lifecycle_metrics, precompute_lifecycle_metrics
+from backend.visualizers.responsiveness_visualizer import (
+    compute_responsiveness_metrics,
+    precompute_responsiveness_metrics,
+)
+
+PRS = [
+    {
+        "number": 1,
+        "title": "Merged",
+        "state": "MERGED",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "mergedAt": "2024-01-02T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "author": {"login": "alice"},
+        "first_review_at": "2024-01-01T02:00:00Z",
+        "first_reviewer": "bob",
+        "all_reviews": [{"login": "bob", "submitted_at": "2024-01-01T02:00:00Z", "state": "APPROVED"}],
+    },
+    {
+        "number": 2,
+        "title": "Closed",
+        "state": "CLOSED",
+        "createdAt": "2024-01-03T00:00:00Z",
+        "mergedAt": None,
+        "updatedAt": "2024-01-04T00:00:00Z",
+        "author": {"login": "carol"},
+        "first_review_at": None,
+        "first_reviewer": None,
+        "all_reviews": [],
+    },
+]
+
+
+@pytest.fixture
+def cache_db():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield LifecycleCacheDB(Database(db_path=Path(tmp) / "test.db"))
+
+
+def test_save_stores_both_bundles(cache_db):
+    save_lifecycle_cache(cache_db, "o/r", PRS)
+    cached = cache_db.get_cached("o/r")
+
+    assert cached["data"] == PRS
+    assert cached["precomputed"]["lifecycle"] == precompute_lifecycle_metrics(PRS)
+    assert cached["precomputed"]["responsiveness"] == precompute_responsiveness_metrics(PRS)
+
+
+def test_legacy_row_is_backfilled(cache_db, monkeypatch):
+    cache_db.save_cache("o/r", PRS)
+    assert cache_db.get_cached("o/r")["precomputed"] is None
+
+    bundle = fetch_lifecycle_bundle("o", "r", cache_db)
+
+    assert bundle["lifecycle"] == compute_lifecycle_metrics(PRS)
+    assert cache_db.get_cached("o/r")["precomputed"]["lifecycle"] == precompute_lifecycle_metrics(PRS)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("bundle should be served from the cache")
+
+    monkeypatch.setattr(lifecycle_service, "_compute_lifecycle_bundle", fail)
+    assert fetch_lifecycle_bundle("o", "r", cache_db) == bundle
+
+
+def test_missing_cache_fetches_synchronously(cache_db, monkeypatch):
+    monkeypatch.setattr(lifecycle_service, "fetch_review_times_from_api", lambda owner, repo, limit=None: PRS)
+
+    bundle = fetch_lifecycle_bundle("o", "r", cache_db)
+
+    assert bundle["responsiveness"] == compute_responsiveness_metrics(PRS)
+    assert cache_db.get_cached("o/r")["precomputed"]["responsiveness"] == precompute_responsiveness_metrics(PRS)
+
+
+def test_now_relative_fields_are_derived_at_read_time(cache_db):
+    open_pr = {
+        "number": 3, "title": "Open", "state": "OPEN", "author": {"login": "dave"},
+        "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+        "first_review_at": None, "first_reviewer": None, "all_reviews": [],
+    }
+    # A bundle stored before the split, with stale fields frozen at refresh time
+    frozen = {
+        "lifecycle": {**compute_lifecycle_metrics([open_pr]), "stale_prs": [], "stale_count": 0},
+        "responsiveness": {**compute_responsiveness_metrics([open_pr]), "bottlenecks": [], "prs_awaiting_review": 0},
+    }
+    cache_db.save_cache("o/r", [open_pr], frozen)
+
+    bundle = fetch_lifecycle_bundle("o", "r", cache_db)
+
+    assert bundle["lifecycle"]["stale_count"] == 1
+    assert bundle["responsiveness"]["prs_awaiting_review"] == 1
+    stored = cache_db.get_cached("o/r")["precomputed"]
+    assert stored["lifecycle"]["open_prs"][0]["updated_at"] == "2024-01-01T00:00:00Z"
+    assert "stale_prs" not in stored["lifecycle"]
+    assert "bottlenecks" not in stored["responsiveness"]
@@ -0,0 +1,57 @@
+"""Tests for compute_lifecycle_metrics."""
+from datetime import datetime, timezone
+
+from backend.visualizers.lifecycle_visualizer import (
+    compute_lifecycle_metrics,
+    finalize_lifecycle_metrics,
+    precompute_lifecycle_metrics,
+)
+
+
+def _merged_after(hours):
+    return {
+        "number": hours,
+        "state": "MERGED",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "mergedAt": f"2024-01-{1 + hours // 24:02d}T{hours % 24:02d}:00:00Z",
+        "author": {"login": "alice"},
+    }
+
+
+def test_distribution_bucket_boundaries():
+    prs = [_merged_after(h) for h in (0, 1, 3, 4, 24, 71, 72, 168, 200)]
+
+    result = compute_lifecycle_metrics(prs)
+
+    assert result["distribution"] == {
+        "<1h": 1, "1-4h": 2, "4-24h": 1, "1-3d": 2, "3-7d": 1, ">7d": 2,
+    }
+    assert result["median_time_to_merge"] == 24
+    assert [row["time_to_merge_hours"] for row in result["pr_table"]] == [0, 1, 3, 4, 24, 71, 72, 168, 200]
+
+
+def test_stale_and_missing_timestamps():
+    prs = [
+        {"number": 1, "state": "OPEN", "createdAt": "2020-01-01T00:00:00Z",
+         "updatedAt": "2020-01-02T00:00:00Z", "author": {"login": "bob"}},
+        {"number": 2, "state": "OPEN", "createdAt": None, "author": {"login": "carol"}},
+    ]
+
+    result = compute_lifecycle_metrics(prs)
+
+    assert result["stale_count"] == 1
+    assert result["stale_prs"][0]["number"] == 1
+    assert result["median_time_to_merge"] is None
+    assert len(result["pr_table"]) == 2
+
+
+def test_stale_age_is_measured_when_finalized():
+    prs = [{"number": 1, "state": "OPEN", "createdAt": "2024-01-01T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z", "author": {"login": "bob"}}]
+    base = precompute_lifecycle_metrics(prs)
+
+    early = finalize_lifecycle_metrics(base, datetime(2024, 1, 10, tzinfo=timezone.utc))
+    later = finalize_lifecycle_metrics(base, datetime(2024, 1, 21, tzinfo=timezone.utc))
+
+    assert early["stale_count"] == 0
+    assert later["stale_prs"] == [{"number": 1, "title": None, "author": "bob", "age_days": 20.0}]
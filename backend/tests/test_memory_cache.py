@@ -0,0 +1,116 @@
+"""Tests for the @cached decorator's request coalescing and shared tier."""
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from backend.cache import memory_cache
+from backend.cache.memory_cache import cached
+from backend.database.base import Database
+from backend.database.kv_cache import KVCacheDB
+from backend.extensions import cache, inflight_requests
+
+
+@pytest.fixture(autouse=True)
+def kv_db(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        kv_db = KVCacheDB(Database(db_path=Path(tmp) / "test.db"))
+        monkeypatch.setattr(memory_cache, "get_kv_cache_db", lambda: kv_db)
+        cache.clear()
+        yield kv_db
+        cache.clear()
+
+
+def test_concurrent_misses_share_one_call():
+    calls = []
+    release = threading.Event()
+
+    @cached()
+    def slow(n):
+        calls.append(n)
+        release.wait(timeout=5)
+        return n * 2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(slow(21))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    while not inflight_requests:
+        pass
+    release.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert calls == [21]
+    assert results == [42] * 5
+    assert not inflight_requests
+
+
+def test_exception_is_not_cached():
+    calls = []
+
+    @cached()
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        flaky()
+    assert flaky() == "ok"
+    assert not inflight_requests
+
+
+def test_key_includes_query_string():
+    from flask import Flask
+
+    app = Flask(__name__)
+    calls = []
+
+    @cached()
+    def view(owner):
+        calls.append(owner)
+        return len(calls)
+
+    with app.test_request_context("/?state=open"):
+        assert view("o") == 1
+        assert view("o") == 1
+    with app.test_request_context("/?state=closed"):
+        assert view("o") == 2
+    assert view(owner="o") == 3
+
+
+def test_other_workers_reuse_the_shared_tier(kv_db):
+    calls = []
+
+    @cached()
+    def lookup(owner):
+        calls.append(owner)
+        return {"owner": owner, "labels": ["a"]}
+
+    assert lookup("o") == {"owner": "o", "labels": ["a"]}
+    # A second worker process starts with an empty in-memory cache
+    cache.clear()
+    assert lookup("o") == {"owner": "o", "labels": ["a"]}
+    assert calls == ["o"]
+
+    kv_db.clear()
+    cache.clear()
+    lookup("o")
+    assert calls == ["o", "o"]
+
+
+def test_unencodable_results_stay_in_memory(kv_db):
+    marker = object()
+
+    @cached()
+    def opaque():
+        return marker
+
+    assert opaque() is marker
+    assert opaque() is marker
+    assert kv_db.purge_expired() == 0
+    with kv_db.db.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM kv_cache").fetchone()[0] == 0
@@ -0,0 +1,25 @@
+"""Tests for MergeQueueDB bulk lookups."""
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from backend.database.base import Database
+from backend.database.merge_queue import MergeQueueDB
+
+
+@pytest.fixture
+def queue_db():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield MergeQueueDB(Database(db_path=Path(tmp) / "test.db"))
+
+
+def test_all_notes_counts(queue_db):
+    first = queue_db.add_to_queue(1, "o/r")
+    second = queue_db.add_to_queue(2, "o/r")
+    queue_db.add_to_queue(3, "o/r")
+    queue_db.add_note(first["id"], "a")
+    queue_db.add_note(first["id"], "b")
+    queue_db.add_note(second["id"], "c")
+
+    assert queue_db.get_all_notes_counts() == {first["id"]: 2, second["id"]: 1}
@@ -0,0 +1,50 @@
+"""Tests for PRFilterBuilder gh CLI args and search query construction."""
+from werkzeug.datastructures import MultiDict
+
+from backend.filters.pr_filter_builder import PRFilterParams, PRFilterBuilder
+
+
+def _builder(**args):
+    params = PRFilterParams.from_request_args(MultiDict(args))
+    return PRFilterBuilder("octo", "repo", params)
+
+
+def test_cli_args_for_basic_filters():
+    args = _builder(author="alice", labels="bug, ui", draft="true", limit="10").build()
+    assert args[:4] == ["pr", "list", "-R", "octo/repo"]
+    assert args[args.index("--state") + 1] == "open"
+    assert args[args.index("--author") + 1] == "alice"
+    assert [args[i + 1] for i, a in enumerate(args) if a == "--label"] == ["bug", "ui"]
+    assert args[args.index("--search") + 1] == "draft:true"
+    assert args[args.index("--limit") + 1] == "10"
+
+
+def test_search_query_includes_flag_filters_as_qualifiers():
+    query = _builder(state="merged", author="alice", labels="bug", base="main", reviewedBy="bob").build_search_query()
+    assert query == (
+        'repo:octo/repo is:pr is:merged author:alice label:"bug" base:main '
+        "reviewed-by:bob sort:created-desc"
+    )
+
+
+def test_search_query_respects_explicit_sort_and_all_state():
+    query = _builder(state="all", sortBy="updated", sortDirection="asc").build_search_query()
+    assert query == "repo:octo/repo is:pr sort:updated-asc"
+
+
+def test_multi_value_review_is_or_grouped():
+    query = _builder(review="approved,required").build_search_query()
+    assert "(review:approved OR review:required)" in query
+
+
+def test_search_query_is_memoized_per_filter_combination():
+    from backend.filters import pr_filter_builder
+
+    pr_filter_builder._build_search_query.cache_clear()
+    first = _builder(author="alice", review="approved").build_search_query()
+    again = _builder(author="alice", review="approved").build_search_query()
+    other = _builder(author="bob", review="approved").build_search_query()
+
+    info = pr_filter_builder._build_search_query.cache_info()
+    assert again is first and other != first
+    assert (info.hits, info.misses) == (1, 2)
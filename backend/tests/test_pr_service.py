@@ -0,0 +1,43 @@
+"""Tests for PR post-processing helpers."""
+import pytest
+
+from backend.services.pr_service import get_ci_status, get_review_status
+
+
+@pytest.mark.parametrize("contexts, expected", [
+    ([], None),
+    ([{"name": "a", "conclusion": "SUCCESS"}, {"name": "b", "conclusion": "skipped"}], "success"),
+    ([{"name": "a", "conclusion": "CANCELLED"}, {"name": "b", "conclusion": "NEUTRAL"}], "neutral"),
+    ([{"name": "a", "conclusion": "SUCCESS"}, {"name": "b", "status": "IN_PROGRESS"}], "pending"),
+    ([{"name": "a", "conclusion": "STARTUP_FAILURE"}], "pending"),
+    ([{"name": "a", "status": "QUEUED"}, {"name": "b", "conclusion": "timed_out"}], "failure"),
+    ([{"context": "ci/legacy", "state": "ERROR"}], "failure"),
+    ([{"context": "ci/legacy", "state": "EXPECTED"}], "neutral"),
+])
+def test_ci_status(contexts, expected):
+    assert get_ci_status(contexts) == expected
+    assert get_ci_status({"contexts": contexts}) == expected
+
+
+def test_ci_status_uses_latest_run_per_check():
+    contexts = [
+        {"name": "build", "conclusion": "FAILURE", "completedAt": "2024-01-01T00:00:00Z"},
+        {"name": "build", "conclusion": "SUCCESS", "completedAt": "2024-01-01T01:00:00Z"},
+    ]
+    assert get_ci_status(contexts) == "success"
+
+
+def _review(login, state):
+    return {"author": {"login": login}, "state": state}
+
+
+@pytest.mark.parametrize("reviews, decision, expected", [
+    ([_review("a", "APPROVED"), _review("b", "CHANGES_REQUESTED")], "APPROVED", "changes_requested"),
+    ([_review("a", "CHANGES_REQUESTED"), _review("a", "APPROVED")], None, "approved"),
+    ([_review("a", "COMMENTED"), _review(None, "CHANGES_REQUESTED")], "review_required", "review_required"),
+    ([], "CHANGES_REQUESTED", "changes_requested"),
+    (None, "SOMETHING_ELSE", "pending"),
+    (None, None, "pending"),
+])
+def test_review_status(reviews, decision, expected):
+    assert get_review_status(decision, reviews) == expected
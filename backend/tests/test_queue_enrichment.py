@@ -0,0 +1,45 @@
+"""Tests for merge queue enrichment."""
+from backend.services import queue_enrichment
+
+
+class _QueueDB:
+    def get_all_notes_counts(self):
+        return {2: 3}
+
+
+class _ReviewsDB:
+    def get_latest_reviews_bulk(self, prs):
+        assert ("o/a", 1) in prs
+        return {("o/a", 1): {"id": 9, "score": 8.0, "head_commit_sha": "old"}}
+
+
+def _item(item_id, repo, number):
+    return {
+        "id": item_id, "repo": repo, "pr_number": number, "pr_title": "t", "pr_url": "u",
+        "pr_author": "a", "additions": 1, "deletions": 0, "added_at": "now", "pr_state": "OPEN",
+    }
+
+
+def test_live_data_is_fetched_once_per_repo(monkeypatch):
+    calls = []
+
+    def fake_fetch(owner, repo, numbers):
+        calls.append((owner, repo, sorted(numbers)))
+        return {n: {**queue_enrichment.EMPTY_QUEUE_DATA, "state": "OPEN", "headRefOid": f"sha{n}"}
+                for n in numbers if n != 3}
+
+    monkeypatch.setattr(queue_enrichment, "fetch_prs_queue_data", fake_fetch)
+    monkeypatch.setattr(queue_enrichment, "get_queue_db", _QueueDB)
+    monkeypatch.setattr(queue_enrichment, "get_reviews_db", _ReviewsDB)
+
+    items = [_item(1, "o/a", 1), _item(2, "o/b", 2), _item(3, "o/a", 3), _item(4, "local", 4)]
+    enriched = queue_enrichment.enrich_queue_items(items)
+
+    assert sorted(calls) == [("o", "a", [1, 3]), ("o", "b", [2])]
+    assert [e["id"] for e in enriched] == [1, 2, 3, 4]
+    assert enriched[0]["currentSha"] == "sha1"
+    assert enriched[0]["hasNewCommits"] is True
+    assert enriched[0]["reviewId"] == 9
+    assert [e["notesCount"] for e in enriched] == [0, 3, 0, 0]
+    assert enriched[2]["currentSha"] is None
+    assert enriched[3]["prState"] == "OPEN"
@@ -0,0 +1,46 @@
+"""Tests for the repository dropdown lookups."""
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from backend.cache import memory_cache
+from backend.database.base import Database
+from backend.database.kv_cache import KVCacheDB
+from backend.extensions import cache
+from backend.routes import repo_routes
+
+
+@pytest.fixture
+def gh_calls(monkeypatch):
+    calls = []
+
+    def fake_get(path, params=None, project=None):
+        calls.append(path)
+        if path.endswith("/teams"):
+            raise RuntimeError("Not Found")
+        return [{"name": "bug"}, {"name": "docs"}]
+
+    monkeypatch.setattr(repo_routes, "gh_get", fake_get)
+    with tempfile.TemporaryDirectory() as tmp:
+        kv_db = KVCacheDB(Database(db_path=Path(tmp) / "test.db"))
+        monkeypatch.setattr(memory_cache, "get_kv_cache_db", lambda: kv_db)
+        cache.clear()
+        yield calls
+        cache.clear()
+
+
+def test_dropdown_lookups_are_memoized_per_repo(gh_calls):
+    assert repo_routes._list_labels("o", "r") == ["bug", "docs"]
+    assert repo_routes._list_labels("o", "r") == ["bug", "docs"]
+    repo_routes._list_labels("o", "other")
+
+    assert gh_calls == ["repos/o/r/labels", "repos/o/other/labels"]
+
+
+def test_failed_lookup_is_not_cached(gh_calls):
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            repo_routes._list_teams("o", "r")
+
+    assert gh_calls == ["repos/o/r/teams"] * 2
@@ -0,0 +1,51 @@
+"""Tests for compute_responsiveness_metrics."""
+from backend.visualizers.responsiveness_visualizer import compute_responsiveness_metrics
+
+
+def test_response_times_and_bottlenecks():
+    prs = [
+        {
+            "number": 1, "state": "MERGED", "createdAt": "2024-01-01T00:00:00Z",
+            "author": {"login": "alice"},
+            "all_reviews": [
+                {"login": "bob", "submitted_at": "2024-01-01T02:00:00Z", "state": "APPROVED"},
+                {"login": "carol", "submitted_at": "2024-01-01T06:00:00Z", "state": "COMMENTED"},
+            ],
+        },
+        {
+            "number": 2, "state": "OPEN", "createdAt": "2024-01-02T00:00:00Z",
+            "author": {"login": "alice"},
+            "all_reviews": [{"login": "bob", "submitted_at": "2024-01-02T04:00:00Z", "state": "CHANGES_REQUESTED"}],
+        },
+        {"number": 3, "state": "OPEN", "createdAt": "2024-01-03T00:00:00Z", "author": {"login": "dave"}, "all_reviews": []},
+    ]
+
+    result = compute_responsiveness_metrics(prs)
+
+    by_reviewer = {row["reviewer"]: row for row in result["leaderboard"]}
+    assert by_reviewer["bob"]["avg_response_time_hours"] == 3
+    assert by_reviewer["bob"]["changes_requested"] == 1
+    assert by_reviewer["carol"]["median_response_time_hours"] == 6
+    assert [b["number"] for b in result["bottlenecks"]] == [3]
+    assert result["bottlenecks"][0]["wait_hours"] > 0
+
+
+def test_team_average_spans_all_reviewers():
+    prs = [{
+        "number": 1, "state": "MERGED", "createdAt": "2024-01-01T00:00:00Z",
+        "author": {"login": "alice"},
+        "all_reviews": [
+            {"login": "bob", "submitted_at": "2024-01-01T01:00:00Z", "state": "APPROVED"},
+            {"login": "bob", "submitted_at": "2024-01-01T05:00:00Z", "state": "APPROVED"},
+            {"login": "carol", "submitted_at": "2024-01-01T09:00:00Z", "state": "COMMENTED"},
+            {"login": "dave", "submitted_at": "2023-12-31T00:00:00Z", "state": "COMMENTED"},
+        ],
+    }]
+
+    result = compute_responsiveness_metrics(prs)
+
+    assert result["avg_team_response_hours"] == 5
+    assert result["fastest_reviewer"] == "bob"
+    by_reviewer = {row["reviewer"]: row for row in result["leaderboard"]}
+    assert by_reviewer["dave"]["avg_response_time_hours"] is None
+    assert by_reviewer["dave"]["total_reviews"] == 1
@@ -0,0 +1,171 @@
+"""Tests for the active-review listing and new-commits checks on reviewed PRs."""
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from flask import Flask
+
+from backend.database.active_reviews import ActiveReviewsDB, process_start_time
+from backend.database.base import Database
+from backend.database.reviews import ReviewsDB
+from backend.extensions import active_reviews, head_sha_cache
+from backend.routes import review_routes
+
+
+@pytest.fixture
+def setup(monkeypatch):
+    lookups = []
+
+    def fake_lookup(owner, repo, numbers):
+        lookups.append((owner, repo, sorted(numbers)))
+        return {n: ("OPEN", f"{repo}-{n}-new") for n in numbers if n != 404}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(db_path=Path(tmp) / "test.db")
+        reviews_db = ReviewsDB(db)
+        active_reviews_db = ActiveReviewsDB(db)
+        monkeypatch.setattr(review_routes, "get_reviews_db", lambda: reviews_db)
+        monkeypatch.setattr(review_routes, "get_active_reviews_db", lambda: active_reviews_db)
+        monkeypatch.setattr(review_routes, "fetch_pr_states_and_shas", fake_lookup)
+        head_sha_cache.clear()
+
+        app = Flask(__name__)
+        app.register_blueprint(review_routes.review_bp)
+        yield app.test_client(), reviews_db, lookups
+        head_sha_cache.clear()
+
+
+def test_batch_matches_single_checks(setup):
+    client, reviews_db, lookups = setup
+    reviews_db.save_review(1, "o/r", head_commit_sha="r-1-new", review_timestamp=datetime(2024, 1, 1))
+    reviews_db.save_review(2, "o/r", head_commit_sha="r-2-old", review_timestamp=datetime(2024, 1, 1))
+    prs = [
+        {"owner": "o", "repo": "r", "number": 1},
+        {"owner": "o", "repo": "r", "number": 2},
+        {"owner": "o", "repo": "r", "number": 3},
+        {"owner": "o", "repo": "x", "number": 404},
+    ]
+
+    results = client.post("/api/reviews/check-new-commits-batch", json={"prs": prs}).get_json()["results"]
+
+    assert sorted(lookups) == [("o", "r", [1, 2, 3]), ("o", "x", [404])]
+    assert results["o/r/1"]["has_new_commits"] is False
+    assert results["o/r/2"] == {"has_new_commits": True, "last_reviewed_sha": "r-2-old", "current_sha": "r-2-new"}
+    assert results["o/r/3"]["has_new_commits"] is False
+    assert results["o/x/404"]["current_sha"] is None
+
+    lookups.clear()
+    for pr in prs:
+        single = client.get(f"/api/reviews/check-new-commits/{pr['owner']}/{pr['repo']}/{pr['number']}").get_json()
+        assert single == results[f"{pr['owner']}/{pr['repo']}/{pr['number']}"]
+    # Only the PR whose SHA could not be fetched is looked up again
+    assert lookups == [("o", "x", [404])]
+
+
+def test_batch_rejects_malformed_prs(setup):
+    client, _, _ = setup
+    resp = client.post("/api/reviews/check-new-commits-batch", json={"prs": [{"owner": "o"}]})
+    assert resp.status_code == 400
+
+
+@pytest.mark.parametrize("number", ["12; rm -rf /", None, [1], "../7"])
+def test_start_rejects_non_integer_pr_numbers(setup, number):
+    client, _, _ = setup
+    resp = client.post("/api/reviews", json={"number": number, "url": "u", "owner": "o", "repo": "r"})
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "Invalid PR number"}
+
+
+def test_finished_review_view_is_built_once(setup, monkeypatch):
+    client, _, _ = setup
+    active_reviews["o/r/7"] = {
+        "owner": "o", "repo": "r", "pr_number": 7, "status": "running", "started_at": "t0", "pr_url": "u",
+    }
+    try:
+        [running] = client.get("/api/reviews").get_json()["reviews"]
+        assert running["status"] == "running"
+        assert "_cached_view" not in active_reviews["o/r/7"]
+
+        active_reviews["o/r/7"].update(status="failed", completed_at="t1", exit_code=1, error_output="boom")
+        first = client.get("/api/reviews").get_json()["reviews"]
+
+        def fail(key, review):
+            raise AssertionError("finished reviews should reuse their cached view")
+
+        monkeypatch.setattr(review_routes, "_review_view", fail)
+        assert client.get("/api/reviews").get_json()["reviews"] == first
+        assert first[0]["pr_number"] == 7
+        assert first[0]["error_output"] == "boom"
+    finally:
+        active_reviews.pop("o/r/7", None)
+
+
+def _exited_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_reviews_from_other_workers_are_shared(setup):
+    client, reviews_db, _ = setup
+    active_reviews_db = review_routes.get_active_reviews_db()
+    dead = _exited_pid()
+    with reviews_db.db.connection() as conn:
+        conn.executemany(
+            """INSERT INTO active_reviews (key, owner, repo, pr_number, pid, worker_pid, status, started_at, pr_url)
+               VALUES (?, 'o', 'r', ?, ?, ?, 'running', 't0', 'u')""",
+            [("o/r/8", 8, dead, os.getppid()), ("o/r/9", 9, dead, dead)],
+        )
+
+    [remote] = client.get("/api/reviews").get_json()["reviews"]
+    assert remote["key"] == "o/r/8"
+    assert remote["status"] == "running"
+    assert remote["completed_at"] == ""
+    # The row left by an exited worker was dropped
+    assert active_reviews_db.get("o/r/9") is None
+
+    assert client.get("/api/reviews/o/r/8/status").get_json()["status"] == "running"
+    resp = client.post("/api/reviews", json={"number": 8, "url": "u", "owner": "o", "repo": "r"})
+    assert resp.status_code == 409
+
+    assert client.delete("/api/reviews/o/r/8").status_code == 200
+    assert active_reviews_db.get("o/r/8")["status"] == "cancelled"
+    # A later finish from the owning worker doesn't overwrite the cancellation
+    active_reviews_db.finish("o/r/8", "completed", "t1")
+    assert active_reviews_db.get("o/r/8")["status"] == "cancelled"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/stat"), reason="needs /proc")
+def test_remote_cancel_signals_only_the_recorded_process(setup):
+    client, reviews_db, _ = setup
+    active_reviews_db = review_routes.get_active_reviews_db()
+    sleepers = [subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"]) for _ in range(2)]
+    try:
+        reused, review = sleepers
+        start_time = process_start_time(review.pid)
+        with reviews_db.db.connection() as conn:
+            conn.executemany(
+                """INSERT INTO active_reviews (key, owner, repo, pr_number, pid, pid_start_time, worker_pid, status)
+                   VALUES (?, 'o', 'r', ?, ?, ?, ?, 'running')""",
+                [
+                    # The recorded process exited and its pid now belongs to another one
+                    ("o/r/5", 5, reused.pid, process_start_time(reused.pid) - 1, os.getppid()),
+                    ("o/r/6", 6, review.pid, start_time, os.getppid()),
+                ],
+            )
+
+        assert client.delete("/api/reviews/o/r/5").status_code == 200
+        assert client.delete("/api/reviews/o/r/6").status_code == 200
+
+        assert review.wait(timeout=5) == -signal.SIGTERM
+        assert reused.poll() is None
+        assert active_reviews_db.get("o/r/5")["status"] == "cancelled"
+    finally:
+        for process in sleepers:
+            process.kill()
+            process.wait()
@@ -0,0 +1,183 @@
+"""Tests for review process polling and saving."""
+import json
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from backend.database.base import Database
+from backend.database.reviews import ReviewsDB
+from backend.services import review_service
+
+
+def test_finished_review_is_saved_off_the_polling_thread(monkeypatch):
+    release = threading.Event()
+    saved = []
+
+    def slow_save(key, review, status, reviews_db):
+        saved.append(threading.current_thread())
+        release.wait(5)
+
+    monkeypatch.setattr(review_service, "save_review_to_db", slow_save)
+    lock = threading.Lock()
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import sys; print('done'); sys.stderr.write('x' * 100000)"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    reviews = {"o/r/1": {
+        "process": process, "status": "running", "pr_url": "u",
+        **review_service.start_output_readers(process),
+    }}
+    # More stderr than a pipe buffer holds: only exits because it is drained
+    process.wait(timeout=10)
+
+    review = review_service.check_review_status("o/r/1", reviews, lock, None)
+    assert review["status"] == "running"
+    assert review_service.check_review_status("o/r/1", reviews, lock, None)["exit_code"] == 0
+
+    release.set()
+    for _ in range(500):
+        if review["status"] != "running":
+            break
+        time.sleep(0.01)
+
+    assert review["status"] == "completed"
+    assert review["completed_at"]
+    assert "saving" not in review
+    assert saved and saved[0] is not threading.current_thread()
+    assert review["stdout"] == "done"
+    assert review["error_output"] == "x" * 2000
+
+
+def test_save_fetches_state_and_sha_together(monkeypatch):
+    lookups = [("OPEN", None), ("MERGED", "abc")]
+    calls = []
+
+    def fake_lookup(owner, repo, number):
+        calls.append((owner, repo, number))
+        return lookups.pop(0)
+
+    monkeypatch.setattr(review_service, "fetch_pr_state_and_sha", fake_lookup)
+    monkeypatch.setattr(review_service.time, "sleep", lambda s: None)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reviews_db = ReviewsDB(Database(db_path=Path(tmp) / "test.db"))
+        review_service.save_review_to_db("o/r/3", {"pr_url": "u"}, "failed", reviews_db)
+        [saved] = reviews_db.get_reviews_for_pr("o/r", 3)
+
+    assert calls == [("o", "r", 3)] * 2
+    assert saved["head_commit_sha"] == "abc"
+    assert saved["pr_state_at_review"] == "OPEN"
+
+
+def test_completed_review_prefers_json_with_markdown_summary(monkeypatch):
+    monkeypatch.setattr(review_service, "fetch_pr_state_and_sha", lambda owner, repo, number: ("OPEN", "abc"))
+    content = {
+        "schema_version": "1.0.0",
+        "metadata": {"pr_number": 3, "repository": "o/r"},
+        "summary": "reworked",
+        "sections": [],
+        "highlights": [],
+        "recommendations": [],
+        "score": {"overall": 7},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        md_path = Path(tmp) / "o-r-pr-3.md"
+        md_path.write_text("# Code Review: PR #3\n\n## Summary\n\nVerbatim — ünïcode.\n\n---\n", encoding="utf-8")
+        md_path.with_suffix(".json").write_text(json.dumps(content), encoding="utf-8")
+        reviews_db = ReviewsDB(Database(db_path=Path(tmp) / "test.db"))
+
+        review_service.save_review_to_db("o/r/3", {"review_file": str(md_path)}, "completed", reviews_db)
+        [saved] = reviews_db.get_reviews_for_pr("o/r", 3)
+
+    stored = json.loads(saved["content_json"])
+    assert stored["summary"] == "Verbatim — ünïcode."
+    assert stored["score"] == {"overall": 7}
+    assert saved["score"] == 7.0
+
+
+def test_claude_path_is_resolved_once_found(monkeypatch):
+    lookups = []
+
+    def fake_which(name):
+        lookups.append(name)
+        return "/opt/bin/claude" if len(lookups) > 1 else None
+
+    monkeypatch.setattr(review_service, "_claude_path", None)
+    monkeypatch.setattr(review_service.shutil, "which", fake_which)
+
+    assert review_service._claude_executable() == "claude"
+    assert review_service._claude_executable() == "/opt/bin/claude"
+    assert review_service._claude_executable() == "/opt/bin/claude"
+    assert lookups == ["claude", "claude"]
+
+
+class _BusyActiveReviewsDB:
+    def __init__(self):
+        self.finished = []
+
+    def get(self, key):
+        raise sqlite3.OperationalError("database is locked")
+
+    def finish(self, key, status, completed_at, exit_code=None, error_output=None):
+        self.finished.append((key, status))
+
+
+def test_finish_error_still_publishes_a_final_status(monkeypatch):
+    active_reviews_db = _BusyActiveReviewsDB()
+    monkeypatch.setattr(review_service, "get_active_reviews_db", lambda: active_reviews_db)
+    review = {"status": "running", "saving": True, "exit_code": 0}
+
+    review_service._finish_review("o/r/1", review, 0, threading.Lock(), None)
+
+    assert review["status"] == "failed"
+    assert review["completed_at"]
+    assert "saving" not in review
+    assert active_reviews_db.finished == [("o/r/1", "failed")]
+
+
+def test_review_cancelled_while_saving_is_neither_saved_nor_published(monkeypatch):
+    saved = []
+    active_reviews_db = _BusyActiveReviewsDB()
+    active_reviews_db.get = lambda key: None
+    monkeypatch.setattr(review_service, "get_active_reviews_db", lambda: active_reviews_db)
+    monkeypatch.setattr(review_service, "save_review_to_db", lambda *args: saved.append(args))
+    # cancel_review popped it and marked it under reviews_lock after the poll claimed it
+    review = {"status": "cancelled", "saving": True, "exit_code": 0}
+
+    review_service._finish_review("o/r/1", review, 0, threading.Lock(), None)
+
+    assert saved == []
+    assert review["status"] == "cancelled"
+    assert "saving" not in review
+    assert active_reviews_db.finished == []
+
+
+def test_owner_terminates_a_review_cancelled_by_another_worker(monkeypatch):
+    saved = []
+    active_reviews_db = _BusyActiveReviewsDB()
+    active_reviews_db.get = lambda key: {"status": "cancelled"}
+    monkeypatch.setattr(review_service, "get_active_reviews_db", lambda: active_reviews_db)
+    monkeypatch.setattr(review_service, "save_review_to_db", lambda *args: saved.append(args))
+    lock = threading.Lock()
+    process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+    reviews = {"o/r/1": {"process": process, "status": "running"}}
+
+    review = review_service.check_review_status("o/r/1", reviews, lock, None)
+    assert process.wait(timeout=5) != 0
+
+    review_service.check_review_status("o/r/1", reviews, lock, None)
+    for _ in range(500):
+        if review["status"] != "running":
+            break
+        time.sleep(0.01)
+    assert review["status"] == "cancelled"
+    assert saved == []
+    # Publishing "cancelled" is a no-op against the already-cancelled row
+    assert active_reviews_db.finished == [("o/r/1", "cancelled")]
@@ -0,0 +1,55 @@
+"""Tests for ReviewsDB bulk lookups."""
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from backend.database.base import Database
+from backend.database.reviews import ReviewsDB
+
+
+@pytest.fixture
+def reviews_db():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield ReviewsDB(Database(db_path=Path(tmp) / "test.db"))
+
+
+def test_latest_reviews_bulk_matches_single_lookup(reviews_db, monkeypatch):
+    monkeypatch.setattr(ReviewsDB, "_BULK_BATCH", 2)
+    older = datetime(2024, 1, 1)
+    newer = datetime(2024, 2, 1)
+    reviews_db.save_review(1, "o/r", score=5, review_timestamp=older)
+    reviews_db.save_review(1, "o/r", score=7, review_timestamp=newer)
+    reviews_db.save_review(1, "o/other", score=3, review_timestamp=older)
+    reviews_db.save_review(2, "o/r", score=9, review_timestamp=older)
+    reviews_db.save_review(2, "o/r", score=4, review_timestamp=older)  # same time: higher id wins
+
+    prs = [("o/r", 1), ("o/r", "2"), ("o/other", 1), ("o/r", 3), ("o/r", 1)]
+    latest = reviews_db.get_latest_reviews_bulk(prs)
+
+    assert set(latest) == {("o/r", 1), ("o/r", 2), ("o/other", 1)}
+    for key, review in latest.items():
+        assert review == reviews_db.get_latest_review_for_pr(*key)
+    assert latest[("o/r", 1)]["score"] == 7
+    assert latest[("o/r", 2)]["score"] == 4
+
+
+def test_summary_rows_skip_review_bodies(reviews_db):
+    review_id = reviews_db.save_review(
+        1, "o/r", pr_title="Fix", content_json='{"score": {"overall": 8}}', pr_state_at_review="OPEN",
+    )
+    full = reviews_db.get_review(review_id)
+    summary_keys = {
+        "id", "pr_number", "repo", "pr_title", "pr_author", "pr_url", "review_timestamp", "status",
+        "score", "is_followup", "parent_review_id", "head_commit_sha", "inline_comments_posted", "pr_state",
+    }
+
+    for rows in (reviews_db.list_reviews(summary=True), reviews_db.search_reviews("Fix", summary=True)):
+        assert rows == [{**{k: full.get(k) for k in summary_keys}, "pr_state": "OPEN"}]
+
+    [chain] = reviews_db.get_reviews_for_pr("o/r", 1, summary=True)
+    assert set(chain) == summary_keys | {"content_json"}
+    assert chain["score"] == 8.0
+    [bare] = reviews_db.get_reviews_for_pr("o/r", 1, summary=True, include_content=False)
+    assert set(bare) == summary_keys
@@ -0,0 +1,45 @@
+"""Tests for shared route helpers."""
+import json
+from datetime import datetime
+from uuid import UUID
+
+import numpy as np
+from flask import Flask, jsonify
+
+from backend.routes import OrjsonProvider
+
+
+def test_orjson_provider_matches_json_encoding():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    payload = {"runs": [{"id": 1, "name": "CI", "ok": True, "d": None}], "total": np.int64(3), 7: "x"}
+
+    with app.app_context():
+        resp = jsonify(payload)
+
+    assert json.loads(resp.get_data()) == {
+        "runs": [{"id": 1, "name": "CI", "ok": True, "d": None}], "total": 3, "7": "x",
+    }
+
+
+def test_orjson_provider_backs_jsonify():
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+
+    with app.app_context():
+        resp = jsonify({"stats": [{"login": "a", "n": np.int64(2)}], "at": datetime(2024, 1, 2, 3, 4, 5)})
+        assert resp.mimetype == "application/json"
+        assert json.loads(resp.get_data()) == {
+            "stats": [{"login": "a", "n": 2}], "at": "2024-01-02T03:04:05",
+        }
+        assert app.json.loads(b'{"a": [1]}') == {"a": [1]}
+        assert json.loads(app.json.dumps({"u": UUID(int=1)})) == {"u": str(UUID(int=1))}
+
+
+def test_orjson_provider_stays_compact_in_debug():
+    app = Flask(__name__)
+    app.debug = True
+    app.json = OrjsonProvider(app)
+
+    with app.app_context():
+        assert jsonify({"b": 1, "a": [1, 2]}).get_data() == b'{"b":1,"a":[1,2]}\n'
@@ -0,0 +1,37 @@
+"""Tests for the lock-striped ShardedTTLCache."""
+import pytest
+
+from backend.cache.sharded_cache import ShardedTTLCache
+
+
+def test_get_set_and_clear():
+    cache = ShardedTTLCache(maxsize=64, ttl=60, shards=4)
+    for i in range(20):
+        cache[f"k{i}"] = i
+    assert cache["k7"] == 7
+    assert "k19" in cache
+    assert len(cache) == 20
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(KeyError):
+        cache["k7"]
+
+
+def test_get_and_pop_defaults():
+    cache = ShardedTTLCache(maxsize=8, ttl=60, shards=2)
+    assert cache.get("missing", "d") == "d"
+    cache["a"] = 1
+    assert cache.pop("a") == 1
+    assert cache.pop("a", None) is None
+
+
+def test_total_size_is_bounded():
+    cache = ShardedTTLCache(maxsize=16, ttl=60, shards=4)
+    for i in range(200):
+        cache[i] = i
+    assert len(cache) <= 16
+
+
+def test_shard_count_must_be_power_of_two():
+    with pytest.raises(ValueError):
+        ShardedTTLCache(maxsize=16, ttl=60, shards=3)
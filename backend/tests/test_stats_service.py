@@ -0,0 +1,100 @@
+"""Tests for developer stats aggregation."""
+import tempfile
+from pathlib import Path
+
+from backend.database.base import Database
+from backend.database.dev_stats import DeveloperStatsDB
+from backend.database.reviews import ReviewsDB
+from backend.services import stats_service
+
+
+def test_review_stats_aggregate_by_reviewer(monkeypatch):
+    reviews = [
+        ("a", "https://x/a", "APPROVED"),
+        ("a", "https://x/a", "COMMENTED"),
+        ("b", "", "CHANGES_REQUESTED"),
+        ("b", "", "DISMISSED"),
+    ]
+    monkeypatch.setattr(stats_service, "iter_recent_reviews", lambda owner, repo, limit: iter(reviews))
+
+    stats = stats_service.fetch_review_stats("o", "r")
+
+    assert stats == {
+        "a": {"avatar_url": "https://x/a", "total": 2, "approved": 1, "changes_requested": 0, "commented": 1},
+        "b": {"avatar_url": "", "total": 2, "approved": 0, "changes_requested": 1, "commented": 0},
+    }
+
+
+def test_review_stats_empty_on_api_failure(monkeypatch):
+    def fail(owner, repo, limit):
+        raise RuntimeError("GraphQL query failed")
+        yield
+
+    monkeypatch.setattr(stats_service, "iter_recent_reviews", fail)
+    assert stats_service.fetch_review_stats("o", "r") == {}
+
+
+def test_fetch_and_compute_stats_merges_sources(monkeypatch):
+    monkeypatch.setattr(stats_service, "fetch_contributor_stats", lambda o, r: [
+        {"login": "a", "avatar_url": "https://x/a", "commits": 5, "lines_added": 10, "lines_deleted": 2},
+    ])
+    monkeypatch.setattr(stats_service, "fetch_pr_stats", lambda o, r: {
+        "b": {"avatar_url": "https://x/b", "authored": 2, "merged": 1, "closed": 0, "open": 1},
+    })
+    monkeypatch.setattr(stats_service, "fetch_review_stats", lambda o, r: {
+        "a": {"avatar_url": "", "total": 3, "approved": 2, "changes_requested": 1, "commented": 0},
+    })
+
+    stats = stats_service.fetch_and_compute_stats("o", "r")
+
+    assert [d["login"] for d in stats] == ["a", "b"]
+    assert stats[0]["reviews_given"] == 3 and stats[0]["commits"] == 5
+    assert stats[1]["prs_merged"] == 1 and stats[1]["avatar_url"] == "https://x/b"
+
+
+def test_avg_pr_scores_only_for_listed_authors(monkeypatch):
+    monkeypatch.setattr(stats_service, "_SCORE_QUERY_BATCH", 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        reviews_db = ReviewsDB(Database(db_path=Path(tmp) / "test.db"))
+        reviews_db.save_review(1, "o/r", pr_author="a", score=7)
+        reviews_db.save_review(2, "o/r", pr_author="a", score=8)
+        reviews_db.save_review(3, "o/r", pr_author="b", score=5)
+        reviews_db.save_review(4, "o/other", pr_author="c", score=9)
+
+        stats = stats_service.add_avg_pr_scores(
+            [{"login": "a"}, {"login": "c"}, {"login": "b"}], "o/r", reviews_db
+        )
+        reviews_db.db._get_thread_conn().close()
+
+    assert stats == [
+        {"login": "a", "avg_pr_score": 7.5, "reviewed_pr_count": 2},
+        {"login": "c", "avg_pr_score": None, "reviewed_pr_count": 0},
+        {"login": "b", "avg_pr_score": 5.0, "reviewed_pr_count": 1},
+    ]
+
+
+def test_dev_stats_cache_round_trips_api_shape():
+    stat = {
+        "login": "a", "avatar_url": "https://x/a", "commits": 3,
+        "prs_authored": 4, "prs_open": 1, "prs_merged": 2, "prs_closed": 1,
+        "lines_added": 10, "lines_deleted": 5,
+        "reviews_given": 6, "approvals": 4, "changes_requested": 1, "comments": 2,
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        dev_stats_db = DeveloperStatsDB(Database(db_path=Path(tmp) / "test.db"))
+        dev_stats_db.save_stats("o/r", [stat, {"login": "b", "prs_authored": 9}])
+        cached = dev_stats_db.get_stats("o/r")
+
+    assert [row["login"] for row in cached] == ["b", "a"]
+    expected = {k: v for k, v in stat.items() if k != "comments"}
+    assert cached[1] == {**expected, "avg_pr_score": None, "reviewed_pr_count": 0}
+
+
+def test_pr_stats_fold_streamed_authors(monkeypatch):
+    rows = [("a", "https://x/a", "MERGED"), ("a", "", "OPEN"), ("b", "", "CLOSED"), ("a", "", "DRAFT?")]
+    monkeypatch.setattr(stats_service, "iter_pr_authors", lambda owner, repo, limit: iter(rows))
+
+    assert stats_service.fetch_pr_stats("o", "r") == {
+        "a": {"avatar_url": "https://x/a", "authored": 3, "merged": 1, "closed": 0, "open": 1},
+        "b": {"avatar_url": "", "authored": 1, "merged": 0, "closed": 1, "open": 0},
+    }
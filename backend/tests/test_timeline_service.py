@@ -113,3 +113,46 @@ def test_all_events_have_required_fields(raw_events, pr_info):
         assert "id" in e and e["id"]
         assert "type" in e
         assert "created_at" in e
+
+
+@pytest.mark.parametrize("pr, expected", [
+    ({"state": "open", "merged_at": None}, "OPEN"),
+    ({"state": "closed", "merged_at": None}, "CLOSED"),
+    ({"state": "closed", "merged_at": "2026-04-11T00:00:00Z"}, "MERGED"),
+    ({}, None),
+])
+def test_pr_state_comes_from_the_pulls_response(monkeypatch, pr, expected):
+    from backend.services import timeline_service
+
+    monkeypatch.setattr(timeline_service, "has_token", lambda: False)
+    monkeypatch.setattr(timeline_service, "run_gh_command", lambda args, raw=False: b"[]")
+    monkeypatch.setattr(timeline_service, "gh_get", lambda path: pr)
+
+    state, events = timeline_service.fetch_pr_timeline_from_api("o", "r", 1)
+
+    assert state == expected
+    assert events == normalize_timeline_events([], pr_info={
+        "created_at": pr.get("created_at"), "user": {"login": None, "avatar_url": None},
+    })
+
+
+def test_timeline_pages_over_the_session_with_a_token(monkeypatch):
+    from backend.services import timeline_service
+
+    def no_gh(args, raw=False):
+        raise AssertionError("gh should not be forked when a token is available")
+
+    monkeypatch.setattr(timeline_service, "has_token", lambda: True)
+    monkeypatch.setattr(timeline_service, "run_gh_command", no_gh)
+    monkeypatch.setattr(timeline_service, "gh_get_all", lambda path: [
+        {"event": "commented", "id": 1, "created_at": "2026-04-10T00:00:00Z", "body": "hi",
+         "user": {"login": "bob"}},
+    ])
+    monkeypatch.setattr(timeline_service, "gh_get", lambda path: {
+        "state": "open", "created_at": "2026-04-09T00:00:00Z", "user": {"login": "alice"},
+    })
+
+    state, events = timeline_service.fetch_pr_timeline_from_api("o", "r", 1)
+
+    assert state == "OPEN"
+    assert [e["type"] for e in events] == ["opened", "commented"]
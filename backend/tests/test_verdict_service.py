@@ -0,0 +1,49 @@
+"""Tests for posting PR review verdicts."""
+import pytest
+
+from backend.services import verdict_service
+
+
+@pytest.fixture
+def posts(monkeypatch):
+    sent = []
+
+    def fake_post(path, body):
+        sent.append((path, body))
+        if path.endswith("/reviews") and body.get("comments"):
+            raise RuntimeError("GitHub API request failed: HTTP 422 repos/o/r/pulls/5/reviews: Unprocessable")
+        if path.endswith("/comments") and body.get("line") == 99:
+            raise RuntimeError("GitHub API request failed: HTTP 422 repos/o/r/pulls/5/comments")
+        return {}
+
+    monkeypatch.setattr(verdict_service, "fetch_pr_head_sha", lambda owner, repo, number: "sha1")
+    monkeypatch.setattr(verdict_service, "gh_post", fake_post)
+    return sent
+
+
+def test_diff_mismatch_falls_back_to_individual_comments(posts):
+    comments = [
+        {"path": "a.py", "body": "fix", "start_line": 3, "end_line": 3},
+        {"path": "b.py", "body": "off diff", "start_line": 99, "end_line": 99},
+    ]
+
+    result, status = verdict_service.post_verdict("o", "r", 5, "COMMENT", "ok", inline_comments=comments)
+
+    assert status == 200
+    assert result["fallback_used"] is True
+    assert result["inline_posted"] == 2
+    assert [path.rsplit("/", 1)[1] for path, _ in posts] == ["reviews", "reviews", "comments", "comments", "comments"]
+    assert "comments" not in posts[1][1]
+    assert posts[-1][1]["subject_type"] == "file"
+
+
+def test_other_failures_are_reported(posts, monkeypatch):
+    def failing_post(path, body):
+        raise RuntimeError("GitHub API request failed: HTTP 403 forbidden")
+
+    monkeypatch.setattr(verdict_service, "gh_post", failing_post)
+
+    result, status = verdict_service.post_verdict("o", "r", 5, "APPROVE", "lgtm")
+
+    assert status == 500
+    assert "HTTP 403" in result["error"]
@@ -0,0 +1,211 @@
+"""Tests for WorkflowCacheDB's SQL-side filtering and aggregates."""
+import json
+import random
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from backend.database.base import Database
+from backend.database import cache_stores
+from backend.database.cache_stores import WorkflowCacheDB
+from backend.visualizers.workflow_visualizer import stats_from_query
+
+
+def _reference_filter_and_stats(data, filters):
+    """Plain Python statement of the filter semantics query_runs implements in SQL."""
+    try:
+        wf_id = int(filters["workflow_id"]) if filters.get("workflow_id") else None
+    except ValueError:
+        wf_id = None
+    conclusion = filters.get("conclusion")
+    # conclusion takes precedence; status matches either status or conclusion
+    status = None if conclusion else filters.get("status")
+
+    runs = [
+        run for run in data["runs"]
+        if (wf_id is None or run.get("workflow_id") == wf_id)
+        and (not filters.get("branch") or run.get("head_branch") == filters["branch"])
+        and (not filters.get("event") or run.get("event") == filters["event"])
+        and (not conclusion or run.get("conclusion") == conclusion)
+        and (not status or status in (run.get("conclusion"), run.get("status")))
+    ]
+    completed = [run for run in runs if run.get("conclusion") in ("success", "failure")]
+    durations = [run["duration_seconds"] for run in completed if run.get("duration_seconds") is not None]
+    success_count = sum(run.get("conclusion") == "success" for run in runs)
+    by_workflow = {}
+    for run in runs:
+        counts = by_workflow.setdefault(run.get("name", "Unknown"), {"total": 0, "failures": 0})
+        counts["total"] += 1
+        counts["failures"] += run.get("conclusion") == "failure"
+    return {
+        "runs": runs,
+        "stats": {
+            "total_runs": len(runs),
+            "all_time_total": data["all_time_total"],
+            "pass_rate": round(success_count / len(completed) * 100, 1) if completed else 0,
+            "avg_duration": round(sum(durations) / len(durations)) if durations else 0,
+            "failure_count": len(completed) - success_count,
+            "success_count": success_count,
+            "runs_by_workflow": by_workflow,
+        },
+        "workflows": data["workflows"],
+    }
+
+
+@pytest.fixture
+def db():
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Database(db_path=Path(tmp) / "test.db")
+
+
+def _random_data(rng):
+    runs = []
+    for i in range(rng.randint(0, 40)):
+        run = {
+            "id": i,
+            "workflow_id": rng.choice([1, 2, 3]),
+            "head_branch": rng.choice(["main", "dev", None]),
+            "event": rng.choice(["push", "pull_request"]),
+            "status": rng.choice(["completed", "in_progress", "queued"]),
+            "conclusion": rng.choice(["success", "failure", "cancelled", None]),
+            "duration_seconds": rng.choice([None, 5, 120]),
+        }
+        if rng.random() < 0.9:
+            run["name"] = rng.choice(["CI", "Lint"])
+        runs.append(run)
+    return {"runs": runs, "workflows": [{"id": 1, "name": "CI"}], "all_time_total": 99}
+
+
+def _random_filters(rng):
+    options = {
+        "workflow_id": ["1", "2", "abc", ""],
+        "branch": ["main", "dev", ""],
+        "event": ["push", ""],
+        "conclusion": ["success", "failure", ""],
+        "status": ["completed", "in_progress", "failure", ""],
+    }
+    return {k: rng.choice(v) for k, v in options.items() if rng.random() < 0.5}
+
+
+def test_query_matches_python_filtering(db):
+    cache = WorkflowCacheDB(db)
+    rng = random.Random(7)
+    for _ in range(30):
+        data = _random_data(rng)
+        cache.save_cache("o/r", data)
+        for _ in range(10):
+            filters = _random_filters(rng)
+            expected = _reference_filter_and_stats(data, filters)
+            assert stats_from_query(cache.query_runs("o/r", filters)) == expected, filters
+
+
+def test_query_missing_repo_returns_none(db):
+    assert WorkflowCacheDB(db).query_runs("o/missing", {}) is None
+
+
+def test_legacy_blob_is_backfilled(db):
+    cache = WorkflowCacheDB(db)
+    data = {"runs": [{"id": 1, "name": "CI", "conclusion": "success", "duration_seconds": 10}],
+            "workflows": [], "all_time_total": 1}
+    with db.connection() as conn:
+        conn.execute("INSERT INTO workflow_cache (repo, data) VALUES (?, ?)", ("o/r", json.dumps(data)))
+    queried = cache.query_runs("o/r", {})
+    assert queried["runs"] == data["runs"]
+    assert queried["success_count"] == 1
+
+
+def test_corrupt_blob_is_a_miss(db):
+    with db.connection() as conn:
+        conn.execute("INSERT INTO workflow_cache (repo, data) VALUES (?, ?)", ("o/r", "{not json"))
+    assert WorkflowCacheDB(db).query_runs("o/r", {}) is None
+
+
+def test_clear_removes_rows(db):
+    cache = WorkflowCacheDB(db)
+    cache.save_cache("o/r", {"runs": [{"id": 1}], "workflows": [], "all_time_total": 1})
+    cache.clear()
+    assert cache.query_runs("o/r", {}) is None
+
+
+def test_query_is_memoized_until_save(db):
+    cache = WorkflowCacheDB(db)
+    cache.save_cache("o/r", {"runs": [{"id": 1, "conclusion": "success"}], "workflows": [], "all_time_total": 1})
+    first = cache.query_runs("o/r", {"branch": ""})
+    assert cache.query_runs("o/r", {}) is first
+
+    cache.save_cache("o/r", {"runs": [], "workflows": [], "all_time_total": 0})
+    second = cache.query_runs("o/r", {})
+    assert second is not first
+    assert second["runs"] == []
+
+
+def test_external_write_invalidates_memo(db):
+    cache = WorkflowCacheDB(db)
+    cache.save_cache("o/r", {"runs": [{"id": 1}], "workflows": [], "all_time_total": 1})
+    first = cache.query_runs("o/r", {})
+    WorkflowCacheDB(db).save_cache("o/r", {"runs": [{"id": 2}], "workflows": [], "all_time_total": 1})
+    assert cache.query_runs("o/r", {})["runs"] == [{"id": 2}]
+    assert first["runs"] == [{"id": 1}]
+
+
+def test_new_filters_reuse_decoded_runs(db, monkeypatch):
+    cache = WorkflowCacheDB(db)
+    runs = [{"id": i, "head_branch": b, "conclusion": "success"} for i, b in enumerate(["main", "dev", "main"])]
+    cache.save_cache("o/r", {"runs": runs, "workflows": [], "all_time_total": 3})
+    everything = cache.query_runs("o/r", {})
+
+    decoded = []
+    real_loads = cache_stores.orjson.loads
+    monkeypatch.setattr(cache_stores.orjson, "loads", lambda s: decoded.append(s) or real_loads(s))
+    main = cache.query_runs("o/r", {"branch": "main"})
+    monkeypatch.undo()
+
+    assert not any('"id"' in s for s in decoded)
+    assert [r["id"] for r in main["runs"]] == [0, 2]
+    assert main["runs"][0] is everything["runs"][0]
+
+
+def test_save_precomputes_unfiltered_view(db):
+    cache = WorkflowCacheDB(db)
+    cache.save_cache("o/r", {"runs": [{"id": 1, "conclusion": "success"}], "workflows": [], "all_time_total": 1})
+    with cache._memo_lock:
+        warmed = list(cache._query_memo.values())
+    assert len(warmed) == 1
+    assert cache.query_runs("o/r", {"branch": None}) is warmed[0]
+
+
+def test_repeated_backfill_is_idempotent(db):
+    data = {"runs": [{"id": 1, "name": "CI"}, {"id": 2, "name": "CI"}], "workflows": [], "all_time_total": 2}
+    with db.connection() as conn:
+        conn.execute("INSERT INTO workflow_cache (repo, data) VALUES (?, ?)", ("o/r", json.dumps(data)))
+        conn.commit()
+        # Two readers that both saw has_rows = 0 backfill one after the other
+        WorkflowCacheDB._backfill_runs(conn, "o/r")
+        WorkflowCacheDB._backfill_runs(conn, "o/r")
+    with db.connection() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM workflow_runs WHERE repo = 'o/r'").fetchone()[0]
+    assert count == 2
+
+
+def test_save_during_query_neither_mixes_nor_pins_versions(db, monkeypatch):
+    cache = WorkflowCacheDB(db)
+    old = {"runs": [{"id": i, "name": "CI"} for i in range(3)], "workflows": [], "all_time_total": 3}
+    new = {"runs": [{"id": 10, "name": "CI"}], "workflows": [], "all_time_total": 1}
+    cache.save_cache("o/r", old)
+    cache._purge_memo()
+    other = WorkflowCacheDB(db)
+    real_where = cache_stores._workflow_run_where
+
+    def where_with_concurrent_save(repo, filters):
+        monkeypatch.setattr(cache_stores, "_workflow_run_where", real_where)
+        other.save_cache("o/r", new)
+        return real_where(repo, filters)
+
+    monkeypatch.setattr(cache_stores, "_workflow_run_where", where_with_concurrent_save)
+    # The decoded runs were read before the save committed; the seq rows after
+    result = cache.query_runs("o/r", {})
+
+    assert [r["id"] for r in result["runs"]] == [0, 1, 2]
+    assert result["all_time_total"] == 3
+    assert [r["id"] for r in cache.query_runs("o/r", {})["runs"]] == [10]
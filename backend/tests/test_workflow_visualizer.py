@@ -0,0 +1,55 @@
+"""Tests for workflow run filtering and aggregate stats."""
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from backend.database.base import Database
+from backend.database.cache_stores import WorkflowCacheDB
+from backend.visualizers.workflow_visualizer import stats_from_query
+
+RUNS = [
+    {"id": 1, "workflow_id": 1, "name": "CI", "head_branch": "main", "event": "push",
+     "status": "completed", "conclusion": "success", "duration_seconds": 60},
+    {"id": 2, "workflow_id": 1, "name": "CI", "head_branch": "dev", "event": "pull_request",
+     "status": "completed", "conclusion": "failure", "duration_seconds": 120},
+    {"id": 3, "workflow_id": 2, "name": "Lint", "head_branch": "main", "event": "push",
+     "status": "in_progress", "conclusion": None, "duration_seconds": 30},
+]
+DATA = {"runs": RUNS, "workflows": [], "all_time_total": 10}
+
+
+@pytest.fixture
+def query():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = WorkflowCacheDB(Database(db_path=Path(tmp) / "test.db"))
+        cache.save_cache("o/r", DATA)
+        yield lambda filters: stats_from_query(cache.query_runs("o/r", filters))
+
+
+def test_unfiltered_stats(query):
+    result = query({})
+    stats = result["stats"]
+    assert stats["total_runs"] == 3
+    assert stats["all_time_total"] == 10
+    assert stats["pass_rate"] == 50.0
+    assert stats["avg_duration"] == 90
+    assert stats["runs_by_workflow"] == {
+        "CI": {"total": 2, "failures": 1},
+        "Lint": {"total": 1, "failures": 0},
+    }
+
+
+def test_filters_combine(query):
+    result = query({"workflow_id": "1", "branch": "main"})
+    assert result["runs"] == [RUNS[0]]
+    assert result["stats"]["success_count"] == 1
+
+
+def test_status_matches_status_or_conclusion(query):
+    assert query({"status": "in_progress"})["runs"] == [RUNS[2]]
+    assert query({"status": "failure"})["runs"] == [RUNS[1]]
+
+
+def test_invalid_workflow_id_is_ignored(query):
+    assert query({"workflow_id": "abc"})["stats"]["total_runs"] == 3
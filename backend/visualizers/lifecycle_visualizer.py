@@ -1,11 +1,17 @@
 """Merge time distribution, stale PR detection, pr_table building."""
 
+from bisect import bisect_right
 from datetime import datetime, timezone
 
+from backend.utils.dates import parse_iso8601
 from backend.utils.math import median
 
+# Upper bounds (hours) of the merge-time buckets; the last bucket is open-ended
+_DISTRIBUTION_BOUNDS = (1, 4, 24, 72, 168)
+_DISTRIBUTION_LABELS = ("<1h", "1-4h", "4-24h", "1-3d", "3-7d", ">7d")
 
-def compute_lifecycle_metrics(prs):
+
+def compute_lifecycle_metrics(prs, now=None):
     """Compute PR lifecycle metrics from enriched PR data.
 
     Args:
@@ -15,63 +21,53 @@ def compute_lifecycle_metrics(prs):
     Returns:
         dict with median/avg merge/review times, stale_prs, distribution, pr_table
     """
+    return finalize_lifecycle_metrics(precompute_lifecycle_metrics(prs), now)
+
+
+def precompute_lifecycle_metrics(prs):
+    """The time-independent part of compute_lifecycle_metrics.
+
+    Merge/review times, the distribution and pr_table only depend on PR
+    timestamps, so they can be cached. Stale detection depends on the
+    current time; the open PRs' updatedAt is kept under "open_prs" for
+    finalize_lifecycle_metrics to evaluate at read time.
+    """
     merge_times = []
     review_times = []
-    stale_prs = []
+    open_prs = []
     pr_table = []
-    distribution = {"<1h": 0, "1-4h": 0, "4-24h": 0, "1-3d": 0, "3-7d": 0, ">7d": 0}
-
-    now = datetime.now(timezone.utc)
+    counts = [0] * len(_DISTRIBUTION_LABELS)
 
     for pr in prs:
         created = pr.get("createdAt")
         merged = pr.get("mergedAt")
         first_review = pr.get("first_review_at")
-        updated = pr.get("updatedAt")
 
         ttm_hours = None
         ttfr_hours = None
 
         if created:
-            created_dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
+            created_dt = parse_iso8601(created)
 
             # Time to merge
             if merged:
-                merged_dt = datetime.fromisoformat(merged.replace("Z", "+00:00"))
-                ttm_hours = (merged_dt - created_dt).total_seconds() / 3600
+                ttm_hours = (parse_iso8601(merged) - created_dt).total_seconds() / 3600
                 merge_times.append(ttm_hours)
-
-                # Distribution
-                if ttm_hours < 1:
-                    distribution["<1h"] += 1
-                elif ttm_hours < 4:
-                    distribution["1-4h"] += 1
-                elif ttm_hours < 24:
-                    distribution["4-24h"] += 1
-                elif ttm_hours < 72:
-                    distribution["1-3d"] += 1
-                elif ttm_hours < 168:
-                    distribution["3-7d"] += 1
-                else:
-                    distribution[">7d"] += 1
+                counts[bisect_right(_DISTRIBUTION_BOUNDS, ttm_hours)] += 1
 
             # Time to first review
             if first_review:
-                review_dt = datetime.fromisoformat(first_review.replace("Z", "+00:00"))
-                ttfr_hours = (review_dt - created_dt).total_seconds() / 3600
+                ttfr_hours = (parse_iso8601(first_review) - created_dt).total_seconds() / 3600
                 review_times.append(ttfr_hours)
 
-            # Stale detection (open PRs, no activity in 14+ days)
-            if pr.get("state") == "OPEN" and updated:
-                updated_dt = datetime.fromisoformat(updated.replace("Z", "+00:00"))
-                age_days = (now - updated_dt).total_seconds() / 86400
-                if age_days > 14:
-                    stale_prs.append({
-                        "number": pr.get("number"),
-                        "title": pr.get("title"),
-                        "author": pr.get("author", {}).get("login", "unknown"),
-                        "age_days": round(age_days, 1)
-                    })
+            # Stale candidates (open PRs); their age is measured at read time
+            if pr.get("state") == "OPEN" and pr.get("updatedAt"):
+                open_prs.append({
+                    "number": pr.get("number"),
+                    "title": pr.get("title"),
+                    "author": pr.get("author", {}).get("login", "unknown"),
+                    "updated_at": pr["updatedAt"],
+                })
 
         pr_table.append({
             "number": pr.get("number"),
@@ -89,8 +85,34 @@ def compute_lifecycle_metrics(prs):
         "avg_time_to_merge": round(sum(merge_times) / len(merge_times), 2) if merge_times else None,
         "median_time_to_first_review": round(median(review_times), 2) if review_times else None,
         "avg_time_to_first_review": round(sum(review_times) / len(review_times), 2) if review_times else None,
+        "open_prs": open_prs,
+        "distribution": dict(zip(_DISTRIBUTION_LABELS, counts)),
+        "pr_table": pr_table
+    }
+
+
+def finalize_lifecycle_metrics(base, now=None):
+    """Add the now-relative stale PR fields to precompute_lifecycle_metrics output."""
+    now = now or datetime.now(timezone.utc)
+    # Stale detection (open PRs, no activity in 14+ days)
+    stale_prs = []
+    for pr in base["open_prs"]:
+        age_days = (now - parse_iso8601(pr["updated_at"])).total_seconds() / 86400
+        if age_days > 14:
+            stale_prs.append({
+                "number": pr["number"],
+                "title": pr["title"],
+                "author": pr["author"],
+                "age_days": round(age_days, 1)
+            })
+
+    return {
+        "median_time_to_merge": base["median_time_to_merge"],
+        "avg_time_to_merge": base["avg_time_to_merge"],
+        "median_time_to_first_review": base["median_time_to_first_review"],
+        "avg_time_to_first_review": base["avg_time_to_first_review"],
         "stale_prs": stale_prs,
         "stale_count": len(stale_prs),
-        "distribution": distribution,
-        "pr_table": pr_table
+        "distribution": base["distribution"],
+        "pr_table": base["pr_table"]
     }
@@ -2,10 +2,11 @@
 
 from datetime import datetime, timezone
 
+from backend.utils.dates import parse_iso8601
 from backend.utils.math import median
 
 
-def compute_responsiveness_metrics(prs):
+def compute_responsiveness_metrics(prs, now=None):
     """Compute per-reviewer responsiveness metrics and bottleneck detection.
 
     Args:
@@ -15,54 +16,69 @@ def compute_responsiveness_metrics(prs):
         dict with leaderboard, bottlenecks, avg_team_response_hours,
               fastest_reviewer, prs_awaiting_review
     """
+    return finalize_responsiveness_metrics(precompute_responsiveness_metrics(prs), now)
+
+
+def precompute_responsiveness_metrics(prs):
+    """The time-independent part of compute_responsiveness_metrics.
+
+    The leaderboard only depends on review timestamps, so it can be cached.
+    Open PRs without reviews are kept under "awaiting_review" with their
+    createdAt; finalize_responsiveness_metrics measures their wait at read
+    time.
+    """
     reviewer_data = {}
-    bottlenecks = []
-    now = datetime.now(timezone.utc)
+    awaiting_review = []
+    # Running team totals; per-reviewer lists are kept only for the exact median
+    team_sum = 0.0
+    team_n = 0
 
     for pr in prs:
         created = pr.get("createdAt")
         reviews = pr.get("all_reviews", [])
 
         if created and reviews:
-            created_dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
+            created_dt = parse_iso8601(created)
 
             for review in reviews:
                 reviewer = review.get("login", "unknown")
                 submitted = review.get("submitted_at")
                 state = review.get("state", "")
 
-                if reviewer not in reviewer_data:
-                    reviewer_data[reviewer] = {
+                entry = reviewer_data.get(reviewer)
+                if entry is None:
+                    entry = reviewer_data[reviewer] = {
                         "response_times": [],
+                        "response_sum": 0.0,
                         "total_reviews": 0,
                         "approvals": 0,
                         "changes_requested": 0,
                         "comments": 0
                     }
 
-                reviewer_data[reviewer]["total_reviews"] += 1
+                entry["total_reviews"] += 1
                 if state == "APPROVED":
-                    reviewer_data[reviewer]["approvals"] += 1
+                    entry["approvals"] += 1
                 elif state == "CHANGES_REQUESTED":
-                    reviewer_data[reviewer]["changes_requested"] += 1
+                    entry["changes_requested"] += 1
                 elif state == "COMMENTED":
-                    reviewer_data[reviewer]["comments"] += 1
+                    entry["comments"] += 1
 
                 if submitted:
-                    submitted_dt = datetime.fromisoformat(submitted.replace("Z", "+00:00"))
-                    response_hours = (submitted_dt - created_dt).total_seconds() / 3600
+                    response_hours = (parse_iso8601(submitted) - created_dt).total_seconds() / 3600
                     if response_hours >= 0:
-                        reviewer_data[reviewer]["response_times"].append(response_hours)
+                        entry["response_times"].append(response_hours)
+                        entry["response_sum"] += response_hours
+                        team_sum += response_hours
+                        team_n += 1
 
-        # Bottleneck: open PRs with no reviews
+        # Bottleneck candidates: open PRs with no reviews
         if pr.get("state") == "OPEN" and not reviews and created:
-            created_dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-            wait_hours = (now - created_dt).total_seconds() / 3600
-            bottlenecks.append({
+            awaiting_review.append({
                 "number": pr.get("number"),
                 "title": pr.get("title"),
                 "author": pr.get("author", {}).get("login", "unknown"),
-                "wait_hours": round(wait_hours, 1)
+                "created_at": created,
             })
 
     # Build leaderboard
@@ -73,7 +89,7 @@ def compute_responsiveness_metrics(prs):
         approvals = data["approvals"]
         leaderboard.append({
             "reviewer": reviewer,
-            "avg_response_time_hours": round(sum(times) / len(times), 2) if times else None,
+            "avg_response_time_hours": round(data["response_sum"] / len(times), 2) if times else None,
             "median_response_time_hours": round(median(times), 2) if times else None,
             "total_reviews": total,
             "approvals": approvals,
@@ -82,17 +98,37 @@ def compute_responsiveness_metrics(prs):
         })
 
     leaderboard.sort(key=lambda x: x.get("avg_response_time_hours") or float("inf"))
-    bottlenecks.sort(key=lambda x: x.get("wait_hours", 0), reverse=True)
 
     # Team-level summary
-    all_times = [t for d in reviewer_data.values() for t in d["response_times"]]
-    avg_team_response = round(sum(all_times) / len(all_times), 2) if all_times else None
+    avg_team_response = round(team_sum / team_n, 2) if team_n else None
     fastest = leaderboard[0]["reviewer"] if leaderboard else None
 
     return {
         "leaderboard": leaderboard,
-        "bottlenecks": bottlenecks[:10],
+        "awaiting_review": awaiting_review,
         "avg_team_response_hours": avg_team_response,
         "fastest_reviewer": fastest,
+    }
+
+
+def finalize_responsiveness_metrics(base, now=None):
+    """Add the now-relative bottleneck fields to precompute_responsiveness_metrics output."""
+    now = now or datetime.now(timezone.utc)
+    bottlenecks = [
+        {
+            "number": pr["number"],
+            "title": pr["title"],
+            "author": pr["author"],
+            "wait_hours": round((now - parse_iso8601(pr["created_at"])).total_seconds() / 3600, 1)
+        }
+        for pr in base["awaiting_review"]
+    ]
+    bottlenecks.sort(key=lambda x: x.get("wait_hours", 0), reverse=True)
+
+    return {
+        "leaderboard": base["leaderboard"],
+        "bottlenecks": bottlenecks[:10],
+        "avg_team_response_hours": base["avg_team_response_hours"],
+        "fastest_reviewer": base["fastest_reviewer"],
         "prs_awaiting_review": len(bottlenecks)
     }